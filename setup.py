@@ -24,13 +24,13 @@ setup(
         "anthropic>=0.39.0",
         "pyyaml>=6.0.1",
         "python-dotenv>=1.0.0",
-        "PyGithub>=2.1.1",
+        "PyGithub>=2.4.0",
         "gitpython>=3.1.40",
         "click>=8.1.7",
         "rich>=13.7.0",
         "python-dateutil>=2.8.2",
         "redis>=5.0.1",
-        "httpx>=0.25.2",
+        "httpx[http2]>=0.25.2",
         "structlog>=24.1.0",
         "psutil>=5.9.0",
     ],
@@ -224,7 +224,7 @@ def list_issues(ctx, state: str, labels: Optional[str]):
         orchestrator = Orchestrator(ctx.obj["config_path"])
 
         label_list = labels.split(",") if labels else None
-        issues = orchestrator.github.get_issues(labels=label_list, state=state)
+        issues = list(orchestrator.github.get_issues(labels=label_list, state=state))
 
         if not issues:
             console.print("[yellow]No issues found[/yellow]")
@@ -10,7 +10,7 @@ import time
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 from .logger import AuditLogger
 
@@ -591,3 +591,186 @@ class AnalysisCache:
             file_path: Path to file
         """
         self.cache.invalidate_by_tags([f"file:{file_path}"])
+
+
+@dataclass
+class SemanticCacheEntry:
+    """A semantic cache entry: a unit-length embedding and its cached value."""
+
+    embedding: List[float]
+    namespace: str
+    value: Any
+    expires_at: float
+    tags: List[str]
+
+
+class SemanticCache:
+    """In-memory cache matching entries by embedding similarity.
+
+    Complements the exact-key caches above: a lookup returns the value stored
+    for the most similar earlier text once cosine similarity reaches
+    ``threshold``. Embeddings come from ``embed_fn`` so any local model (e.g.
+    a sentence-transformer) can be plugged in. Entries only match within the
+    same namespace, which callers use for parameters that must agree exactly.
+    With a ``cache_file`` the entries are persisted so they survive restarts.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[str], Sequence[float]],
+        logger: AuditLogger,
+        threshold: float = 0.92,
+        max_entries: int = 1000,
+        cache_file: Optional[Path] = None,
+    ):
+        """Initialize semantic cache.
+
+        Args:
+            embed_fn: Function returning an embedding vector for a text
+            logger: Audit logger instance
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Maximum entries kept (oldest are evicted first)
+            cache_file: File to persist entries to (None = memory only)
+        """
+        self.embed_fn = embed_fn
+        self.logger = logger
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.cache_file = cache_file
+
+        self.entries: List[SemanticCacheEntry] = []
+        self.hits = 0
+        self.misses = 0
+
+        # A miss is usually followed by a set() for the same text
+        self._last_embedding: Optional[tuple] = None
+
+        if self.cache_file:
+            self._load_entries()
+
+    def get(self, text: str, namespace: str = "") -> Optional[Any]:
+        """Get the cached value for the most similar text.
+
+        Args:
+            text: Text to look up
+            namespace: Namespace the entry must belong to
+
+        Returns:
+            Cached value or None
+        """
+        embedding = self._embed(text)
+        now = time.time()
+
+        best_score = -1.0
+        best_entry: Optional[SemanticCacheEntry] = None
+        for entry in self.entries:
+            if entry.namespace != namespace or entry.expires_at < now:
+                continue
+            score = sum(a * b for a, b in zip(embedding, entry.embedding))
+            if score > best_score:
+                best_score, best_entry = score, entry
+
+        if best_entry is not None and best_score >= self.threshold:
+            self.hits += 1
+            self.logger.debug(
+                "semantic_cache_hit", namespace=namespace, similarity=best_score
+            )
+            return best_entry.value
+
+        self.misses += 1
+        return None
+
+    def set(
+        self,
+        text: str,
+        value: Any,
+        namespace: str = "",
+        ttl_seconds: int = 86400,
+        tags: Optional[List[str]] = None,
+    ):
+        """Cache a value under the embedding of a text.
+
+        Args:
+            text: Text the value answers
+            value: Value to cache
+            namespace: Namespace to store the entry in
+            ttl_seconds: Time to live
+            tags: Tags for invalidation
+        """
+        now = time.time()
+        self.entries = [e for e in self.entries if e.expires_at >= now]
+        self.entries.append(
+            SemanticCacheEntry(
+                embedding=self._embed(text),
+                namespace=namespace,
+                value=value,
+                expires_at=now + ttl_seconds,
+                tags=tags or [],
+            )
+        )
+        if len(self.entries) > self.max_entries:
+            del self.entries[: len(self.entries) - self.max_entries]
+        self._persist_entries()
+
+    def invalidate_by_tags(self, tags: List[str]):
+        """Invalidate all entries matching tags.
+
+        Args:
+            tags: Tags to match
+        """
+        self.entries = [
+            e for e in self.entries if not any(tag in e.tags for tag in tags)
+        ]
+        self._persist_entries()
+
+    def clear(self):
+        """Remove all entries."""
+        self.entries.clear()
+        self._persist_entries()
+
+    def _persist_entries(self):
+        """Write all entries to the cache file (if configured)."""
+        if not self.cache_file:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_file, "wb") as f:
+            pickle.dump(self.entries, f)
+
+    def _load_entries(self):
+        """Load unexpired entries from the cache file."""
+        if not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, "rb") as f:
+                entries = pickle.load(f)
+        except Exception as e:
+            self.logger.warning(
+                "semantic_cache_load_failed", file=str(self.cache_file), error=str(e)
+            )
+            self.cache_file.unlink()
+            return
+
+        now = time.time()
+        self.entries = [e for e in entries if e.expires_at >= now]
+        if self.entries:
+            self.logger.info("semantic_cache_loaded", entries=len(self.entries))
+
+    def _embed(self, text: str) -> List[float]:
+        """Embed a text and normalize it to unit length.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Unit-length embedding (so dot product equals cosine similarity)
+        """
+        if self._last_embedding and self._last_embedding[0] == text:
+            return self._last_embedding[1]
+
+        vector = [float(x) for x in self.embed_fn(text)]
+        norm = sum(x * x for x in vector) ** 0.5
+        if norm:
+            vector = [x / norm for x in vector]
+
+        self._last_embedding = (text, vector)
+        return vector
@@ -205,6 +205,17 @@ class AuditLogger:
             with open(self.audit_file, "a") as f:
                 f.write(json.dumps(audit_entry) + "\n")
 
+    def is_enabled_for(self, level: str) -> bool:
+        """Check whether messages at a level would be emitted.
+
+        Args:
+            level: Log level (debug, info, warning, error)
+
+        Returns:
+            True if the level is at or above the configured log level
+        """
+        return getattr(logging, level.upper()) >= self.log_level
+
     def debug(self, message: str, **kwargs):
         """Log debug message."""
         self.log("debug", message, **kwargs)
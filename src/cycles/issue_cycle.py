@@ -209,10 +209,12 @@ class IssueMonitor:
             List of GitHub Issue objects matching criteria
         """
         try:
-            issues = self.github.get_issues(
-                labels=self.config.issue_processing.auto_claim_labels,
-                exclude_labels=self.config.issue_processing.ignore_labels,
-                state="open",
+            issues = list(
+                self.github.get_issues(
+                    labels=self.config.issue_processing.auto_claim_labels,
+                    exclude_labels=self.config.issue_processing.ignore_labels,
+                    state="open",
+                )
             )
 
             self.logger.debug(
@@ -0,0 +1,1062 @@
+"""Async GitHub API integration for concurrent orchestrator calls.
+
+Talks to the GitHub REST API directly over a shared HTTP/2 connection so that
+independent requests (e.g. fetching checks for many PRs) can run concurrently
+instead of blocking on one round-trip at a time.
+"""
+
+import asyncio
+import random
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+import httpx
+
+from ..core.cache import GitHubAPICache
+from ..core.logger import AuditLogger
+from ..safety.rate_limiter import RateLimiter
+from .github_client import CheckResult, compute_overall_check_status
+
+GITHUB_API_URL = "https://api.github.com"
+RAW_MEDIA_TYPE = "application/vnd.github.raw"
+
+# Pause until the window resets once a rate-limit bucket drops below this
+RATE_LIMIT_MIN_REMAINING = 50
+
+# Retries after a 403/429 rate-limit response before giving up
+MAX_RATE_LIMIT_RETRIES = 3
+
+# Transient failures (network errors, 502/503/504) are retried with
+# exponential backoff plus jitter: ~1s, ~2s, ... capped at 10s
+MAX_TRANSIENT_RETRIES = 3
+RETRY_INITIAL_DELAY_SECONDS = 1.0
+RETRY_MAX_DELAY_SECONDS = 10.0
+RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+
+# Methods that are safe to resend after the request may have reached GitHub.
+# Other methods are only retried when the connection was never established.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
+# Pull requests requested per GraphQL query in get_pull_requests_batch
+GRAPHQL_BATCH_SIZE = 50
+
+PULL_REQUEST_FIELDS = """
+    number
+    title
+    state
+    isDraft
+    url
+    mergeable
+    headRefName
+    headRefOid
+    baseRefName
+    updatedAt
+"""
+
+# Upper bound on in-flight requests, to stay clear of GitHub's secondary
+# (abuse) rate limits when fanning out
+DEFAULT_MAX_CONCURRENCY = 10
+
+# Conditional-request cache bounds. Entries are always revalidated with
+# If-None-Match, so the TTL only limits how long an idle entry is kept.
+ETAG_CACHE_MAX_ENTRIES = 1024
+ETAG_CACHE_TTL_SECONDS = 300
+
+
+class AsyncGitHubClient:
+    """Async counterpart of GitHubClient backed by httpx.
+
+    Methods return the parsed JSON payloads of the GitHub REST API instead of
+    PyGithub objects. Use it as an async context manager so every call shares
+    one pooled HTTP/2 connection:
+
+        async with AsyncGitHubClient(token, "owner/repo", logger) as github:
+            results = await asyncio.gather(
+                *(github.get_pr_checks(n) for n in pr_numbers)
+            )
+    """
+
+    def __init__(
+        self,
+        token: str,
+        repository: str,
+        logger: AuditLogger,
+        rate_limiter: Optional[RateLimiter] = None,
+        github_cache: Optional[GitHubAPICache] = None,
+        enable_cache: bool = True,
+        base_url: str = GITHUB_API_URL,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        """Initialize async GitHub client.
+
+        Args:
+            token: GitHub personal access token
+            repository: Repository in format "owner/repo"
+            logger: Audit logger instance
+            rate_limiter: Optional rate limiter for tracking API limits
+            github_cache: Optional GitHub API cache
+            enable_cache: Whether to enable caching
+            base_url: GitHub API base URL (override for GitHub Enterprise)
+            transport: Optional httpx transport (used by tests)
+            max_concurrency: Maximum number of requests in flight at once
+        """
+        self.token = token
+        self.repository_name = repository
+        self.logger = logger
+        self.rate_limiter = rate_limiter
+        self.github_cache = github_cache
+        self.enable_cache = enable_cache
+        self.base_url = base_url
+        self.transport = transport
+        self.max_concurrency = max_concurrency
+
+        self._repo_path = f"/repos/{repository}"
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        # URL -> (stored_at, etag, response) for conditional GETs, in LRU order
+        self._etag_cache: "OrderedDict[str, Tuple[float, str, httpx.Response]]" = (
+            OrderedDict()
+        )
+
+        # Rate-limit resource (core, search, graphql) -> (limit, remaining,
+        # reset epoch) as last reported by GitHub's X-RateLimit-* headers
+        self._rate_limits: Dict[str, Tuple[int, int, float]] = {}
+
+        # Cache statistics
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.etag_hits = 0
+
+    async def __aenter__(self) -> "AsyncGitHubClient":
+        self._get_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the underlying HTTP connection pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                # Fail fast on unreachable hosts; allow slow responses
+                timeout=httpx.Timeout(30.0, connect=5.0, write=10.0),
+                headers={
+                    "Authorization": f"Bearer {self.token}",
+                    "Accept": "application/vnd.github+json",
+                    "X-GitHub-Api-Version": "2022-11-28",
+                },
+                transport=self.transport,
+            )
+            # Created here rather than in __init__ so it binds to the running loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._client
+
+    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Send a request to the GitHub API.
+
+        GET responses carrying an ``ETag`` are remembered and revalidated with
+        ``If-None-Match`` on the next call; a ``304 Not Modified`` reply (which
+        does not count against the core rate limit) returns the stored response.
+
+        Args:
+            method: HTTP method
+            path: API path relative to the base URL
+            **kwargs: Extra arguments passed to httpx
+
+        Returns:
+            HTTP response
+
+        Raises:
+            httpx.HTTPStatusError: If GitHub returns an error status
+        """
+        client = self._get_client()
+        request = client.build_request(method, path, **kwargs)
+
+        cache_key: Optional[str] = None
+        cached: Optional[Tuple[float, str, httpx.Response]] = None
+        if method == "GET" and self.enable_cache:
+            cache_key = f"{request.headers.get('Accept')} {request.url}"
+            cached = self._etag_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] > ETAG_CACHE_TTL_SECONDS:
+                del self._etag_cache[cache_key]
+                cached = None
+            if cached:
+                request.headers["If-None-Match"] = cached[1]
+
+        response = await self._send(request)
+
+        if cache_key is not None:
+            if response.status_code == 304 and cached:
+                self.etag_hits += 1
+                self._etag_cache.move_to_end(cache_key)
+                return cached[2]
+
+            etag = response.headers.get("ETag")
+            if response.is_success and etag:
+                self._etag_cache[cache_key] = (time.monotonic(), etag, response)
+                self._etag_cache.move_to_end(cache_key)
+                if len(self._etag_cache) > ETAG_CACHE_MAX_ENTRIES:
+                    self._etag_cache.popitem(last=False)
+
+        response.raise_for_status()
+        return response
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        """Send a built request, applying throttling and retries.
+
+        Requests are throttled from GitHub's ``X-RateLimit-*`` headers: when a
+        bucket runs low the call waits for its reset, and rate-limited 403/429
+        replies are retried after ``Retry-After`` (or the reset time). Network
+        errors and 502/503/504 replies are retried with exponential backoff.
+
+        Args:
+            request: Request built by the shared client
+
+        Returns:
+            HTTP response (possibly an error status)
+
+        Raises:
+            httpx.TransportError: If the request still fails after retrying
+        """
+        client = self._get_client()
+        path = request.url.path
+        resource = self._rate_limit_resource(path)
+        idempotent = request.method in IDEMPOTENT_METHODS
+        rate_limit_retries = 0
+        transient_retries = 0
+
+        while True:
+            await self._wait_for_rate_limit(resource)
+
+            try:
+                assert self._semaphore is not None
+                async with self._semaphore:
+                    response = await client.send(request)
+            except httpx.TransportError as e:
+                never_sent = isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                if transient_retries >= MAX_TRANSIENT_RETRIES or not (
+                    idempotent or never_sent
+                ):
+                    raise
+                transient_retries += 1
+                await self._backoff(transient_retries, path, error=str(e))
+                continue
+
+            self._record_rate_limit(response)
+
+            if (
+                response.status_code in RETRYABLE_STATUS_CODES
+                and idempotent
+                and transient_retries < MAX_TRANSIENT_RETRIES
+            ):
+                transient_retries += 1
+                await self._backoff(
+                    transient_retries, path, status_code=response.status_code
+                )
+                continue
+
+            delay = self._rate_limit_retry_delay(response)
+            if delay is None or rate_limit_retries >= MAX_RATE_LIMIT_RETRIES:
+                return response
+
+            rate_limit_retries += 1
+            self.logger.warning(
+                "github_rate_limited",
+                path=path,
+                status_code=response.status_code,
+                retry_in_seconds=delay,
+            )
+            await asyncio.sleep(delay)
+
+    async def _backoff(self, attempt: int, path: str, **log_fields: Any):
+        """Sleep before retrying a transient failure.
+
+        Args:
+            attempt: Retry number, starting at 1
+            path: Request path (for logging)
+            **log_fields: Extra fields describing the failure
+        """
+        delay = min(
+            RETRY_INITIAL_DELAY_SECONDS * 2 ** (attempt - 1), RETRY_MAX_DELAY_SECONDS
+        ) + random.uniform(0, 1)
+        self.logger.warning(
+            "github_request_retry",
+            path=path,
+            attempt=attempt,
+            retry_in_seconds=delay,
+            **log_fields,
+        )
+        await asyncio.sleep(delay)
+
+    @staticmethod
+    def _rate_limit_resource(path: str) -> str:
+        """Get the rate-limit bucket a request path counts against."""
+        if path.startswith("/search/"):
+            return "search"
+        if path.startswith("/graphql"):
+            return "graphql"
+        return "core"
+
+    async def _wait_for_rate_limit(self, resource: str):
+        """Sleep until the bucket resets if it is nearly exhausted.
+
+        Args:
+            resource: Rate-limit resource name
+        """
+        if resource not in self._rate_limits:
+            return
+
+        limit, remaining, reset = self._rate_limits[resource]
+        delay = reset - time.time()
+        if remaining >= RATE_LIMIT_MIN_REMAINING or delay <= 0:
+            return
+
+        self.logger.warning(
+            "github_rate_limit_throttle_wait",
+            resource=resource,
+            remaining=remaining,
+            delay_seconds=delay,
+        )
+
+        if self.rate_limiter and resource == "core":
+            # Let the shared limiter (and its persisted state) see the low budget
+            self.rate_limiter.update_rate_limit(
+                api="github",
+                limit=limit,
+                remaining=remaining,
+                reset_time=datetime.fromtimestamp(reset, tz=timezone.utc),
+            )
+
+        await asyncio.sleep(delay)
+
+    def _record_rate_limit(self, response: httpx.Response):
+        """Remember the rate-limit budget reported by a response.
+
+        Args:
+            response: GitHub API response
+        """
+        headers = response.headers
+        if "X-RateLimit-Remaining" not in headers:
+            return
+
+        resource = headers.get("X-RateLimit-Resource", "core")
+        self._rate_limits[resource] = (
+            int(headers.get("X-RateLimit-Limit", 0)),
+            int(headers["X-RateLimit-Remaining"]),
+            float(headers.get("X-RateLimit-Reset", 0)),
+        )
+
+    @staticmethod
+    def _rate_limit_retry_delay(response: httpx.Response) -> Optional[float]:
+        """Get how long to wait before retrying a rate-limited response.
+
+        Args:
+            response: GitHub API response
+
+        Returns:
+            Seconds to wait, or None if the response was not rate limited
+        """
+        if response.status_code not in (403, 429):
+            return None
+
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            return float(retry_after)
+
+        # Primary rate limit: 403 with an exhausted budget
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            reset = float(response.headers.get("X-RateLimit-Reset", 0))
+            return max(reset - time.time(), 0.0)
+
+        return None
+
+    async def _get_paginated(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        item_key: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Fetch every page of a list endpoint.
+
+        The first page is fetched on its own; if its ``Link`` header advertises
+        a ``last`` page, the remaining pages are requested concurrently.
+
+        Args:
+            path: API path relative to the base URL
+            params: Query parameters for the first page
+            item_key: Key holding the items when the payload is an object
+
+        Returns:
+            Items from all pages, in page order
+        """
+        page_params: Dict[str, Any] = {"per_page": 100, **(params or {})}
+
+        response = await self._request("GET", path, params=page_params)
+        pages = [response]
+
+        last_url = response.links.get("last", {}).get("url")
+        if last_url:
+            last_page = int(httpx.URL(last_url).params.get("page", 1))
+            pages.extend(
+                await asyncio.gather(
+                    *(
+                        self._request("GET", path, params={**page_params, "page": page})
+                        for page in range(2, last_page + 1)
+                    )
+                )
+            )
+
+        items: List[Dict[str, Any]] = []
+        for page_response in pages:
+            payload = page_response.json()
+            items.extend(payload[item_key] if item_key else payload)
+
+        return items
+
+    async def get_issues(
+        self,
+        labels: Optional[List[str]] = None,
+        state: str = "open",
+        exclude_labels: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get issues from repository.
+
+        Uses the search API so that pull requests and excluded labels are
+        filtered server-side. Search results are capped at 1000 items and may
+        lag a few seconds behind writes.
+
+        Args:
+            labels: Filter by labels (issues must have ALL labels)
+            state: Issue state (open, closed, all)
+            exclude_labels: Exclude issues with these labels
+
+        Returns:
+            List of matching issues
+        """
+        qualifiers = [f"repo:{self.repository_name}", "is:issue"]
+        if state != "all":
+            qualifiers.append(f"is:{state}")
+        qualifiers.extend(f'label:"{label}"' for label in labels or ())
+        qualifiers.extend(f'-label:"{label}"' for label in exclude_labels or ())
+
+        try:
+            return await self._get_paginated(
+                "/search/issues",
+                params={"q": " ".join(qualifiers)},
+                item_key="items",
+            )
+
+        except httpx.HTTPError as e:
+            self.logger.error(
+                "Failed to fetch issues",
+                error=str(e),
+                repository=self.repository_name,
+            )
+            raise
+
+    async def get_issue(self, issue_number: int) -> Dict[str, Any]:
+        """Get a specific issue by number.
+
+        Args:
+            issue_number: Issue number
+
+        Returns:
+            Issue payload
+        """
+        try:
+            response = await self._request(
+                "GET", f"{self._repo_path}/issues/{issue_number}"
+            )
+            return response.json()
+        except httpx.HTTPError as e:
+            self.logger.error(
+                f"Failed to fetch issue #{issue_number}",
+                error=str(e),
+                issue_number=issue_number,
+            )
+            raise
+
+    async def create_comment(self, issue_number: int, body: str):
+        """Add a comment to an issue or PR.
+
+        Args:
+            issue_number: Issue/PR number
+            body: Comment text
+        """
+        try:
+            await self._request(
+                "POST",
+                f"{self._repo_path}/issues/{issue_number}/comments",
+                json={"body": body},
+            )
+            self.logger.info(
+                f"Created comment on issue #{issue_number}",
+                issue_number=issue_number,
+            )
+        except httpx.HTTPError as e:
+            self.logger.error(
+                f"Failed to create comment on issue #{issue_number}",
+                error=str(e),
+                issue_number=issue_number,
+            )
+            raise
+
+    async def add_labels(self, issue_number: int, labels: List[str]):
+        """Add labels to an issue.
+
+        Args:
+            issue_number: Issue number
+            labels: List of label names
+        """
+        try:
+            await self._request(
+                "POST",
+                f"{self._repo_path}/issues/{issue_number}/labels",
+                json={"labels": labels},
+            )
+            self.logger.info(
+                f"Added labels to issue #{issue_number}",
+                issue_number=issue_number,
+                labels=labels,
+            )
+        except httpx.HTTPError as e:
+            self.logger.error(
+                f"Failed to add labels to issue #{issue_number}",
+                error=str(e),
+                issue_number=issue_number,
+                labels=labels,
+            )
+            raise
+
+    async def remove_label(self, issue_number: int, label: str):
+        """Remove a label from an issue.
+
+        Args:
+            issue_number: Issue number
+            label: Label name to remove
+        """
+        try:
+            await self._request(
+                "DELETE",
+                f"{self._repo_path}/issues/{issue_number}/labels/{quote(label, safe='')}",
+            )
+            self.logger.info(
+                f"Removed label from issue #{issue_number}",
+                issue_number=issue_number,
+                label=label,
+            )
+        except httpx.HTTPError as e:
+            self.logger.error(
+                f"Failed to remove label from issue #{issue_number}",
+                error=str(e),
+                issue_number=issue_number,
+                label=label,
+            )
+            raise
+
+    async def create_pull_request(
+        self,
+        title: str,
+        body: str,
+        head: str,
+        base: str,
+        draft: bool = False,
+    ) -> Dict[str, Any]:
+        """Create a pull request.
+
+        Args:
+            title: PR title
+            body: PR description
+            head: Head branch name
+            base: Base branch name
+            draft: Create as draft PR
+
+        Returns:
+            Created pull request payload
+        """
+        try:
+            response = await self._request(
+                "POST",
+                f"{self._repo_path}/pulls",
+                json={
+                    "title": title,
+                    "body": body,
+                    "head": head,
+                    "base": base,
+                    "draft": draft,
+                },
+            )
+            pr = response.json()
+            self.logger.pr_created(
+                pr_number=pr["number"],
+                pr_title=title,
+                branch=head,
+            )
+            return pr
+        except httpx.HTTPError as e:
+            self.logger.error(
+                "Failed to create pull request",
+                error=str(e),
+                title=title,
+                head=head,
+                base=base,
+            )
+            raise
+
+    async def get_pull_request(self, pr_number: int) -> Dict[str, Any]:
+        """Get a specific pull request.
+
+        Args:
+            pr_number: PR number
+
+        Returns:
+            Pull request payload
+        """
+        try:
+            response = await self._request(
+                "GET", f"{self._repo_path}/pulls/{pr_number}"
+            )
+            return response.json()
+        except httpx.HTTPError as e:
+            self.logger.error(
+                f"Failed to fetch PR #{pr_number}",
+                error=str(e),
+                pr_number=pr_number,
+            )
+            raise
+
+    async def get_pull_requests_batch(
+        self, pr_numbers: List[int]
+    ) -> Dict[int, Optional[Dict[str, Any]]]:
+        """Get several pull requests with one GraphQL query per batch.
+
+        Each PR is requested under its own alias, so N pull requests cost
+        one round-trip per GRAPHQL_BATCH_SIZE instead of N REST calls.
+
+        Args:
+            pr_numbers: PR numbers to fetch
+
+        Returns:
+            Mapping of PR number to its GraphQL fields, or None if not found
+        """
+        owner, name = self.repository_name.split("/", 1)
+        batches = [
+            pr_numbers[i : i + GRAPHQL_BATCH_SIZE]
+            for i in range(0, len(pr_numbers), GRAPHQL_BATCH_SIZE)
+        ]
+
+        try:
+            results = await asyncio.gather(
+                *(self._query_pull_requests(owner, name, batch) for batch in batches)
+            )
+        except httpx.HTTPError as e:
+            self.logger.error(
+                "Failed to batch fetch pull requests",
+                error=str(e),
+                pr_numbers=pr_numbers,
+            )
+            raise
+
+        pull_requests: Dict[int, Optional[Dict[str, Any]]] = {}
+        for result in results:
+            pull_requests.update(result)
+        return pull_requests
+
+    async def _query_pull_requests(
+        self, owner: str, name: str, pr_numbers: List[int]
+    ) -> Dict[int, Optional[Dict[str, Any]]]:
+        """Run one aliased GraphQL query for a batch of pull requests.
+
+        Args:
+            owner: Repository owner
+            name: Repository name
+            pr_numbers: PR numbers in this batch
+
+        Returns:
+            Mapping of PR number to its GraphQL fields, or None if not found
+        """
+        aliases = "\n".join(
+            f"pr{number}: pullRequest(number: {int(number)}) {{{PULL_REQUEST_FIELDS}}}"
+            for number in pr_numbers
+        )
+        query = (
+            "query($owner: String!, $name: String!) {"
+            f" repository(owner: $owner, name: $name) {{ {aliases} }} }}"
+        )
+
+        response = await self._request(
+            "POST",
+            "/graphql",
+            json={"query": query, "variables": {"owner": owner, "name": name}},
+        )
+        payload = response.json()
+
+        # Missing PRs come back as null alongside a NOT_FOUND error
+        if payload.get("errors"):
+            self.logger.warning(
+                "GraphQL pull request query returned errors",
+                errors=[error.get("message") for error in payload["errors"]],
+            )
+
+        repository = (payload.get("data") or {}).get("repository") or {}
+        return {number: repository.get(f"pr{number}") for number in pr_numbers}
+
+    async def get_pr_checks(self, pr_number: int) -> Dict[str, Any]:
+        """Get CI/CD check status for a PR.
+
+        Args:
+            pr_number: PR number
+
+        Returns:
+            Dictionary with check status information
+        """
+        try:
+            response = await self._request(
+                "GET", f"{self._repo_path}/pulls/{pr_number}"
+            )
+            sha = response.json()["head"]["sha"]
+            commit_path = f"{self._repo_path}/commits/{sha}"
+
+            # Check runs (GitHub Actions, etc.) and statuses (older CI
+            # systems) are independent, so fetch them concurrently
+            check_runs, statuses = await asyncio.gather(
+                self._get_paginated(f"{commit_path}/check-runs", item_key="check_runs"),
+                self._get_paginated(f"{commit_path}/statuses"),
+            )
+
+            all_checks: List[CheckResult] = []
+
+            # Timestamps are already ISO-8601 strings in the payload
+            for check in check_runs:
+                all_checks.append(
+                    {
+                        "name": check["name"],
+                        "status": check["status"],
+                        "conclusion": check["conclusion"],
+                        "started_at": check.get("started_at"),
+                        "completed_at": check.get("completed_at"),
+                    }
+                )
+
+            for status in statuses:
+                all_checks.append(
+                    {
+                        "name": status["context"],
+                        "status": "completed",
+                        "conclusion": status["state"],
+                        "description": status.get("description"),
+                    }
+                )
+
+            return {
+                "overall": compute_overall_check_status(all_checks),
+                "checks": all_checks,
+            }
+
+        except httpx.HTTPError as e:
+            self.logger.error(
+                f"Failed to get checks for PR #{pr_number}",
+                error=str(e),
+                pr_number=pr_number,
+            )
+            raise
+
+    async def merge_pull_request(
+        self,
+        pr_number: int,
+        merge_method: str = "squash",
+        commit_title: Optional[str] = None,
+        commit_message: Optional[str] = None,
+    ) -> bool:
+        """Merge a pull request.
+
+        Args:
+            pr_number: PR number
+            merge_method: Merge method (merge, squash, rebase)
+            commit_title: Custom commit title
+            commit_message: Custom commit message
+
+        Returns:
+            True if merged successfully
+        """
+        payload: Dict[str, Any] = {"merge_method": merge_method}
+        if commit_title:
+            payload["commit_title"] = commit_title
+        if commit_message:
+            payload["commit_message"] = commit_message
+
+        try:
+            pr = await self.get_pull_request(pr_number)
+            response = await self._request(
+                "PUT",
+                f"{self._repo_path}/pulls/{pr_number}/merge",
+                json=payload,
+            )
+            result = response.json()
+
+            if result.get("merged"):
+                self.logger.pr_merged(
+                    pr_number=pr_number,
+                    pr_title=pr["title"],
+                    merge_commit=result["sha"],
+                )
+                return True
+            else:
+                self.logger.warning(
+                    f"Failed to merge PR #{pr_number}",
+                    pr_number=pr_number,
+                    error_message=result.get("message"),
+                )
+                return False
+
+        except httpx.HTTPError as e:
+            self.logger.error(
+                f"Failed to merge PR #{pr_number}",
+                error=str(e),
+                pr_number=pr_number,
+            )
+            raise
+
+    async def close_issue(self, issue_number: int, comment: Optional[str] = None):
+        """Close an issue.
+
+        The comment and the state change are sent concurrently, so their
+        order is not guaranteed: the comment may land after the issue is
+        closed. A failed comment is logged but does not fail the close.
+
+        Args:
+            issue_number: Issue number
+            comment: Optional comment to add while closing
+
+        Raises:
+            httpx.HTTPError: If closing the issue fails
+        """
+        issue_path = f"{self._repo_path}/issues/{issue_number}"
+        requests = [self._request("PATCH", issue_path, json={"state": "closed"})]
+        if comment:
+            requests.append(
+                self._request("POST", f"{issue_path}/comments", json={"body": comment})
+            )
+
+        # Collect both outcomes so one failing neither hides nor abandons
+        # the other
+        close_result, *comment_results = await asyncio.gather(
+            *requests, return_exceptions=True
+        )
+
+        for comment_result in comment_results:
+            if isinstance(comment_result, httpx.HTTPError):
+                self.logger.error(
+                    f"Failed to comment on issue #{issue_number}",
+                    error=str(comment_result),
+                    issue_number=issue_number,
+                )
+            elif isinstance(comment_result, BaseException):
+                raise comment_result
+
+        if isinstance(close_result, httpx.HTTPError):
+            self.logger.error(
+                f"Failed to close issue #{issue_number}",
+                error=str(close_result),
+                issue_number=issue_number,
+            )
+            raise close_result
+        if isinstance(close_result, BaseException):
+            raise close_result
+
+        self.logger.info(
+            f"Closed issue #{issue_number}",
+            issue_number=issue_number,
+        )
+
+    async def create_issue(
+        self,
+        title: str,
+        body: str,
+        labels: Optional[List[str]] = None,
+        assignees: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Create a new issue.
+
+        Args:
+            title: Issue title
+            body: Issue description
+            labels: List of label names
+            assignees: List of user logins to assign
+
+        Returns:
+            Created issue payload
+        """
+        try:
+            response = await self._request(
+                "POST",
+                f"{self._repo_path}/issues",
+                json={
+                    "title": title,
+                    "body": body,
+                    "labels": labels or [],
+                    "assignees": assignees or [],
+                },
+            )
+            issue = response.json()
+
+            self.logger.info(
+                f"Created issue #{issue['number']}: {title}",
+                issue_number=issue["number"],
+                title=title,
+                labels=labels,
+            )
+
+            return issue
+
+        except httpx.HTTPError as e:
+            self.logger.error(
+                "Failed to create issue",
+                error=str(e),
+                title=title,
+            )
+            raise
+
+    async def request_review(self, pr_number: int, reviewers: List[str]):
+        """Request reviews on a pull request.
+
+        Args:
+            pr_number: PR number
+            reviewers: List of reviewer usernames
+        """
+        try:
+            await self._request(
+                "POST",
+                f"{self._repo_path}/pulls/{pr_number}/requested_reviewers",
+                json={"reviewers": reviewers},
+            )
+
+            self.logger.info(
+                f"Requested review on PR #{pr_number}",
+                pr_number=pr_number,
+                reviewers=reviewers,
+            )
+
+        except httpx.HTTPError as e:
+            self.logger.error(
+                f"Failed to request review on PR #{pr_number}",
+                error=str(e),
+                pr_number=pr_number,
+                reviewers=reviewers,
+            )
+            raise
+
+    async def get_file_contents(
+        self, path: str, ref: Optional[str] = None, use_cache: bool = True
+    ) -> str:
+        """Get contents of a file from the repository.
+
+        Args:
+            path: File path in repository
+            ref: Branch/commit/tag reference (defaults to default branch)
+            use_cache: Whether to use cache for this request
+
+        Returns:
+            File contents as string
+        """
+        ref_str = ref or "main"
+
+        # Check cache if enabled
+        if self.enable_cache and use_cache and self.github_cache:
+            cached_content = self.github_cache.get_file_content(
+                self.repository_name, path, ref_str
+            )
+            if cached_content is not None:
+                self.cache_hits += 1
+                self.logger.debug(
+                    "github_cache_hit", path=path, ref=ref_str, type="file_content"
+                )
+                return cached_content
+
+            self.cache_misses += 1
+
+        try:
+            # The raw media type returns the file bytes as the body, avoiding
+            # the base64-in-JSON encoding of the default representation
+            response = await self._request(
+                "GET",
+                f"{self._repo_path}/contents/{quote(path)}",
+                params={"ref": ref} if ref else None,
+                headers={"Accept": RAW_MEDIA_TYPE},
+            )
+            # Directories have no raw form and still come back as a JSON listing
+            if response.headers.get("Content-Type", "").startswith("application/json"):
+                raise ValueError(f"Path {path} is a directory, not a file")
+
+            content_str = response.content.decode("utf-8")
+
+            # Cache the content
+            if self.enable_cache and use_cache and self.github_cache:
+                self.github_cache.set_file_content(
+                    self.repository_name, path, ref_str, content_str, ttl_seconds=3600
+                )
+
+            return content_str
+
+        except httpx.HTTPError as e:
+            self.logger.error(
+                f"Failed to get file contents: {path}",
+                error=str(e),
+                path=path,
+                ref=ref,
+            )
+            raise
+
+    async def get_rate_limit_status(self) -> Dict[str, Any]:
+        """Get current GitHub API rate limit status.
+
+        Returns:
+            Dictionary with rate limit information
+        """
+        try:
+            response = await self._request("GET", "/rate_limit")
+            resources = response.json()["resources"]
+
+            status: Dict[str, Any] = {}
+            for name in ("core", "search", "graphql"):
+                resource = resources[name]
+                status[name] = {
+                    "limit": resource["limit"],
+                    "remaining": resource["remaining"],
+                    "reset_time": datetime.fromtimestamp(
+                        resource["reset"], tz=timezone.utc
+                    ).isoformat(),
+                }
+
+            # Update rate limiter if available
+            if self.rate_limiter:
+                core = resources["core"]
+                self.rate_limiter.update_rate_limit(
+                    api="github",
+                    limit=core["limit"],
+                    remaining=core["remaining"],
+                    reset_time=datetime.fromtimestamp(core["reset"], tz=timezone.utc),
+                )
+
+            return status
+
+        except httpx.HTTPError as e:
+            self.logger.error(
+                "Failed to get rate limit status",
+                error=str(e),
+            )
+            raise
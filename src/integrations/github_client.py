@@ -1,9 +1,11 @@
 """GitHub API integration for the orchestrator."""
 
+import threading
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from functools import cached_property
+from typing import Any, Dict, Iterator, List, Optional, Tuple, TypedDict
 
-from github import Github, GithubException
+from github import Github, GithubException, GithubRetry
 from github.GithubObject import NotSet
 from github.Issue import Issue
 from github.PullRequest import PullRequest
@@ -13,6 +15,98 @@ from ..core.cache import GitHubAPICache
 from ..core.logger import AuditLogger
 from ..safety.rate_limiter import RateLimiter
 
+# Per-request socket timeout (seconds) for PyGithub calls
+GITHUB_TIMEOUT_SECONDS = 15
+
+# Retries for 5xx/secondary-rate-limit responses, backing off 2s, 4s, ...
+# instead of PyGithub's default of ten immediate retries
+GITHUB_MAX_RETRIES = 3
+GITHUB_RETRY_BACKOFF_FACTOR = 1.0
+
+# Token -> (eager, lazy) Github handles shared by every GitHubClient, so that
+# clients created per workflow reuse one connection pool per credential
+_shared_github: Dict[str, Tuple[Github, Github]] = {}
+_shared_github_lock = threading.Lock()
+
+
+def _get_shared_github(token: str) -> Tuple[Github, Github]:
+    """Get the process-wide Github handles for a token.
+
+    Args:
+        token: GitHub personal access token
+
+    Returns:
+        Tuple of (eager, lazy) Github instances
+    """
+    with _shared_github_lock:
+        if token not in _shared_github:
+            github = Github(
+                token,
+                timeout=GITHUB_TIMEOUT_SECONDS,
+                retry=GithubRetry(
+                    total=GITHUB_MAX_RETRIES,
+                    backoff_factor=GITHUB_RETRY_BACKOFF_FACTOR,
+                ),
+            )
+            _shared_github[token] = (github, github.withLazy(True))
+        return _shared_github[token]
+
+
+class CheckResult(TypedDict, total=False):
+    """A single CI check as returned in ``get_pr_checks()["checks"]``.
+
+    Check runs carry timestamps; legacy commit statuses carry a description.
+    Consumers such as the PR cycle read entries with ``dict.get``, so this is
+    a typed view of the plain dicts rather than a separate class.
+    """
+
+    name: str
+    status: Optional[str]
+    conclusion: Optional[str]
+    started_at: Optional[str]
+    completed_at: Optional[str]
+    description: Optional[str]
+
+
+_PASSING_CONCLUSIONS = frozenset({"success", "neutral", "skipped"})
+_PENDING_STATUSES = frozenset({"queued", "in_progress"})
+
+
+def compute_overall_check_status(all_checks: List[CheckResult]) -> str:
+    """Reduce individual check results to a single overall status.
+
+    Any failure wins, then all-passing, then anything still running. The
+    checks are scanned once, stopping at the first failure.
+
+    Args:
+        all_checks: Check run and commit status entries
+
+    Returns:
+        One of "no_checks", "failed", "passed", "pending" or "unknown"
+    """
+    if not all_checks:
+        return "no_checks"
+
+    all_passed = True
+    has_pending = False
+    for check in all_checks:
+        conclusion = check.get("conclusion")
+        if conclusion == "failure":
+            return "failed"
+
+        status = check.get("status")
+        if conclusion not in _PASSING_CONCLUSIONS and status != "success":
+            all_passed = False
+        if status in _PENDING_STATUSES:
+            has_pending = True
+
+    if all_passed:
+        return "passed"
+    elif has_pending:
+        return "pending"
+    else:
+        return "unknown"
+
 
 class GitHubClient:
     """Wrapper around PyGithub for orchestrator operations."""
@@ -43,9 +137,9 @@ class GitHubClient:
         self.github_cache = github_cache
         self.enable_cache = enable_cache
 
-        # Initialize GitHub client
-        self.github = Github(token)
-        self.repo: Repository = self.github.get_repo(repository)
+        # Initialize GitHub client (shared per token; the repository itself is
+        # fetched on first use)
+        self.github, self._lazy_github = _get_shared_github(token)
 
         # Cache statistics
         self.cache_hits = 0
@@ -54,37 +148,55 @@ class GitHubClient:
         # Update rate limit after initialization
         self._update_rate_limit()
 
+    @cached_property
+    def repo(self) -> Repository:
+        """Repository handle, fetched on first access."""
+        return self.github.get_repo(self.repository_name)
+
+    @cached_property
+    def _lazy_repo(self) -> Repository:
+        """Lazy repository handle for mutations.
+
+        Issue/PR objects obtained through it carry only their URL, so e.g.
+        commenting is a single POST instead of a GET followed by the POST.
+        """
+        return self._lazy_github.get_repo(self.repository_name)
+
     def get_issues(
         self,
         labels: Optional[List[str]] = None,
         state: str = "open",
         exclude_labels: Optional[List[str]] = None,
-    ) -> List[Issue]:
+    ) -> Iterator[Issue]:
         """Get issues from repository.
 
+        Issues are yielded as pages are fetched, so callers that stop early
+        do not pay for the remaining pages. Wrap in ``list()`` when a full
+        list is needed.
+
         Args:
             labels: Filter by labels (issues must have ALL labels)
             state: Issue state (open, closed, all)
             exclude_labels: Exclude issues with these labels
 
-        Returns:
-            List of matching issues
+        Yields:
+            Matching issues
         """
-        try:
-            all_issues = self.repo.get_issues(state=state, labels=labels or [])
+        exclude_set = frozenset(exclude_labels or ())
 
-            # Filter out PRs (GitHub API treats PRs as issues)
-            issues = [issue for issue in all_issues if not issue.pull_request]
+        try:
+            for issue in self.repo.get_issues(state=state, labels=labels or []):
+                # Filter out PRs (GitHub API treats PRs as issues)
+                if issue.pull_request:
+                    continue
 
-            # Filter out excluded labels
-            if exclude_labels:
-                issues = [
-                    issue
-                    for issue in issues
-                    if not any(label.name in exclude_labels for label in issue.labels)
-                ]
+                # Filter out excluded labels
+                if exclude_set and any(
+                    label.name in exclude_set for label in issue.labels
+                ):
+                    continue
 
-            return list(issues)
+                yield issue
 
         except GithubException as e:
             self.logger.error(
@@ -121,7 +233,7 @@ class GitHubClient:
             body: Comment text
         """
         try:
-            issue = self.repo.get_issue(issue_number)
+            issue = self._lazy_repo.get_issue(issue_number)
             issue.create_comment(body)
             self.logger.info(
                 f"Created comment on issue #{issue_number}",
@@ -143,7 +255,7 @@ class GitHubClient:
             labels: List of label names
         """
         try:
-            issue = self.repo.get_issue(issue_number)
+            issue = self._lazy_repo.get_issue(issue_number)
             issue.add_to_labels(*labels)
             self.logger.info(
                 f"Added labels to issue #{issue_number}",
@@ -167,7 +279,7 @@ class GitHubClient:
             label: Label name to remove
         """
         try:
-            issue = self.repo.get_issue(issue_number)
+            issue = self._lazy_repo.get_issue(issue_number)
             issue.remove_from_labels(label)
             self.logger.info(
                 f"Removed label from issue #{issue_number}",
@@ -257,31 +369,28 @@ class GitHubClient:
         """
         try:
             pr = self.repo.get_pull(pr_number)
-            commit = pr.get_commits().reversed[0]  # Latest commit
+            # The PR payload already names its head commit; a lazy handle
+            # avoids paging through the PR's commit list to find it
+            commit = self._lazy_repo.get_commit(pr.head.sha)
 
-            # Get check runs
-            check_runs = commit.get_check_runs()
+            # Get check runs as raw JSON (see _get_check_runs)
+            check_runs = self._get_check_runs(pr.head.sha)
 
             # Get statuses (for older CI systems)
             statuses = commit.get_statuses()
 
-            all_checks = []
+            all_checks: List[CheckResult] = []
 
-            # Process check runs (GitHub Actions, etc.)
+            # Process check runs (GitHub Actions, etc.). Timestamps are
+            # already ISO-8601 strings in the payload.
             for check in check_runs:
                 all_checks.append(
                     {
-                        "name": check.name,
-                        "status": check.status,
-                        "conclusion": check.conclusion,
-                        "started_at": (
-                            check.started_at.isoformat() if check.started_at else None
-                        ),
-                        "completed_at": (
-                            check.completed_at.isoformat()
-                            if check.completed_at
-                            else None
-                        ),
+                        "name": check["name"],
+                        "status": check["status"],
+                        "conclusion": check["conclusion"],
+                        "started_at": check.get("started_at"),
+                        "completed_at": check.get("completed_at"),
                     }
                 )
 
@@ -296,24 +405,8 @@ class GitHubClient:
                     }
                 )
 
-            # Determine overall status
-            if not all_checks:
-                overall = "no_checks"
-            elif any(c.get("conclusion") == "failure" for c in all_checks):
-                overall = "failed"
-            elif all(
-                c.get("conclusion") in ["success", "neutral", "skipped"]
-                or c.get("status") == "success"
-                for c in all_checks
-            ):
-                overall = "passed"
-            elif any(c.get("status") in ["queued", "in_progress"] for c in all_checks):
-                overall = "pending"
-            else:
-                overall = "unknown"
-
             return {
-                "overall": overall,
+                "overall": compute_overall_check_status(all_checks),
                 "checks": all_checks,
             }
 
@@ -325,6 +418,32 @@ class GitHubClient:
             )
             raise
 
+    def _get_check_runs(self, sha: str) -> List[Dict[str, Any]]:
+        """Get all check runs for a commit as raw API payloads.
+
+        Goes through PyGithub's requester rather than ``Commit.get_check_runs``
+        to skip building a CheckRun object (and parsing its timestamps) per
+        run; ``CheckRun.raw_data`` is no alternative as it re-fetches each run.
+
+        Args:
+            sha: Commit SHA
+
+        Returns:
+            Check run payloads from every page
+        """
+        url = f"{self._lazy_repo.url}/commits/{sha}/check-runs"
+        check_runs: List[Dict[str, Any]] = []
+        page = 1
+
+        while True:
+            _, data = self.github.requester.requestJsonAndCheck(
+                "GET", url, parameters={"per_page": 100, "page": page}
+            )
+            check_runs.extend(data["check_runs"])
+            if not data["check_runs"] or len(check_runs) >= data["total_count"]:
+                return check_runs
+            page += 1
+
     def merge_pull_request(
         self,
         pr_number: int,
@@ -383,7 +502,7 @@ class GitHubClient:
             comment: Optional comment to add before closing
         """
         try:
-            issue = self.repo.get_issue(issue_number)
+            issue = self._lazy_repo.get_issue(issue_number)
 
             if comment:
                 issue.create_comment(comment)
@@ -454,7 +573,7 @@ class GitHubClient:
             reviewers: List of reviewer usernames
         """
         try:
-            pr = self.repo.get_pull(pr_number)
+            pr = self._lazy_repo.get_pull(pr_number)
             pr.create_review_request(reviewers=reviewers)
 
             self.logger.info(
@@ -1,19 +1,85 @@
 """Integration with multi-agent-coder CLI for enhanced analysis."""
 
+import asyncio
+import hashlib
+import itertools
 import json
 import os
+import re
+import select
+import struct
 import subprocess
+import sys
+import tempfile
+import threading
 import time
-from dataclasses import asdict, dataclass, field
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Generator, Iterator, List, Optional, Tuple, Union
 
-from ..core.cache import LLMCache
+from ..core.cache import LLMCache, SemanticCache
 from ..core.logger import AuditLogger
 from ..safety.cost_tracker import CostTracker, Provider
 
+# Separates per-prompt records in ``--batch`` output, e.g. "===REC 3==="
+_BATCH_RECORD_RE = re.compile(r"^===REC (\d+)===$", re.MULTILINE)
+
+# Frames exchanged with a persistent worker are prefixed with their length as
+# a 4-byte big-endian unsigned int
+_WORKER_FRAME_HEADER = struct.Struct(">I")
+
+# Per-query result objects skip the per-instance __dict__ where supported
+_DATACLASS_OPTIONS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+# Provider sections in CLI output start with a header line such as
+# "╔═══ ANTHROPIC ═══╗" (a bare "═══" rule names no provider); lines starting
+# with "Error:" are not part of a response
+_PROVIDER_HEADER_RE = re.compile(
+    r"^[^\n═]*═{3,}[^\S\n]*(?P<provider>[A-Za-z][\w-]*)?.*$", re.MULTILINE
+)
+_ERROR_LINE_RE = re.compile(r"^Error:.*\n?", re.MULTILINE)
+
+# Usage figures reported by the CLI, e.g. "7,121 tokens" and "$0.0656"
+_TOKEN_COUNT_RE = re.compile(r"(?<![\w.,])(\d[\d,]*)[ \t]+tokens?\b", re.IGNORECASE)
+_COST_RE = re.compile(r"\$(\d[\d,]*(?:\.\d+)?)")
+
+# Review decisions ("APPROVE" vs "CHANGES_REQUESTED"/"request changes")
+_APPROVE_RE = re.compile(r"\bapprove", re.IGNORECASE)
+_REQUEST_CHANGES_RE = re.compile(
+    r"changes[_ ]requested|request\s+changes", re.IGNORECASE
+)
+
+# Review comment parsing: file references ("src/foo.py:42"), severity
+# keywords and suggestion keywords
+_FILE_REF_RE = re.compile(
+    r"(?P<file>(?:src|tests)/[\w./-]*\w|[\w./-]*\w\.py\b)(?::(?P<line>\d+))?"
+)
+_ERROR_SEVERITY_RE = re.compile(r"critical|security|bug|error", re.IGNORECASE)
+_WARNING_SEVERITY_RE = re.compile(r"warning|concern|issue", re.IGNORECASE)
+_SUGGESTION_RE = re.compile(r"suggest|consider|should|could|recommend", re.IGNORECASE)
+
+# Provider names the cost tracker has pricing for
+_TRACKED_PROVIDERS = frozenset(provider.value for provider in Provider)
+
+# Rough prompt size estimate used before dispatching a query
+CHARS_PER_TOKEN = 4
+
+# Cache lifetimes for successful responses (see _compute_ttl)
+CACHE_TTL_SECONDS = 86400
+CACHE_TTL_REVIEW_SECONDS = 7 * 86400
+CACHE_TTL_TIME_SENSITIVE_SECONDS = 3600
+
+# Prompts mentioning relative dates or explicit timestamps go stale quickly
+_TIME_SENSITIVE_RE = re.compile(
+    r"\b(?:today|yesterday|tomorrow|this (?:week|month)|\d{4}-\d{2}-\d{2})\b",
+    re.IGNORECASE,
+)
+
 
 class MultiAgentStrategy(Enum):
     """Available multi-agent-coder routing strategies."""
@@ -23,7 +89,7 @@ class MultiAgentStrategy(Enum):
     DIALECTICAL = "dialectical"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MultiAgentResponse:
     """Response from multi-agent-coder."""
 
@@ -36,10 +102,179 @@ class MultiAgentResponse:
     error: Optional[str] = None
     tokens_by_provider: Dict[str, Dict[str, int]] = field(default_factory=dict)
     cost_by_provider: Dict[str, float] = field(default_factory=dict)
+    cache_creation_tokens: int = 0
+    cache_read_tokens: int = 0
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return {
+            "providers": list(self.providers),
+            "responses": dict(self.responses),
+            "strategy": self.strategy,
+            "total_tokens": self.total_tokens,
+            "total_cost": self.total_cost,
+            "success": self.success,
+            "error": self.error,
+            "tokens_by_provider": {
+                provider: dict(tokens)
+                for provider, tokens in self.tokens_by_provider.items()
+            },
+            "cost_by_provider": dict(self.cost_by_provider),
+            "cache_creation_tokens": self.cache_creation_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+        }
+
+
+class _OutputParser:
+    """Incremental parser for multi_agent_coder output.
+
+    Output can be fed in chunks of any size, e.g. line by line while the CLI
+    is still running. Provider sections and usage figures are collected from
+    complete lines as they arrive; a section is complete once the next
+    provider's header is seen (see pop_completed()).
+    """
+
+    def __init__(self, strategy: str):
+        self.strategy = strategy
+        self.providers: List[str] = []
+        self.sections: Dict[str, List[str]] = {}
+        self.total_tokens = 0
+        self.total_cost = 0.0
+        self._current_provider: Optional[str] = None
+        self._completed: List[Tuple[str, str]] = []
+        self._pending = ""
+
+    def feed(self, text: str):
+        """Consume a chunk of stdout."""
+        text = self._pending + text
+        end = text.rfind("\n") + 1
+        self._pending = text[end:]
+        if end:
+            self._scan(text[:end])
+
+    def finish(self, stderr: str) -> MultiAgentResponse:
+        """Consume any trailing partial line plus stderr and build the response."""
+        if self._pending:
+            self._scan(self._pending)
+            self._pending = ""
+        self._count_usage(stderr)
+
+        responses = {
+            provider: self._section_text(provider) for provider in self.sections
+        }
+        return MultiAgentResponse(
+            providers=self.providers,
+            responses=responses,
+            strategy=self.strategy,
+            total_tokens=self.total_tokens,
+            total_cost=self.total_cost,
+            success=len(responses) > 0,
+        )
+
+    def has_output(self) -> bool:
+        """Whether any provider output has been seen."""
+        return bool(self.providers)
+
+    def pop_completed(self) -> List[Tuple[str, str]]:
+        """Return (provider, response) sections completed since the last call."""
+        completed, self._completed = self._completed, []
+        return completed
+
+    def _section_text(self, provider: str) -> str:
+        """Join a provider's section, dropping error lines."""
+        return _ERROR_LINE_RE.sub("", "".join(self.sections[provider])).strip()
+
+    def _scan(self, text: str):
+        """Split complete lines into provider sections at their headers."""
+        position = 0
+        for header in _PROVIDER_HEADER_RE.finditer(text):
+            if self._current_provider:
+                self.sections[self._current_provider].append(
+                    text[position : header.start()]
+                )
+            position = header.end()
+
+            provider_match = header.group("provider")
+            if provider_match:
+                if self._current_provider:
+                    self._completed.append(
+                        (
+                            self._current_provider,
+                            self._section_text(self._current_provider),
+                        )
+                    )
+                self._current_provider = provider_match.lower()
+                self.providers.append(self._current_provider)
+                self.sections[self._current_provider] = []
+
+        if self._current_provider:
+            self.sections[self._current_provider].append(text[position:])
+
+        self._count_usage(text)
+
+    def _count_usage(self, text: str):
+        """Add token counts and costs mentioned in text (e.g. "7121 tokens, $0.0656")."""
+        self.total_tokens += sum(
+            int(match.group(1).replace(",", ""))
+            for match in _TOKEN_COUNT_RE.finditer(text)
+        )
+        self.total_cost += sum(
+            float(match.group(1).replace(",", "")) for match in _COST_RE.finditer(text)
+        )
+
+
+class _JsonOutputParser(_OutputParser):
+    """Parser for ``--format json`` output.
+
+    The CLI prints one JSON object::
+
+        {"providers": [...], "responses": {provider: text}, "tokens": int,
+         "cost": float, "tokens_by_provider": {...}, "cost_by_provider": {...},
+         "cache_creation_input_tokens": int, "cache_read_input_tokens": int}
+
+    Output that isn't JSON is parsed as text instead.
+    """
+
+    def __init__(self, strategy: str):
+        super().__init__(strategy)
+        self._chunks: List[str] = []
+
+    def feed(self, text: str):
+        """Consume a chunk of stdout."""
+        self._chunks.append(text)
+
+    def has_output(self) -> bool:
+        """Whether any output has been seen."""
+        return any(chunk.strip() for chunk in self._chunks)
+
+    def finish(self, stderr: str) -> MultiAgentResponse:
+        """Decode the JSON document (or fall back to the text format)."""
+        stdout = "".join(self._chunks)
+        try:
+            data = json.loads(stdout)
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            super().feed(stdout)
+            return super().finish(stderr)
+
+        responses = {
+            provider.lower(): text
+            for provider, text in (data.get("responses") or {}).items()
+        }
+        return MultiAgentResponse(
+            providers=[p.lower() for p in data.get("providers") or responses],
+            responses=responses,
+            strategy=self.strategy,
+            total_tokens=int(data.get("tokens") or 0),
+            total_cost=float(data.get("cost") or 0.0),
+            success=len(responses) > 0,
+            error=data.get("error"),
+            tokens_by_provider=data.get("tokens_by_provider") or {},
+            cost_by_provider=data.get("cost_by_provider") or {},
+            cache_creation_tokens=int(data.get("cache_creation_input_tokens") or 0),
+            cache_read_tokens=int(data.get("cache_read_input_tokens") or 0),
+        )
 
 
 class MultiAgentCoderClient:
@@ -51,6 +286,79 @@ class MultiAgentCoderClient:
     code analysis and generation.
     """
 
+    # Prompt templates. Each prompt starts with fixed *_INSTRUCTIONS, kept
+    # byte-identical across calls (no issue or PR details) so that with prompt
+    # caching enabled they can be sent as a cacheable system prompt
+    ISSUE_ANALYSIS_INSTRUCTIONS = """Analyze the following GitHub issue and provide:
+
+1. **Issue Type**: Classify as bug, feature, refactor, documentation, or other
+2. **Complexity Score**: Rate from 0-10 (0=trivial, 10=extremely complex)
+3. **Actionability**: Is this issue actionable? (yes/no with reasoning)
+4. **Key Requirements**: List 3-5 key requirements
+5. **Affected Files**: List files likely to be modified (if determinable)
+6. **Risks**: Potential risks or challenges
+7. **Recommended Approach**: High-level implementation approach
+
+"""
+
+    ISSUE_ANALYSIS_PROMPT = """**Issue Title:** {issue_title}
+
+**Labels:** {labels}
+
+**Issue Body:**
+{issue_body}
+
+Please provide your analysis in a structured format.
+"""
+
+    DEFAULT_REVIEW_FOCUS = (
+        "- Code quality and best practices\n- Error handling\n- Performance\n"
+        "- Security\n- Maintainability"
+    )
+
+    CODE_REVIEW_INSTRUCTIONS = """Review the following code and provide specific suggestions for improvement.
+
+"""
+
+    CODE_REVIEW_PROMPT = """Provide feedback on:
+{focus}
+
+**Code:**
+```python
+{code}
+```
+"""
+
+    PR_REVIEW_INSTRUCTIONS = """Review the following Pull Request and provide comprehensive feedback.
+
+Please provide your review covering:
+1. **Overall Assessment**: Approve or request changes (with clear reasoning)
+2. **Code Quality**: Adherence to best practices, readability, maintainability
+3. **Potential Issues**: Bugs, edge cases, security concerns, performance issues
+4. **Specific Feedback**: File-specific and line-specific comments where applicable
+5. **Suggestions**: Concrete improvements or alternatives
+
+Format your response as:
+- **Decision**: APPROVE or CHANGES_REQUESTED
+- **Summary**: Brief overall assessment
+- **Comments**: Specific feedback items with file/line references where possible
+
+"""
+
+    PR_REVIEW_PROMPT = """**PR Number:** #{pr_number}
+
+**PR Description:**
+{pr_description}
+
+**Files Changed:**
+{files_changed}
+
+**Diff:**
+```diff
+{pr_diff}
+```
+"""
+
     def __init__(
         self,
         multi_agent_coder_path: str,
@@ -62,6 +370,12 @@ class MultiAgentCoderClient:
         enable_cache: bool = True,
         max_retries: int = 3,
         retry_delay: float = 2.0,
+        persistent_worker: bool = False,
+        max_concurrency: int = 4,
+        semantic_cache: Optional[SemanticCache] = None,
+        json_output: bool = False,
+        prompt_caching: bool = False,
+        prompt_stdin: bool = False,
     ):
         """Initialize multi-agent-coder client.
 
@@ -75,6 +389,25 @@ class MultiAgentCoderClient:
             enable_cache: Whether to enable caching
             max_retries: Maximum number of retries on rate limit errors
             retry_delay: Initial delay between retries in seconds (exponential backoff)
+            persistent_worker: Keep one multi_agent_coder process running in
+                ``--server`` mode and send queries to it over stdin/stdout,
+                instead of starting the CLI (and the BEAM VM) for every query.
+                Falls back to one process per query if the worker exits
+                before ever answering (e.g. the CLI lacks ``--server``).
+            max_concurrency: Maximum number of aquery() calls running at once
+            semantic_cache: Optional cache returning responses for prompts
+                similar (not just identical) to earlier ones with the same
+                strategy and providers
+            json_output: Ask the CLI for JSON output (``--format json``) instead
+                of parsing its box-drawn text output. Output that isn't JSON
+                (older CLI versions) is still parsed as text.
+            prompt_caching: Send known fixed prompt prefixes (such as the
+                issue analysis instructions) as a cacheable system prompt
+                (``--system-prompt <file> --cache-system``) so providers can
+                cache them. Requires CLI support.
+            prompt_stdin: Pipe prompts to the CLI's stdin (``--prompt-stdin``)
+                instead of passing them as an argument, avoiding the argv
+                size limit for large prompts. Requires CLI support.
         """
         self.executable_path = Path(multi_agent_coder_path)
         self.logger = logger
@@ -87,9 +420,29 @@ class MultiAgentCoderClient:
         self.default_providers = default_providers or []
         self.cost_tracker = cost_tracker
         self.llm_cache = llm_cache
+        self.semantic_cache = semantic_cache
         self.enable_cache = enable_cache
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.persistent_worker = persistent_worker
+        self.json_output = json_output
+        self.prompt_caching = prompt_caching
+        self.prompt_stdin = prompt_stdin
+
+        # Cacheable prompt prefixes and the files holding them
+        self._cacheable_prefixes: Dict[str, str] = {}
+        self._prefix_dir: Optional[tempfile.TemporaryDirectory] = None
+
+        # Persistent worker state (only used when persistent_worker is set)
+        self._worker: Optional[subprocess.Popen] = None
+        self._worker_lock = threading.Lock()
+        self._worker_request_ids = itertools.count(1)
+        self._worker_ready = False
+
+        # Limits concurrent aquery() calls; recreated per event loop
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
 
         # Verify executable exists
         if not self.executable_path.exists():
@@ -97,263 +450,1241 @@ class MultiAgentCoderClient:
                 f"multi_agent_coder executable not found at {multi_agent_coder_path}"
             )
 
+        # Command and working directory strings reused by every invocation
+        self._executable = str(self.executable_path)
+        self._cwd = str(self.executable_path.parent)
+
+        if prompt_caching:
+            for instructions in (
+                self.ISSUE_ANALYSIS_INSTRUCTIONS,
+                self.CODE_REVIEW_INSTRUCTIONS,
+                self.PR_REVIEW_INSTRUCTIONS,
+            ):
+                self._register_cacheable_prefix(instructions)
+
+        # Most queries use the default strategy and providers; build that
+        # command prefix once (with the values it was built for)
+        self._default_command = (
+            self.default_strategy,
+            list(self.default_providers),
+            self._command_prefix(self.default_strategy, self.default_providers),
+        )
+
         # Statistics
         self.total_calls = 0
         self.total_tokens = 0
         self.total_cost = 0.0
-        self.provider_usage: Dict[str, int] = {}
+        self.provider_usage: Counter = Counter()
         self.cache_hits = 0
         self.cache_misses = 0
         self.retry_count = 0
         self.rate_limit_count = 0
 
-    def _has_rate_limit_error(self, response: MultiAgentResponse) -> bool:
-        """Check if response contains rate limit errors.
+    def _has_rate_limit_error(self, response: MultiAgentResponse) -> bool:
+        """Check if response contains rate limit errors.
+
+        Args:
+            response: Multi-agent response to check
+
+        Returns:
+            True if any provider hit rate limits
+        """
+        for provider_response in response.responses.values():
+            if (
+                "rate_limit" in provider_response.lower()
+                or "rate limit" in provider_response.lower()
+            ):
+                return True
+        return False
+
+    def _get_rate_limited_providers(self, response: MultiAgentResponse) -> List[str]:
+        """Get list of providers that hit rate limits.
+
+        Args:
+            response: Multi-agent response to check
+
+        Returns:
+            List of provider names that hit rate limits
+        """
+        rate_limited = []
+        for provider, provider_response in response.responses.items():
+            if (
+                "rate_limit" in provider_response.lower()
+                or "rate limit" in provider_response.lower()
+            ):
+                rate_limited.append(provider)
+        return rate_limited
+
+    def query(
+        self,
+        prompt: str,
+        strategy: Optional[Union[MultiAgentStrategy, str]] = None,
+        providers: Optional[List[str]] = None,
+        timeout: int = 120,
+        use_cache: bool = True,
+        cache_tags: Optional[List[str]] = None,
+        cacheable_prefix: Optional[str] = None,
+    ) -> MultiAgentResponse:
+        """Query multi-agent-coder with a prompt.
+
+        Args:
+            prompt: The prompt to send to multi-agent-coder
+            strategy: Routing strategy (enum or string, defaults to instance default)
+            providers: List of provider names to use (defaults to instance default)
+            timeout: Timeout in seconds for the request
+            use_cache: Whether to use cache for this query
+            cache_tags: Extra tags for the cached response (for invalidation)
+            cacheable_prefix: Fixed text prepended to the prompt; sent as a
+                cacheable system prompt when prompt caching is enabled
+
+        Returns:
+            MultiAgentResponse with results from all providers
+
+        Raises:
+            subprocess.TimeoutExpired: If query times out
+            subprocess.CalledProcessError: If multi_agent_coder fails
+        """
+        strategy = self._resolve_strategy(strategy)
+        providers = providers or self.default_providers
+        if cacheable_prefix:
+            prompt = self._apply_cacheable_prefix(cacheable_prefix, prompt)
+        use_cache = bool(
+            self.enable_cache and use_cache and (self.llm_cache or self.semantic_cache)
+        )
+
+        # Check cache if enabled
+        cache_key = None
+        if use_cache:
+            cache_key = self._cache_key(prompt, strategy, providers)
+            cached_response = self._get_cached(cache_key, prompt, strategy, providers)
+            if cached_response:
+                return cached_response
+
+        over_budget = self._check_budget(prompt, strategy, providers)
+        if over_budget:
+            return over_budget
+
+        if self.logger.is_enabled_for("debug"):
+            self.logger.debug(
+                "Calling multi-agent-coder",
+                strategy=strategy.value,
+                providers=providers,
+                prompt_length=len(prompt),
+            )
+
+        # Retry loop with exponential backoff for rate limits
+        last_response: Optional[MultiAgentResponse] = None
+        last_exception: Optional[Exception] = None
+        for retry_attempt in range(self.max_retries + 1):
+            try:
+                # Execute multi_agent_coder and parse its output
+                response = self._run(prompt, strategy, providers, timeout)
+                last_response = response
+
+                # Check for rate limit errors
+                delay = self._rate_limit_delay(response, retry_attempt)
+                if delay is not None:
+                    time.sleep(delay)
+                    continue  # Retry
+
+                return self._complete_query(
+                    response,
+                    retry_attempt,
+                    cache_key,
+                    prompt,
+                    strategy,
+                    providers,
+                    cache_tags,
+                )
+
+            except Exception as e:
+                # Don't retry on timeouts, process errors or unexpected errors
+                last_exception = e
+                self._log_query_exception(e, timeout)
+                break
+
+        # If we get here, we exhausted retries or hit an exception
+        if last_response:
+            return last_response
+
+        return self._error_response(strategy, timeout, last_exception)
+
+    async def aquery(
+        self,
+        prompt: str,
+        strategy: Optional[Union[MultiAgentStrategy, str]] = None,
+        providers: Optional[List[str]] = None,
+        timeout: int = 120,
+        use_cache: bool = True,
+        cache_tags: Optional[List[str]] = None,
+        cacheable_prefix: Optional[str] = None,
+    ) -> MultiAgentResponse:
+        """Query multi-agent-coder without blocking the event loop.
+
+        Behaves like query() (caching, rate-limit retries, statistics) but runs
+        the CLI with asyncio subprocesses. At most ``max_concurrency`` queries
+        run at once per client.
+
+        Args:
+            prompt: The prompt to send to multi-agent-coder
+            strategy: Routing strategy (enum or string, defaults to instance default)
+            providers: List of provider names to use (defaults to instance default)
+            timeout: Timeout in seconds for the request
+            use_cache: Whether to use cache for this query
+            cache_tags: Extra tags for the cached response (for invalidation)
+            cacheable_prefix: Fixed text prepended to the prompt; sent as a
+                cacheable system prompt when prompt caching is enabled
+
+        Returns:
+            MultiAgentResponse with results from all providers
+        """
+        strategy = self._resolve_strategy(strategy)
+        providers = providers or self.default_providers
+        if cacheable_prefix:
+            prompt = self._apply_cacheable_prefix(cacheable_prefix, prompt)
+        use_cache = bool(
+            self.enable_cache and use_cache and (self.llm_cache or self.semantic_cache)
+        )
+
+        cache_key = None
+        if use_cache:
+            cache_key = self._cache_key(prompt, strategy, providers)
+            cached_response = self._get_cached(cache_key, prompt, strategy, providers)
+            if cached_response:
+                return cached_response
+
+        over_budget = self._check_budget(prompt, strategy, providers)
+        if over_budget:
+            return over_budget
+
+        if self.logger.is_enabled_for("debug"):
+            self.logger.debug(
+                "Calling multi-agent-coder",
+                strategy=strategy.value,
+                providers=providers,
+                prompt_length=len(prompt),
+            )
+
+        last_response: Optional[MultiAgentResponse] = None
+        last_exception: Optional[Exception] = None
+        async with self._get_semaphore():
+            for retry_attempt in range(self.max_retries + 1):
+                try:
+                    response = await self._arun(prompt, strategy, providers, timeout)
+                    last_response = response
+
+                    delay = self._rate_limit_delay(response, retry_attempt)
+                    if delay is not None:
+                        await asyncio.sleep(delay)
+                        continue
+
+                    return self._complete_query(
+                        response,
+                        retry_attempt,
+                        cache_key,
+                        prompt,
+                        strategy,
+                        providers,
+                        cache_tags,
+                    )
+
+                except Exception as e:
+                    last_exception = e
+                    self._log_query_exception(e, timeout)
+                    break
+
+        if last_response:
+            return last_response
+
+        return self._error_response(strategy, timeout, last_exception)
+
+    async def aquery_many(
+        self,
+        prompts: List[str],
+        strategy: Optional[Union[MultiAgentStrategy, str]] = None,
+        providers: Optional[List[str]] = None,
+        timeout: int = 120,
+        use_cache: bool = True,
+    ) -> List[MultiAgentResponse]:
+        """Run several queries concurrently.
+
+        Args:
+            prompts: Prompts to send
+            strategy: Routing strategy used for every prompt
+            providers: Provider names used for every prompt
+            timeout: Timeout in seconds for each request
+            use_cache: Whether to use cache for these queries
+
+        Returns:
+            Responses in the same order as ``prompts``
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.aquery(
+                        prompt,
+                        strategy=strategy,
+                        providers=providers,
+                        timeout=timeout,
+                        use_cache=use_cache,
+                    )
+                    for prompt in prompts
+                )
+            )
+        )
+
+    def query_batch(
+        self,
+        prompts: List[str],
+        strategy: Optional[Union[MultiAgentStrategy, str]] = None,
+        providers: Optional[List[str]] = None,
+        timeout: int = 600,
+        use_cache: bool = True,
+    ) -> List[MultiAgentResponse]:
+        """Send several prompts through a single multi_agent_coder invocation.
+
+        Runs the CLI once in ``--batch`` mode, writing one JSON object
+        ``{"id", "prompt"}`` per line to stdin. The CLI prints each answer
+        after a ``===REC <id>===`` line. Cached prompts are answered from the
+        cache and not sent. Rate-limited records are returned as-is rather
+        than retried.
+
+        Args:
+            prompts: Prompts to send
+            strategy: Routing strategy used for every prompt
+            providers: Provider names used for every prompt
+            timeout: Timeout in seconds for the whole batch
+            use_cache: Whether to use cache for these queries
+
+        Returns:
+            Responses in the same order as ``prompts``
+        """
+        strategy = self._resolve_strategy(strategy)
+        providers = providers or self.default_providers
+        use_cache = bool(
+            self.enable_cache and use_cache and (self.llm_cache or self.semantic_cache)
+        )
+
+        results: List[Optional[MultiAgentResponse]] = [None] * len(prompts)
+        cache_keys: List[Optional[str]] = [None] * len(prompts)
+        pending: List[int] = []
+
+        for i, prompt in enumerate(prompts):
+            if use_cache:
+                cache_keys[i] = self._cache_key(prompt, strategy, providers)
+                results[i] = self._get_cached(
+                    cache_keys[i], prompt, strategy, providers
+                )
+            if results[i] is None:
+                pending.append(i)
+
+        if pending:
+            cmd = self._command_prefix(strategy, providers)
+            cmd.insert(1, "--batch")
+            batch_input = "\n".join(
+                json.dumps({"id": i, "prompt": prompts[i]}) for i in pending
+            )
+
+            self.logger.debug(
+                "Calling multi-agent-coder in batch mode",
+                strategy=strategy.value,
+                providers=providers,
+                batch_size=len(pending),
+            )
+
+            try:
+                result = subprocess.run(
+                    cmd,
+                    input=batch_input,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                    cwd=self._cwd,
+                )
+                records = self._split_batch_output(result.stdout)
+                for i in pending:
+                    response = self._parse_output(records.get(i, ""), "")
+                    results[i] = self._complete_query(
+                        response, 0, cache_keys[i], prompts[i], strategy, providers
+                    )
+            except Exception as e:
+                self._log_query_exception(e, timeout)
+                for i in pending:
+                    if results[i] is None:
+                        results[i] = self._error_response(strategy, timeout, e)
+
+        return [r for r in results if r is not None]
+
+    @staticmethod
+    def _split_batch_output(stdout: str) -> Dict[int, str]:
+        """Split ``--batch`` output into per-record stdout.
+
+        Args:
+            stdout: Standard output of a batch invocation
+
+        Returns:
+            Mapping of record id to the output printed for it
+        """
+        records: Dict[int, str] = {}
+        markers = list(_BATCH_RECORD_RE.finditer(stdout))
+        for marker, next_marker in zip(markers, markers[1:] + [None]):
+            end = next_marker.start() if next_marker else len(stdout)
+            records[int(marker.group(1))] = stdout[marker.end() : end]
+        return records
+
+    def _resolve_strategy(
+        self, strategy: Optional[Union[MultiAgentStrategy, str]]
+    ) -> MultiAgentStrategy:
+        """Convert a strategy argument to an enum, applying the default."""
+        if strategy is None:
+            return self.default_strategy
+        elif isinstance(strategy, str):
+            return MultiAgentStrategy(strategy)
+        return strategy
+
+    def _cache_key(
+        self, prompt: str, strategy: MultiAgentStrategy, providers: List[str]
+    ) -> str:
+        """Build the LLM cache key for a query.
+
+        Hashes "strategy|providers|prompt" with BLAKE2b, which is faster than
+        SHA-256 and avoids serialising the parts to JSON first. Strategy and
+        provider names cannot contain "|", so the encoding is unambiguous.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(strategy.value.encode())
+        digest.update(b"|")
+        digest.update(",".join(sorted(providers)).encode())
+        digest.update(b"|")
+        digest.update(prompt.encode())
+        return f"multi_agent:{digest.hexdigest()}"
+
+    def _get_cached(
+        self,
+        cache_key: str,
+        prompt: str,
+        strategy: MultiAgentStrategy,
+        providers: List[str],
+    ) -> Optional[MultiAgentResponse]:
+        """Look up a cached response, updating hit/miss statistics.
+
+        The exact-key LLM cache is tried first, then the semantic cache.
+        """
+        cached_response = None
+        if self.llm_cache:
+            cached_response = self.llm_cache.cache.get(cache_key)
+        if not cached_response and self.semantic_cache:
+            cached_response = self.semantic_cache.get(
+                prompt, namespace=self._semantic_namespace(strategy, providers)
+            )
+
+        if cached_response:
+            self.cache_hits += 1
+            self.logger.info(
+                "multi-agent-coder cache hit",
+                strategy=strategy.value,
+                prompt_length=len(prompt),
+            )
+            return cached_response
+
+        self.cache_misses += 1
+        return None
+
+    @staticmethod
+    def _semantic_namespace(strategy: MultiAgentStrategy, providers: List[str]) -> str:
+        """Semantic cache namespace: hits must match strategy and providers."""
+        return f"{strategy.value}|{','.join(sorted(providers))}"
+
+    def _rate_limit_delay(
+        self, response: MultiAgentResponse, retry_attempt: int
+    ) -> Optional[float]:
+        """Decide whether a rate-limited response should be retried.
+
+        Args:
+            response: Parsed response
+            retry_attempt: Zero-based attempt number
+
+        Returns:
+            Seconds to wait before retrying, or None to accept the response
+        """
+        if not self._has_rate_limit_error(response):
+            return None
+
+        rate_limited_providers = self._get_rate_limited_providers(response)
+        self.rate_limit_count += 1
+
+        # If we have retries left, wait and retry
+        if retry_attempt < self.max_retries:
+            delay = self.retry_delay * (2**retry_attempt)
+            self.retry_count += 1
+
+            self.logger.warning(
+                "Rate limit detected, retrying",
+                rate_limited_providers=rate_limited_providers,
+                retry_attempt=retry_attempt + 1,
+                max_retries=self.max_retries,
+                delay_seconds=delay,
+            )
+            return delay
+
+        # Max retries reached, log and return partial results
+        self.logger.warning(
+            "Max retries reached with rate limits",
+            rate_limited_providers=rate_limited_providers,
+            successful_providers=len(response.providers),
+        )
+        return None
+
+    def _complete_query(
+        self,
+        response: MultiAgentResponse,
+        retry_attempt: int,
+        cache_key: Optional[str],
+        prompt: str,
+        strategy: MultiAgentStrategy,
+        providers: List[str],
+        cache_tags: Optional[List[str]] = None,
+    ) -> MultiAgentResponse:
+        """Record statistics, costs and cache entry for a finished query.
+
+        Args:
+            response: Final response
+            retry_attempt: Zero-based attempt number that produced it
+            cache_key: Cache key to store the response under (None = don't cache)
+            prompt: Prompt that produced the response
+            strategy: Routing strategy used
+            providers: Provider names requested
+            cache_tags: Extra tags for the cache entry
+
+        Returns:
+            The response
+        """
+        # Update statistics
+        self.total_calls += 1
+        self.total_tokens += response.total_tokens
+        self.total_cost += response.total_cost
+        self.provider_usage.update(response.providers)
+
+        # Track costs with cost tracker
+        if self.cost_tracker and response.success:
+            self._track_costs(response)
+
+        # Cache successful response (even if some providers hit rate limits)
+        if cache_key and response.success:
+            ttl_seconds = self._compute_ttl(prompt, strategy, response)
+            tags = ["multi_agent"] + (cache_tags or [])
+            if self.llm_cache:
+                self.llm_cache.cache.set(
+                    cache_key, response, ttl_seconds=ttl_seconds, tags=tags
+                )
+            if self.semantic_cache:
+                self.semantic_cache.set(
+                    prompt,
+                    response,
+                    namespace=self._semantic_namespace(strategy, providers),
+                    ttl_seconds=ttl_seconds,
+                    tags=tags,
+                )
+
+        self.logger.info(
+            "multi-agent-coder query completed",
+            providers=response.providers,
+            tokens=response.total_tokens,
+            cost=response.total_cost,
+            success=response.success,
+            retry_attempt=retry_attempt if retry_attempt > 0 else None,
+        )
+
+        return response
+
+    @staticmethod
+    def _compute_ttl(
+        prompt: str, strategy: MultiAgentStrategy, response: MultiAgentResponse
+    ) -> int:
+        """Choose how long a successful response stays cached.
+
+        Prompts that mention dates ("today", "2024-01-31") are only cached
+        briefly. Dialectical code reviews depend only on the code in the
+        prompt, so they are kept for a week. Everything else gets a day.
+
+        Args:
+            prompt: Prompt that produced the response
+            strategy: Routing strategy used
+            response: Response being cached
+
+        Returns:
+            Time to live in seconds
+        """
+        if _TIME_SENSITIVE_RE.search(prompt):
+            return CACHE_TTL_TIME_SENSITIVE_SECONDS
+        if strategy is MultiAgentStrategy.DIALECTICAL:
+            return CACHE_TTL_REVIEW_SECONDS
+        return CACHE_TTL_SECONDS
+
+    def invalidate_pr(self, pr_number: int):
+        """Drop cached reviews of a pull request (e.g. after a new push).
+
+        Args:
+            pr_number: Pull request number
+        """
+        tags = [f"pr:{pr_number}"]
+        if self.llm_cache:
+            self.llm_cache.cache.invalidate_by_tags(tags)
+        if self.semantic_cache:
+            self.semantic_cache.invalidate_by_tags(tags)
+
+    def _log_query_exception(self, error: Exception, timeout: int):
+        """Log an exception raised while running a query."""
+        if isinstance(error, subprocess.TimeoutExpired):
+            self.logger.error(
+                "multi-agent-coder query timed out",
+                timeout=timeout,
+                exc_info=True,
+            )
+        elif isinstance(error, subprocess.CalledProcessError):
+            self.logger.error(
+                "multi-agent-coder execution failed",
+                error=error.stderr if hasattr(error, "stderr") else str(error),
+                return_code=error.returncode,
+                exc_info=True,
+            )
+        else:
+            self.logger.error(
+                "Unexpected error calling multi-agent-coder",
+                error=str(error),
+                exc_info=True,
+            )
+
+    def _error_response(
+        self,
+        strategy: MultiAgentStrategy,
+        timeout: int,
+        last_exception: Optional[Exception],
+    ) -> MultiAgentResponse:
+        """Build the failed response returned when no output is available."""
+        if isinstance(last_exception, subprocess.TimeoutExpired):
+            error_msg = f"Query timed out after {timeout}s"
+        elif isinstance(last_exception, subprocess.CalledProcessError):
+            error_msg = f"Execution failed: {last_exception.stderr if hasattr(last_exception, 'stderr') else str(last_exception)}"
+        elif last_exception:
+            error_msg = f"Unexpected error: {str(last_exception)}"
+        else:
+            error_msg = "Query failed after retries"
+
+        return MultiAgentResponse(
+            providers=[],
+            responses={},
+            strategy=strategy.value,
+            total_tokens=0,
+            total_cost=0.0,
+            success=False,
+            error=error_msg,
+        )
+
+    @staticmethod
+    def estimate_tokens(prompt: str) -> int:
+        """Estimate the number of tokens in a prompt (about 4 characters each).
+
+        Args:
+            prompt: Prompt text
+
+        Returns:
+            Estimated token count
+        """
+        return -(-len(prompt) // CHARS_PER_TOKEN)
+
+    def _check_budget(
+        self, prompt: str, strategy: MultiAgentStrategy, providers: List[str]
+    ) -> Optional[MultiAgentResponse]:
+        """Refuse queries whose prompt alone would exceed the remaining budget.
+
+        Only the prompt (input) cost is estimated, so this never blocks a
+        query that could fit; it stops the ones that certainly can't.
+
+        Args:
+            prompt: Prompt to send
+            strategy: Routing strategy
+            providers: Provider names requested (empty = all available)
+
+        Returns:
+            Failed response if the query is over budget, None otherwise
+        """
+        if not self.cost_tracker:
+            return None
+
+        prompt_tokens = self.estimate_tokens(prompt)
+        estimated_cost = self.cost_tracker.estimate_multi_agent_cost(
+            prompt_tokens, 0, num_providers=len(providers) or 4
+        )
+        if self.cost_tracker.can_afford_operation(estimated_cost):
+            return None
+
+        self.logger.warning(
+            "multi-agent-coder query skipped: over budget",
+            estimated_tokens=prompt_tokens,
+            estimated_cost=estimated_cost,
+            remaining_budget=self.cost_tracker.get_remaining_budget(),
+        )
+        return MultiAgentResponse(
+            providers=[],
+            responses={},
+            strategy=strategy.value,
+            total_tokens=0,
+            total_cost=0.0,
+            success=False,
+            error=(
+                f"Estimated cost ${estimated_cost:.4f} exceeds remaining daily budget"
+            ),
+        )
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the concurrency limiter for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    def _build_command(
+        self, prompt: str, strategy: MultiAgentStrategy, providers: List[str]
+    ) -> List[str]:
+        """Build the multi_agent_coder command line for a query."""
+        default_strategy, default_providers, default_prefix = self._default_command
+        if strategy is default_strategy and providers == default_providers:
+            cmd = default_prefix.copy()
+        else:
+            cmd = self._command_prefix(strategy, providers)
+
+        for prefix, prefix_file in self._cacheable_prefixes.items():
+            if prompt.startswith(prefix):
+                cmd += ["--system-prompt", prefix_file, "--cache-system"]
+                prompt = prompt[len(prefix) :]
+                break
+
+        cmd.append(prompt)
+        return cmd
+
+    def _apply_cacheable_prefix(self, prefix: str, prompt: str) -> str:
+        """Prepend a fixed prefix to a prompt, registering it for caching.
+
+        Args:
+            prefix: Fixed prompt prefix
+            prompt: Variable part of the prompt
+
+        Returns:
+            Full prompt
+        """
+        if self.prompt_caching and prefix not in self._cacheable_prefixes:
+            self._register_cacheable_prefix(prefix)
+        return prefix + prompt
+
+    def _register_cacheable_prefix(self, prefix: str):
+        """Write a prompt prefix to a file for ``--system-prompt``.
+
+        Args:
+            prefix: Fixed prompt prefix
+        """
+        if self._prefix_dir is None:
+            self._prefix_dir = tempfile.TemporaryDirectory(prefix="multi_agent_coder_")
+
+        digest = hashlib.blake2b(prefix.encode("utf-8"), digest_size=8).hexdigest()
+        prefix_file = os.path.join(self._prefix_dir.name, f"{digest}.txt")
+        with open(prefix_file, "w", encoding="utf-8") as f:
+            f.write(prefix)
+        self._cacheable_prefixes[prefix] = prefix_file
+
+    def _command_prefix(
+        self, strategy: MultiAgentStrategy, providers: List[str]
+    ) -> List[str]:
+        """Build the command line up to the prompt.
 
         Args:
-            response: Multi-agent response to check
+            strategy: Routing strategy
+            providers: Provider names to use (empty = all available)
 
         Returns:
-            True if any provider hit rate limits
+            Executable, strategy flag and provider filter (if specified)
         """
-        for provider_response in response.responses.values():
-            if (
-                "rate_limit" in provider_response.lower()
-                or "rate limit" in provider_response.lower()
-            ):
-                return True
-        return False
+        cmd = [self._executable, "-s", strategy.value]
+        if providers:
+            cmd += ["-p", ",".join(providers)]
+        if self.json_output:
+            cmd += ["--format", "json"]
+        return cmd
 
-    def _get_rate_limited_providers(self, response: MultiAgentResponse) -> List[str]:
-        """Get list of providers that hit rate limits.
+    def _run(
+        self,
+        prompt: str,
+        strategy: MultiAgentStrategy,
+        providers: List[str],
+        timeout: int,
+    ) -> MultiAgentResponse:
+        """Run a single query through multi_agent_coder.
+
+        Stdout is parsed line by line while the CLI runs rather than being
+        buffered and parsed after it exits.
 
         Args:
-            response: Multi-agent response to check
+            prompt: The prompt to send
+            strategy: Routing strategy
+            providers: Provider names to use (empty = all available)
+            timeout: Timeout in seconds
 
         Returns:
-            List of provider names that hit rate limits
-        """
-        rate_limited = []
-        for provider, provider_response in response.responses.items():
-            if (
-                "rate_limit" in provider_response.lower()
-                or "rate limit" in provider_response.lower()
-            ):
-                rate_limited.append(provider)
-        return rate_limited
+            Parsed response for the query
 
-    def query(
+        Raises:
+            subprocess.TimeoutExpired: If the query times out
+            subprocess.CalledProcessError: If the CLI fails without output or
+                the worker process exits
+        """
+        if self.persistent_worker:
+            try:
+                return self._parse_output(
+                    *self._query_worker(prompt, strategy, providers, timeout)
+                )
+            except subprocess.CalledProcessError as e:
+                self._fall_back_from_worker(e)
+
+        parser = self._make_parser()
+        stderr_chunks: List[str] = []
+        for _ in self._stream_process(
+            self._build_command(prompt, strategy, providers),
+            timeout,
+            parser,
+            stderr_chunks,
+        ):
+            pass
+        return parser.finish("".join(stderr_chunks))
+
+    def stream_query(
         self,
         prompt: str,
         strategy: Optional[Union[MultiAgentStrategy, str]] = None,
         providers: Optional[List[str]] = None,
         timeout: int = 120,
-        use_cache: bool = True,
-    ) -> MultiAgentResponse:
-        """Query multi-agent-coder with a prompt.
+        stop_after: Optional[int] = None,
+    ) -> Iterator[Tuple[str, str]]:
+        """Query multi-agent-coder, yielding each provider's response as it completes.
+
+        A provider's response is yielded as soon as the next provider's header
+        appears in the output, rather than after the slowest provider has
+        finished. With ``stop_after`` the CLI is killed once that many
+        responses have arrived (e.g. 2 for a dialectical query), so a hung
+        provider doesn't hold up the result. Responses aren't cached or
+        retried; statistics and costs are recorded once the query completes.
 
         Args:
             prompt: The prompt to send to multi-agent-coder
             strategy: Routing strategy (enum or string, defaults to instance default)
             providers: List of provider names to use (defaults to instance default)
             timeout: Timeout in seconds for the request
-            use_cache: Whether to use cache for this query
+            stop_after: Stop after this many provider responses (None = all)
 
-        Returns:
-            MultiAgentResponse with results from all providers
+        Yields:
+            (provider, response) tuples in output order
 
         Raises:
             subprocess.TimeoutExpired: If query times out
-            subprocess.CalledProcessError: If multi_agent_coder fails
+            subprocess.CalledProcessError: If the CLI fails without output
         """
-        # Convert strategy to enum if needed
-        if strategy is None:
-            strategy = self.default_strategy
-        elif isinstance(strategy, str):
-            strategy = MultiAgentStrategy(strategy)
-
+        strategy = self._resolve_strategy(strategy)
         providers = providers or self.default_providers
 
-        # Check cache if enabled
-        if self.enable_cache and use_cache and self.llm_cache:
-            import hashlib
+        parser = self._make_parser()
+        stderr_chunks: List[str] = []
+        streamed: Dict[str, str] = {}
+        response: Optional[MultiAgentResponse] = None
+        sections = self._stream_process(
+            self._build_command(prompt, strategy, providers),
+            timeout,
+            parser,
+            stderr_chunks,
+        )
+        for provider, text in sections:
+            streamed[provider] = text
+            yield provider, text
+            if stop_after and len(streamed) >= stop_after:
+                # Kills the CLI along with any providers still running
+                sections.close()
+                break
+        else:
+            response = parser.finish("".join(stderr_chunks))
+            for provider, text in response.responses.items():
+                if provider in streamed:
+                    continue
+                if stop_after and len(streamed) >= stop_after:
+                    break
+                streamed[provider] = text
+                yield provider, text
+
+        if response is None or len(streamed) < len(response.responses):
+            # Stopped early: record what was received
+            response = MultiAgentResponse(
+                providers=list(streamed),
+                responses=streamed,
+                strategy=parser.strategy,
+                total_tokens=parser.total_tokens,
+                total_cost=parser.total_cost,
+                success=len(streamed) > 0,
+            )
+        self._complete_query(response, 0, None, prompt, strategy, providers)
 
-            cache_key_data = {
-                "prompt": prompt,
-                "strategy": strategy.value,
-                "providers": sorted(providers) if providers else [],
-            }
-            cache_key = hashlib.sha256(
-                json.dumps(cache_key_data, sort_keys=True).encode()
-            ).hexdigest()
-            cache_key = f"multi_agent:{cache_key}"
+    def _stream_process(
+        self,
+        cmd: List[str],
+        timeout: int,
+        parser: "_OutputParser",
+        stderr_chunks: List[str],
+    ) -> Generator[Tuple[str, str], None, None]:
+        """Run a multi_agent_coder command, feeding its stdout to a parser.
 
-            cached_response = self.llm_cache.cache.get(cache_key)
-            if cached_response:
-                self.cache_hits += 1
-                self.logger.info(
-                    "multi-agent-coder cache hit",
-                    strategy=strategy.value,
-                    prompt_length=len(prompt),
-                )
-                return cached_response
+        Args:
+            cmd: Command line to run
+            timeout: Timeout in seconds
+            parser: Parser to feed stdout to, line by line
+            stderr_chunks: List collecting the process's stderr
 
-            self.cache_misses += 1
+        Yields:
+            (provider, response) sections as the parser completes them
 
-        # Build command
-        cmd = [str(self.executable_path)]
+        Raises:
+            subprocess.TimeoutExpired: If the process times out
+            subprocess.CalledProcessError: If the process fails without output
+        """
+        cmd, prompt_input = self._split_prompt_input(cmd)
+        process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE if prompt_input is not None else None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            cwd=self._cwd,
+        )
 
-        # Add strategy flag
-        cmd.extend(["-s", strategy.value])
+        timed_out = threading.Event()
 
-        # Add provider filter if specified
-        if providers:
-            cmd.extend(["-p", ",".join(providers)])
+        def kill():
+            timed_out.set()
+            process.kill()
 
-        # Add prompt
-        cmd.append(prompt)
+        timer = threading.Timer(timeout, kill)
+        timer.start()
 
-        self.logger.debug(
-            "Calling multi-agent-coder",
-            strategy=strategy.value,
-            providers=providers,
-            prompt_length=len(prompt),
+        # Drain stderr concurrently so a chatty CLI can't block on a full pipe
+        stderr_thread = threading.Thread(
+            target=self._drain, args=(process.stderr, stderr_chunks), daemon=True
         )
+        stderr_thread.start()
+
+        if prompt_input is not None:
+            threading.Thread(
+                target=self._feed, args=(process.stdin, prompt_input), daemon=True
+            ).start()
+
+        try:
+            for line in process.stdout:
+                parser.feed(line)
+                yield from parser.pop_completed()
+            returncode = process.wait()
+            stderr_thread.join()
+        finally:
+            timer.cancel()
+            if process.poll() is None:
+                # The consumer stopped reading early
+                process.kill()
+            process.stdout.close()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        if returncode and not parser.has_output():
+            # Failed without output; nothing to parse
+            raise subprocess.CalledProcessError(
+                returncode, cmd, stderr="".join(stderr_chunks)
+            )
 
-        # Retry loop with exponential backoff for rate limits
-        last_response: Optional[MultiAgentResponse] = None
-        last_exception: Optional[Exception] = None
-        for retry_attempt in range(self.max_retries + 1):
+    def _split_prompt_input(self, cmd: List[str]) -> Tuple[List[str], Optional[str]]:
+        """Move the prompt from a command line to stdin if prompt_stdin is set.
+
+        Args:
+            cmd: Command line ending with the prompt
+
+        Returns:
+            Command line to run and the text to write to its stdin (None if
+            the prompt stays on the command line)
+        """
+        if not self.prompt_stdin:
+            return cmd, None
+        return cmd[:-1] + ["--prompt-stdin"], cmd[-1]
+
+    @staticmethod
+    def _feed(stream, text: str):
+        """Write text to a pipe and close it."""
+        try:
+            stream.write(text)
+            stream.close()
+        except (BrokenPipeError, ValueError):
+            # The process exited (or timed out) without reading its input
+            pass
+
+    @staticmethod
+    def _drain(stream, chunks: List[str]):
+        """Read a pipe to EOF, collecting its contents into chunks."""
+        for chunk in iter(lambda: stream.read(8192), ""):
+            chunks.append(chunk)
+        stream.close()
+
+    async def _arun(
+        self,
+        prompt: str,
+        strategy: MultiAgentStrategy,
+        providers: List[str],
+        timeout: int,
+    ) -> MultiAgentResponse:
+        """Async counterpart of _run().
+
+        Args:
+            prompt: The prompt to send
+            strategy: Routing strategy
+            providers: Provider names to use (empty = all available)
+            timeout: Timeout in seconds
+
+        Returns:
+            Parsed response for the query
+
+        Raises:
+            subprocess.TimeoutExpired: If the query times out
+            subprocess.CalledProcessError: If the CLI fails without output
+        """
+        if self.persistent_worker:
             try:
-                # Execute multi_agent_coder
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout,
-                    cwd=self.executable_path.parent,
+                # The worker pipe is shared and guarded by a thread lock
+                worker_stdout, worker_stderr = await asyncio.to_thread(
+                    self._query_worker, prompt, strategy, providers, timeout
                 )
+                return self._parse_output(worker_stdout, worker_stderr)
+            except subprocess.CalledProcessError as e:
+                self._fall_back_from_worker(e)
 
-                # Parse output
-                response = self._parse_output(result.stdout, result.stderr)
-                last_response = response
+        cmd, prompt_input = self._split_prompt_input(
+            self._build_command(prompt, strategy, providers)
+        )
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE if prompt_input is not None else None,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=self._cwd,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(
+                    prompt_input.encode("utf-8") if prompt_input is not None else None
+                ),
+                timeout,
+            )
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise subprocess.TimeoutExpired(cmd, timeout)
+
+        if process.returncode and not stdout.strip():
+            raise subprocess.CalledProcessError(
+                process.returncode,
+                cmd,
+                stderr=stderr.decode("utf-8", errors="replace"),
+            )
 
-                # Check for rate limit errors
-                if self._has_rate_limit_error(response):
-                    rate_limited_providers = self._get_rate_limited_providers(response)
-                    self.rate_limit_count += 1
-
-                    # If we have retries left, wait and retry
-                    if retry_attempt < self.max_retries:
-                        delay = self.retry_delay * (2**retry_attempt)
-                        self.retry_count += 1
-
-                        self.logger.warning(
-                            "Rate limit detected, retrying",
-                            rate_limited_providers=rate_limited_providers,
-                            retry_attempt=retry_attempt + 1,
-                            max_retries=self.max_retries,
-                            delay_seconds=delay,
-                        )
+        return self._parse_output(
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace"),
+        )
 
-                        time.sleep(delay)
-                        continue  # Retry
+    def _ensure_worker(self) -> subprocess.Popen:
+        """Start the persistent worker if it is not running.
 
-                    else:
-                        # Max retries reached, log and return partial results
-                        self.logger.warning(
-                            "Max retries reached with rate limits",
-                            rate_limited_providers=rate_limited_providers,
-                            successful_providers=len(response.providers),
-                        )
+        Returns:
+            Running worker process
+        """
+        if self._worker is None or self._worker.poll() is not None:
+            self._worker = subprocess.Popen(
+                [self._executable, "--server"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0,
+                cwd=self._cwd,
+            )
+            self.logger.info(
+                "Started multi-agent-coder worker",
+                pid=self._worker.pid,
+            )
+        return self._worker
 
-                # Update statistics
-                self.total_calls += 1
-                self.total_tokens += response.total_tokens
-                self.total_cost += response.total_cost
-                for provider in response.providers:
-                    self.provider_usage[provider] = (
-                        self.provider_usage.get(provider, 0) + 1
-                    )
+    def _query_worker(
+        self,
+        prompt: str,
+        strategy: MultiAgentStrategy,
+        providers: List[str],
+        timeout: int,
+    ) -> Tuple[str, str]:
+        """Send a query to the persistent worker and wait for its reply.
 
-                # Track costs with cost tracker
-                if self.cost_tracker and response.success:
-                    self._track_costs(response)
-
-                # Cache successful response (even if some providers hit rate limits)
-                if (
-                    self.enable_cache
-                    and use_cache
-                    and self.llm_cache
-                    and response.success
-                ):
-                    self.llm_cache.cache.set(
-                        cache_key, response, ttl_seconds=86400, tags=["multi_agent"]
-                    )
+        Each request is a length-prefixed JSON frame
+        ``{"id", "prompt", "strategy", "providers"}``; the worker answers with a
+        frame ``{"id", "stdout", "stderr"}`` carrying the same output the CLI
+        would print for that query.
 
-                self.logger.info(
-                    "multi-agent-coder query completed",
-                    providers=response.providers,
-                    tokens=response.total_tokens,
-                    cost=response.total_cost,
-                    success=response.success,
-                    retry_attempt=retry_attempt if retry_attempt > 0 else None,
-                )
+        Args:
+            prompt: The prompt to send
+            strategy: Routing strategy
+            providers: Provider names to use (empty = all available)
+            timeout: Timeout in seconds
 
-                return response
+        Returns:
+            Tuple of (stdout, stderr) produced for the query
 
-            except subprocess.TimeoutExpired as e:
-                # Don't retry on timeout, just fail
-                last_exception = e
-                self.logger.error(
-                    "multi-agent-coder query timed out",
-                    timeout=timeout,
-                    exc_info=True,
-                )
-                break
-            except subprocess.CalledProcessError as e:
-                # Don't retry on process errors, just fail
-                last_exception = e
-                self.logger.error(
-                    "multi-agent-coder execution failed",
-                    error=e.stderr if hasattr(e, "stderr") else str(e),
-                    return_code=e.returncode,
-                    exc_info=True,
-                )
-                break
-            except Exception as e:
-                # Don't retry on unexpected errors, just fail
-                last_exception = e
-                self.logger.error(
-                    "Unexpected error calling multi-agent-coder",
-                    error=str(e),
-                    exc_info=True,
+        Raises:
+            subprocess.TimeoutExpired: If no reply arrives in time
+            subprocess.CalledProcessError: If the worker process exits
+        """
+        request_id = next(self._worker_request_ids)
+        request = json.dumps(
+            {
+                "id": request_id,
+                "prompt": prompt,
+                "strategy": strategy.value,
+                "providers": providers,
+                "format": "json" if self.json_output else "text",
+            }
+        ).encode("utf-8")
+
+        with self._worker_lock:
+            worker = self._ensure_worker()
+            deadline = time.monotonic() + timeout
+            try:
+                assert worker.stdin is not None
+                try:
+                    worker.stdin.write(
+                        _WORKER_FRAME_HEADER.pack(len(request)) + request
+                    )
+                    worker.stdin.flush()
+                except BrokenPipeError:
+                    raise subprocess.CalledProcessError(
+                        worker.wait(), worker.args
+                    ) from None
+
+                header = self._read_worker(
+                    worker, _WORKER_FRAME_HEADER.size, deadline, timeout
                 )
-                break
+                (length,) = _WORKER_FRAME_HEADER.unpack(header)
+                reply = json.loads(self._read_worker(worker, length, deadline, timeout))
+            except Exception:
+                # The pipe may now hold a partial frame; start fresh next time
+                self._stop_worker()
+                raise
+
+        if reply.get("id") != request_id:
+            raise ValueError(
+                f"multi-agent-coder worker replied to request {reply.get('id')}, "
+                f"expected {request_id}"
+            )
 
-        # If we get here, we exhausted retries or hit an exception
-        if last_response:
-            return last_response
+        self._worker_ready = True
+        return reply.get("stdout", ""), reply.get("stderr", "")
 
-        # No response available - return error response based on exception type
-        if isinstance(last_exception, subprocess.TimeoutExpired):
-            error_msg = f"Query timed out after {timeout}s"
-        elif isinstance(last_exception, subprocess.CalledProcessError):
-            error_msg = f"Execution failed: {last_exception.stderr if hasattr(last_exception, 'stderr') else str(last_exception)}"
-        elif last_exception:
-            error_msg = f"Unexpected error: {str(last_exception)}"
-        else:
-            error_msg = "Query failed after retries"
+    def _fall_back_from_worker(self, error: subprocess.CalledProcessError):
+        """Switch to one CLI process per query if the worker never started.
 
-        return MultiAgentResponse(
-            providers=[],
-            responses={},
-            strategy=strategy.value,
-            total_tokens=0,
-            total_cost=0.0,
-            success=False,
-            error=error_msg,
+        A worker that has answered before is assumed to have crashed, so the
+        error is re-raised and the next query restarts it.
+
+        Args:
+            error: Error raised when the worker exited
+
+        Raises:
+            subprocess.CalledProcessError: If the worker had been working
+        """
+        if self._worker_ready:
+            raise error
+
+        self.logger.warning(
+            "multi-agent-coder worker unavailable, starting the CLI per query",
+            error=str(error),
         )
+        self.persistent_worker = False
+
+    def _read_worker(
+        self, worker: subprocess.Popen, size: int, deadline: float, timeout: int
+    ) -> bytes:
+        """Read exactly ``size`` bytes from the worker before the deadline.
+
+        Args:
+            worker: Worker process
+            size: Number of bytes to read
+            deadline: ``time.monotonic()`` value to give up at
+            timeout: Overall query timeout (for the error message)
+
+        Returns:
+            The bytes read
+
+        Raises:
+            subprocess.TimeoutExpired: If the deadline passes
+            subprocess.CalledProcessError: If the worker closes its stdout
+        """
+        assert worker.stdout is not None
+        fd = worker.stdout.fileno()
+        chunks = []
+        remaining = size
+
+        while remaining:
+            wait = deadline - time.monotonic()
+            if wait <= 0 or not select.select([fd], [], [], wait)[0]:
+                raise subprocess.TimeoutExpired(worker.args, timeout)
+
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                raise subprocess.CalledProcessError(worker.poll() or -1, worker.args)
+            chunks.append(chunk)
+            remaining -= len(chunk)
+
+        return b"".join(chunks)
+
+    def _stop_worker(self):
+        """Terminate the persistent worker if it is running."""
+        worker, self._worker = self._worker, None
+        if worker is None or worker.poll() is not None:
+            return
+
+        worker.terminate()
+        try:
+            worker.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            worker.kill()
+            worker.wait()
+
+    def close(self):
+        """Release resources held by the client (worker, prompt prefix files)."""
+        with self._worker_lock:
+            self._stop_worker()
+
+        if self._prefix_dir is not None:
+            self._cacheable_prefixes.clear()
+            self._prefix_dir.cleanup()
+            self._prefix_dir = None
+
+    def __enter__(self) -> "MultiAgentCoderClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _make_parser(self) -> "_OutputParser":
+        """Create a parser for one query's output."""
+        if self.json_output:
+            return _JsonOutputParser(self.default_strategy.value)
+        return _OutputParser(self.default_strategy.value)
 
     def _parse_output(self, stdout: str, stderr: str) -> MultiAgentResponse:
         """Parse multi-agent-coder output.
@@ -365,69 +1696,9 @@ class MultiAgentCoderClient:
         Returns:
             Parsed MultiAgentResponse
         """
-        providers = []
-        responses = {}
-        total_tokens = 0
-        total_cost = 0.0
-
-        # Parse stdout for provider responses
-        current_provider = None
-        current_response = []
-
-        for line in stdout.split("\n"):
-            # Detect provider headers (e.g., "╔═══ ANTHROPIC ═══╗")
-            if "═══" in line and "═══" in line:
-                if current_provider and current_response:
-                    responses[current_provider] = "\n".join(current_response).strip()
-                    current_response = []
-
-                # Extract provider name
-                provider_match = line.replace("╔═══", "").replace("═══╗", "").strip()
-                if provider_match:
-                    current_provider = provider_match.lower()
-                    providers.append(current_provider)
-                continue
-
-            # Skip error lines
-            if line.startswith("Error:"):
-                continue
-
-            # Collect response lines
-            if current_provider:
-                current_response.append(line)
-
-        # Add last provider response
-        if current_provider and current_response:
-            responses[current_provider] = "\n".join(current_response).strip()
-
-        # Parse token and cost information from stderr or stdout
-        for line in (stdout + "\n" + stderr).split("\n"):
-            if "tokens" in line.lower():
-                # Try to extract token count (e.g., "7121 tokens")
-                try:
-                    parts = line.split()
-                    for i, part in enumerate(parts):
-                        if "token" in part.lower() and i > 0:
-                            total_tokens += int(parts[i - 1].replace(",", ""))
-                except (ValueError, IndexError):
-                    pass
-
-            if "$" in line:
-                # Try to extract cost (e.g., "$0.0656")
-                try:
-                    cost_str = line[line.index("$") + 1 :].split()[0]
-                    total_cost += float(cost_str.replace(",", ""))
-                except (ValueError, IndexError):
-                    pass
-
-        return MultiAgentResponse(
-            providers=providers,
-            responses=responses,
-            strategy=self.default_strategy.value,
-            total_tokens=total_tokens,
-            total_cost=total_cost,
-            success=len(responses) > 0,
-        )
+        parser = self._make_parser()
+        parser.feed(stdout)
+        return parser.finish(stderr)
 
     def analyze_issue(
         self,
@@ -445,32 +1716,44 @@ class MultiAgentCoderClient:
         Returns:
             MultiAgentResponse with analysis from multiple providers
         """
-        prompt = f"""Analyze the following GitHub issue and provide:
-
-1. **Issue Type**: Classify as bug, feature, refactor, documentation, or other
-2. **Complexity Score**: Rate from 0-10 (0=trivial, 10=extremely complex)
-3. **Actionability**: Is this issue actionable? (yes/no with reasoning)
-4. **Key Requirements**: List 3-5 key requirements
-5. **Affected Files**: List files likely to be modified (if determinable)
-6. **Risks**: Potential risks or challenges
-7. **Recommended Approach**: High-level implementation approach
-
-**Issue Title:** {issue_title}
+        return self.query(
+            prompt=self._issue_analysis_prompt(issue_title, issue_body, labels),
+            strategy=MultiAgentStrategy.ALL,
+            timeout=120,
+        )
 
-**Labels:** {', '.join(labels) if labels else 'None'}
+    async def aanalyze_issues(
+        self, issues: List[Tuple[str, str, List[str]]]
+    ) -> List[MultiAgentResponse]:
+        """Analyze several GitHub issues concurrently.
 
-**Issue Body:**
-{issue_body}
+        At most ``max_concurrency`` analyses run at once.
 
-Please provide your analysis in a structured format.
-"""
+        Args:
+            issues: (title, body, labels) for each issue
 
-        return self.query(
-            prompt=prompt,
+        Returns:
+            Responses in the same order as ``issues``
+        """
+        return await self.aquery_many(
+            [
+                self._issue_analysis_prompt(title, body, labels)
+                for title, body, labels in issues
+            ],
             strategy=MultiAgentStrategy.ALL,
             timeout=120,
         )
 
+    def _issue_analysis_prompt(
+        self, issue_title: str, issue_body: str, labels: List[str]
+    ) -> str:
+        """Build the issue analysis prompt."""
+        return self.ISSUE_ANALYSIS_INSTRUCTIONS + self.ISSUE_ANALYSIS_PROMPT.format(
+            issue_title=issue_title,
+            labels=", ".join(labels) if labels else "None",
+            issue_body=issue_body,
+        )
+
     def review_code(
         self,
         code: str,
@@ -485,19 +1768,14 @@ Please provide your analysis in a structured format.
         Returns:
             MultiAgentResponse with review feedback from multiple providers
         """
-        focus = "\n".join([f"- {area}" for area in (focus_areas or [])])
-        default_focus = "- Code quality and best practices\n- Error handling\n- Performance\n- Security\n- Maintainability"
-
-        prompt = f"""Review the following code and provide feedback on:
-{focus if focus else default_focus}
-
-**Code:**
-```python
-{code}
-```
-
-Provide specific suggestions for improvement.
-"""
+        focus = (
+            "\n".join(f"- {area}" for area in focus_areas)
+            if focus_areas
+            else self.DEFAULT_REVIEW_FOCUS
+        )
+        prompt = self.CODE_REVIEW_INSTRUCTIONS + self.CODE_REVIEW_PROMPT.format(
+            focus=focus, code=code
+        )
 
         return self.query(
             prompt=prompt,
@@ -525,33 +1803,12 @@ Provide specific suggestions for improvement.
         Returns:
             PRReviewResult with review feedback from multiple providers
         """
-        prompt = f"""Review the following Pull Request and provide comprehensive feedback.
-
-**PR Number:** #{pr_number}
-
-**PR Description:**
-{pr_description}
-
-**Files Changed:**
-{', '.join(files_changed) if files_changed else 'None'}
-
-**Diff:**
-```diff
-{pr_diff}
-```
-
-Please provide your review covering:
-1. **Overall Assessment**: Approve or request changes (with clear reasoning)
-2. **Code Quality**: Adherence to best practices, readability, maintainability
-3. **Potential Issues**: Bugs, edge cases, security concerns, performance issues
-4. **Specific Feedback**: File-specific and line-specific comments where applicable
-5. **Suggestions**: Concrete improvements or alternatives
-
-Format your response as:
-- **Decision**: APPROVE or CHANGES_REQUESTED
-- **Summary**: Brief overall assessment
-- **Comments**: Specific feedback items with file/line references where possible
-"""
+        prompt = self.PR_REVIEW_INSTRUCTIONS + self.PR_REVIEW_PROMPT.format(
+            pr_number=pr_number,
+            pr_description=pr_description,
+            files_changed=", ".join(files_changed) if files_changed else "None",
+            pr_diff=pr_diff,
+        )
 
         self.logger.info(
             "Requesting PR review from multi-agent-coder",
@@ -564,6 +1821,7 @@ Format your response as:
             prompt=prompt,
             strategy=MultiAgentStrategy.DIALECTICAL,
             timeout=timeout,
+            cache_tags=[f"pr:{pr_number}"],
         )
 
         # Parse review response into structured result
@@ -595,27 +1853,25 @@ Format your response as:
 
         # Aggregate responses from all providers
         all_approvals = []
-        all_comments = []
         summary_parts = []
+        all_comments = list(
+            itertools.chain.from_iterable(
+                self._extract_review_comments(provider_response, provider)
+                for provider, provider_response in response.responses.items()
+            )
+        )
 
         for provider, provider_response in response.responses.items():
             # Check for approval/rejection
-            response_lower = provider_response.lower()
-            is_approved = (
-                "approve" in response_lower
-                and "changes_requested" not in response_lower
-                and "request changes" not in response_lower
-            )
+            is_approved = bool(
+                _APPROVE_RE.search(provider_response)
+            ) and not _REQUEST_CHANGES_RE.search(provider_response)
             all_approvals.append(is_approved)
 
-            # Extract comments
-            comments = self._extract_review_comments(provider_response, provider)
-            all_comments.extend(comments)
-
-            # Add to summary
-            summary_parts.append(
-                f"**{provider.upper()}**: {provider_response[:200]}..."
-            )
+            # Add to summary (truncated to 200 characters)
+            if len(provider_response) > 200:
+                provider_response = provider_response[:200] + "..."
+            summary_parts.append(f"**{provider.upper()}**: {provider_response}")
 
         # Overall approval: require majority approval
         approval_count = sum(all_approvals)
@@ -651,10 +1907,11 @@ Format your response as:
         Returns:
             List of ReviewComment objects
         """
-        comments = []
+        # Providers that failed under the ALL strategy return empty text
+        if not review_text or review_text.isspace():
+            return []
 
-        # Split review into lines
-        lines = review_text.split("\n")
+        comments = []
 
         current_comment: Dict[str, Any] = {
             "message": [],
@@ -662,50 +1919,33 @@ Format your response as:
             "line": None,
             "severity": "info",
         }
+        has_suggestion = False
 
-        for line in lines:
+        for line in review_text.split("\n"):
             line = line.strip()
 
             # Look for file references (e.g., "src/foo.py:42" or "In src/foo.py")
-            if ":" in line and ("src/" in line or "tests/" in line or ".py" in line):
-                # Try to extract file and line
-                parts = line.split(":")
-                if len(parts) >= 2:
-                    file_part = parts[0].strip()
-                    # Extract file path
-                    if "/" in file_part or ".py" in file_part:
-                        current_comment["file"] = file_part.split()[-1]
-                        try:
-                            current_comment["line"] = int(parts[1].split()[0])
-                        except (ValueError, IndexError):
-                            pass
+            file_ref = _FILE_REF_RE.search(line)
+            if file_ref:
+                current_comment["file"] = file_ref.group("file")
+                if file_ref.group("line"):
+                    current_comment["line"] = int(file_ref.group("line"))
 
             # Determine severity
-            line_lower = line.lower()
-            if any(
-                word in line_lower for word in ["critical", "security", "bug", "error"]
-            ):
+            if _ERROR_SEVERITY_RE.search(line):
                 current_comment["severity"] = "error"
-            elif any(word in line_lower for word in ["warning", "concern", "issue"]):
+            elif _WARNING_SEVERITY_RE.search(line):
                 current_comment["severity"] = "warning"
 
             # Collect comment message
             if line and not line.startswith("#"):
                 current_comment["message"].append(line)
+                if not has_suggestion:
+                    has_suggestion = bool(_SUGGESTION_RE.search(line))
 
             # Create comment if we have enough context
             if len(current_comment["message"]) > 2 and (
-                current_comment["file"]
-                or any(
-                    keyword in " ".join(current_comment["message"]).lower()
-                    for keyword in [
-                        "suggest",
-                        "consider",
-                        "should",
-                        "could",
-                        "recommend",
-                    ]
-                )
+                current_comment["file"] or has_suggestion
             ):
                 comments.append(
                     ReviewComment(
@@ -722,6 +1962,7 @@ Format your response as:
                     "line": None,
                     "severity": "info",
                 }
+                has_suggestion = False
 
         # Add final comment if present
         if current_comment["message"]:
@@ -800,22 +2041,20 @@ Format your response as:
             provider_tokens = {}
 
             for provider_name in response.providers:
-                # Map to cost tracker provider enum
-                try:
-                    provider = Provider(provider_name.lower())
-                    provider_costs[provider_name] = cost_per_provider
-                    provider_tokens[provider_name] = {
-                        "input": tokens_per_provider // 2,
-                        "output": tokens_per_provider // 2,
-                    }
-                except ValueError:
-                    # Skip unknown providers
+                # Skip providers the cost tracker doesn't know
+                if provider_name.lower() not in _TRACKED_PROVIDERS:
                     self.logger.warning(
                         "Unknown provider in cost tracking",
                         provider=provider_name,
                     )
                     continue
 
+                provider_costs[provider_name] = cost_per_provider
+                provider_tokens[provider_name] = {
+                    "input": tokens_per_provider // 2,
+                    "output": tokens_per_provider // 2,
+                }
+
             if provider_costs:
                 self.cost_tracker.track_multi_agent_call(
                     provider_costs=provider_costs,
@@ -823,7 +2062,7 @@ Format your response as:
                 )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ReviewComment:
     """A single review comment."""
 
@@ -844,7 +2083,7 @@ class ReviewComment:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PRReviewResult:
     """Result of PR review from multi-agent-coder."""
 
@@ -5,20 +5,82 @@ and configurable event filtering.
 """
 
 import json
-import smtplib
-from collections import defaultdict
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from typing import Any, Dict, List, Optional, Set
-
-import requests
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from html import escape
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from ..core.logger import AuditLogger
 
+# Events and results are created per notification and may sit in the
+# delivery queue in bulk, so skip the per-instance __dict__ where supported
+_DATACLASS_OPTIONS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+# Maximum number of fields in a Slack section block
+SLACK_MAX_FIELDS = 10
+
+# Slack webhook statuses worth retrying (rate limited or server error)
+SLACK_RETRY_STATUSES = (429, 500, 502, 503, 504)
 
-@dataclass
+# Head of the HTML email body, up to the container; only the color varies
+_HTML_HEAD_TEMPLATE = """
+        <html>
+        <head>
+            <style>
+                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
+                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
+                .header {{ background-color: {color}; color: white; padding: 20px; border-radius: 5px 5px 0 0; }}
+                .content {{ background-color: #f9f9f9; padding: 20px; border-radius: 0 0 5px 5px; }}
+                .metadata {{ background-color: white; padding: 15px; border-left: 4px solid {color}; margin: 15px 0; }}
+                .footer {{ text-align: center; margin-top: 20px; color: #666; font-size: 12px; }}
+                .button {{ display: inline-block; padding: 10px 20px; background-color: {color}; color: white; text-decoration: none; border-radius: 5px; margin-top: 10px; }}
+                table {{ width: 100%; border-collapse: collapse; }}
+                td {{ padding: 8px; border-bottom: 1px solid #ddd; }}
+                td:first-child {{ font-weight: bold; width: 40%; }}
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                """
+
+# Emoji prefixed to notification titles, by event severity
+SEVERITY_EMOJI: Dict[str, str] = {
+    "info": "ℹ️",
+    "warning": "⚠️",
+    "error": "❌",
+    "critical": "🚨",
+}
+
+# Most distinct events remembered for duplicate suppression
+DEDUPE_MAX_EVENTS = 512
+
+# Most events listed in a single coalesced notification
+COALESCE_MAX_EVENTS = 50
+
+# Email header/accent colour, by event severity
+SEVERITY_COLORS: Dict[str, str] = {
+    "info": "#3498db",
+    "warning": "#f39c12",
+    "error": "#e74c3c",
+    "critical": "#c0392b",
+}
+
+# Email head rendered once per severity at import
+_HTML_HEAD_BY_SEVERITY: Dict[str, str] = {
+    severity: _HTML_HEAD_TEMPLATE.format(color=color)
+    for severity, color in SEVERITY_COLORS.items()
+}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class NotificationEvent:
     """Represents a notification event."""
 
@@ -29,6 +91,36 @@ class NotificationEvent:
     severity: str = "info"  # info, warning, error, critical
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     link: Optional[str] = None
+    # Rendered channel payloads, reused when the event is delivered again
+    _rendered: Dict[str, Any] = field(
+        default_factory=dict, init=False, compare=False, repr=False
+    )
+
+    @property
+    def formatted_timestamp(self) -> str:
+        """Timestamp as shown in notifications, formatted once per event."""
+        return self.render(
+            "timestamp", lambda e: e.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC")
+        )
+
+    def render(self, key: str, builder: Callable[["NotificationEvent"], Any]) -> Any:
+        """Build a payload for this event once and memoize it under key.
+
+        Events are treated as immutable once sent; mutating one afterwards
+        will not refresh payloads that were already rendered.
+
+        Args:
+            key: Cache key for the payload (e.g. "slack_blocks")
+            builder: Callable producing the payload from the event
+
+        Returns:
+            The cached or freshly built payload
+        """
+        try:
+            return self._rendered[key]
+        except KeyError:
+            value = self._rendered[key] = builder(self)
+            return value
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -43,7 +135,7 @@ class NotificationEvent:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class NotificationResult:
     """Result of notification delivery."""
 
@@ -52,6 +144,7 @@ class NotificationResult:
     event_type: str
     error: Optional[str] = None
     rate_limited: bool = False
+    queued: bool = False
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
     def to_dict(self) -> Dict[str, Any]:
@@ -62,12 +155,28 @@ class NotificationResult:
             "event_type": self.event_type,
             "error": self.error,
             "rate_limited": self.rate_limited,
+            "queued": self.queued,
             "timestamp": self.timestamp.isoformat(),
         }
 
 
 class RateLimiter:
-    """Simple in-memory rate limiter for notifications."""
+    """Token-bucket rate limiter for notifications.
+
+    A global bucket holds up to ``max_per_hour`` tokens and each event type
+    has a bucket of ``max_per_event_per_hour`` tokens. Buckets refill
+    continuously at their hourly rate and every send takes one token from
+    both, so each bucket is just a token count and a refill time. Buckets
+    that have refilled completely are swept away periodically, as they are
+    equivalent to a new one. At most ``MAX_EVENT_BUCKETS`` event types are
+    tracked; past that the least recently recorded bucket is dropped.
+    """
+
+    # Seconds between sweeps of full event buckets
+    SWEEP_INTERVAL = 300
+
+    # Cap on tracked event types, so arbitrary event names can't grow memory
+    MAX_EVENT_BUCKETS = 1024
 
     def __init__(
         self,
@@ -82,8 +191,11 @@ class RateLimiter:
         """
         self.max_per_hour = max_per_hour
         self.max_per_event_per_hour = max_per_event_per_hour
-        self.timestamps: List[datetime] = []
-        self.event_timestamps: Dict[str, List[datetime]] = defaultdict(list)
+
+        # (tokens, monotonic time of last refill)
+        self.bucket: Tuple[float, float] = (float(max_per_hour), time.monotonic())
+        self.event_buckets: Dict[str, Tuple[float, float]] = {}
+        self._last_sweep = time.monotonic()
 
     def is_allowed(self, event_type: str) -> bool:
         """Check if notification is allowed.
@@ -94,21 +206,20 @@ class RateLimiter:
         Returns:
             True if allowed, False if rate limited
         """
-        now = datetime.now(timezone.utc)
-        one_hour_ago = now - timedelta(hours=1)
-
-        # Clean old timestamps
-        self.timestamps = [ts for ts in self.timestamps if ts > one_hour_ago]
-        self.event_timestamps[event_type] = [
-            ts for ts in self.event_timestamps[event_type] if ts > one_hour_ago
-        ]
+        now = time.monotonic()
+        if now - self._last_sweep > self.SWEEP_INTERVAL:
+            self._sweep(now)
 
         # Check total rate limit
-        if len(self.timestamps) >= self.max_per_hour:
+        if self._refill(self.bucket, self.max_per_hour, now) < 1:
             return False
 
         # Check per-event rate limit
-        if len(self.event_timestamps[event_type]) >= self.max_per_event_per_hour:
+        event_bucket = self.event_buckets.get(event_type)
+        if (
+            event_bucket is not None
+            and self._refill(event_bucket, self.max_per_event_per_hour, now) < 1
+        ):
             return False
 
         return True
@@ -119,9 +230,38 @@ class RateLimiter:
         Args:
             event_type: Type of event
         """
-        now = datetime.now(timezone.utc)
-        self.timestamps.append(now)
-        self.event_timestamps[event_type].append(now)
+        now = time.monotonic()
+        self.bucket = (self._refill(self.bucket, self.max_per_hour, now) - 1, now)
+
+        # Pop and re-insert so the dict stays ordered by last use
+        event_bucket = self.event_buckets.pop(event_type, None)
+        if event_bucket is None:
+            event_bucket = (float(self.max_per_event_per_hour), now)
+            if len(self.event_buckets) >= self.MAX_EVENT_BUCKETS:
+                self._sweep(now)
+            while len(self.event_buckets) >= self.MAX_EVENT_BUCKETS:
+                del self.event_buckets[next(iter(self.event_buckets))]
+
+        self.event_buckets[event_type] = (
+            self._refill(event_bucket, self.max_per_event_per_hour, now) - 1,
+            now,
+        )
+
+    def _sweep(self, now: float):
+        """Drop event buckets that have refilled to capacity."""
+        capacity = self.max_per_event_per_hour
+        self.event_buckets = {
+            event_type: bucket
+            for event_type, bucket in self.event_buckets.items()
+            if self._refill(bucket, capacity, now) < capacity
+        }
+        self._last_sweep = now
+
+    @staticmethod
+    def _refill(bucket: Tuple[float, float], capacity: int, now: float) -> float:
+        """Tokens in a bucket at time now, refilling capacity tokens per hour."""
+        tokens, last_refill = bucket
+        return min(capacity, tokens + (now - last_refill) * capacity / 3600)
 
 
 class SlackNotifier:
@@ -134,9 +274,50 @@ class SlackNotifier:
             webhook_url: Slack webhook URL
             logger: Audit logger
         """
+        # Imported here so that loading this module doesn't pull in requests
+        # when Slack isn't configured
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
         self.webhook_url = webhook_url
         self.logger = logger
 
+        # Keep the connection to Slack alive between notifications and let
+        # urllib3 retry rate-limited/failed posts (honouring Retry-After)
+        self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_maxsize=4,
+                max_retries=Retry(
+                    total=2,
+                    backoff_factor=0.3,
+                    status_forcelist=SLACK_RETRY_STATUSES,
+                    allowed_methods=frozenset({"POST"}),
+                    raise_on_status=False,
+                ),
+            ),
+        )
+        self.session.headers["Content-Type"] = "application/json"
+
+    def prepare(self, event: NotificationEvent) -> bytes:
+        """Serialize the Slack webhook body for an event.
+
+        Args:
+            event: Notification event
+
+        Returns:
+            UTF-8 encoded JSON payload
+        """
+        payload = {
+            "text": f"{event.title}",
+            "blocks": self._build_blocks(event),
+        }
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+
     def send(self, event: NotificationEvent) -> NotificationResult:
         """Send notification to Slack.
 
@@ -147,17 +328,12 @@ class SlackNotifier:
             NotificationResult
         """
         try:
-            # Build Slack message with blocks
-            blocks = self._build_blocks(event)
-
-            payload = {
-                "text": f"{event.title}",
-                "blocks": blocks,
-            }
+            # Build and encode the Slack message once per event
+            payload = event.render("slack_payload", self.prepare)
 
-            response = requests.post(
+            response = self.session.post(
                 self.webhook_url,
-                json=payload,
+                data=payload,
                 timeout=10,
             )
 
@@ -209,13 +385,7 @@ class SlackNotifier:
         Returns:
             List of Slack blocks
         """
-        # Severity emoji
-        severity_emoji = {
-            "info": "ℹ️",
-            "warning": "⚠️",
-            "error": "❌",
-            "critical": "🚨",
-        }.get(event.severity, "ℹ️")
+        severity_emoji = SEVERITY_EMOJI.get(event.severity, SEVERITY_EMOJI["info"])
 
         blocks: List[Dict[str, Any]] = [
             {
@@ -234,24 +404,22 @@ class SlackNotifier:
             },
         ]
 
-        # Add metadata fields
+        # Add metadata fields (Slack allows at most 10)
         if event.metadata:
-            fields: List[Dict[str, Any]] = []
-            for key, value in event.metadata.items():
-                fields.append(
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*{key.replace('_', ' ').title()}:*\n{value}",
-                    }
-                )
-
-            if fields:
-                blocks.append(
-                    {
-                        "type": "section",
-                        "fields": fields[:10],  # Slack limit
-                    }
-                )
+            blocks.append(
+                {
+                    "type": "section",
+                    "fields": [
+                        {
+                            "type": "mrkdwn",
+                            "text": f"*{key.replace('_', ' ').title()}:*\n{value}",
+                        }
+                        for key, value in islice(
+                            event.metadata.items(), SLACK_MAX_FIELDS
+                        )
+                    ],
+                }
+            )
 
         # Add link button if available
         if event.link:
@@ -276,7 +444,7 @@ class SlackNotifier:
                 "elements": [
                     {
                         "type": "mrkdwn",
-                        "text": f"Event: `{event.event_type}` | Time: {event.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}",
+                        "text": f"Event: `{event.event_type}` | Time: {event.formatted_timestamp}",
                     }
                 ],
             }
@@ -284,6 +452,10 @@ class SlackNotifier:
 
         return blocks
 
+    def close(self):
+        """Close the HTTP session."""
+        self.session.close()
+
 
 class EmailNotifier:
     """Email notifier with HTML formatting."""
@@ -329,6 +501,11 @@ class EmailNotifier:
         Returns:
             NotificationResult
         """
+        # Imported on first send; most runs never email
+        import smtplib
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.text import MIMEText
+
         try:
             # Build email
             msg = MIMEMultipart("alternative")
@@ -337,11 +514,11 @@ class EmailNotifier:
             msg["To"] = self.to_email
 
             # Plain text version
-            text_content = self._build_text_content(event)
+            text_content = event.render("email_text", self._build_text_content)
             text_part = MIMEText(text_content, "plain")
 
             # HTML version
-            html_content = self._build_html_content(event)
+            html_content = event.render("email_html", self._build_html_content)
             html_part = MIMEText(html_content, "html")
 
             msg.attach(text_part)
@@ -401,7 +578,7 @@ class EmailNotifier:
             "",
             f"Event: {event.event_type}",
             f"Severity: {event.severity.upper()}",
-            f"Time: {event.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}",
+            f"Time: {event.formatted_timestamp}",
             "",
             event.title,
             "-" * 50,
@@ -435,55 +612,35 @@ class EmailNotifier:
         Returns:
             HTML content
         """
-        severity_colors = {
-            "info": "#3498db",
-            "warning": "#f39c12",
-            "error": "#e74c3c",
-            "critical": "#c0392b",
-        }
-        color = severity_colors.get(event.severity, "#3498db")
-
-        html = f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .header {{ background-color: {color}; color: white; padding: 20px; border-radius: 5px 5px 0 0; }}
-                .content {{ background-color: #f9f9f9; padding: 20px; border-radius: 0 0 5px 5px; }}
-                .metadata {{ background-color: white; padding: 15px; border-left: 4px solid {color}; margin: 15px 0; }}
-                .footer {{ text-align: center; margin-top: 20px; color: #666; font-size: 12px; }}
-                .button {{ display: inline-block; padding: 10px 20px; background-color: {color}; color: white; text-decoration: none; border-radius: 5px; margin-top: 10px; }}
-                table {{ width: 100%; border-collapse: collapse; }}
-                td {{ padding: 8px; border-bottom: 1px solid #ddd; }}
-                td:first-child {{ font-weight: bold; width: 40%; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h2 style="margin: 0;">🤖 {event.title}</h2>
-                    <p style="margin: 5px 0 0 0; opacity: 0.9;">Event: {event.event_type}</p>
+        parts = [
+            _HTML_HEAD_BY_SEVERITY.get(event.severity, _HTML_HEAD_BY_SEVERITY["info"]),
+            f"""<div class="header">
+                    <h2 style="margin: 0;">🤖 {escape(event.title)}</h2>
+                    <p style="margin: 5px 0 0 0; opacity: 0.9;">Event: {escape(event.event_type)}</p>
                 </div>
                 <div class="content">
-                    <p>{event.message}</p>
-        """
+                    <p>{escape(event.message)}</p>
+        """,
+        ]
 
         if event.metadata:
-            html += '<div class="metadata"><table>'
-            for key, value in event.metadata.items():
-                html += (
-                    f"<tr><td>{key.replace('_', ' ').title()}</td><td>{value}</td></tr>"
-                )
-            html += "</table></div>"
+            parts.append('<div class="metadata"><table>')
+            parts.extend(
+                f"<tr><td>{escape(key.replace('_', ' ').title())}</td>"
+                f"<td>{escape(str(value))}</td></tr>"
+                for key, value in event.metadata.items()
+            )
+            parts.append("</table></div>")
 
         if event.link:
-            html += f'<p><a href="{event.link}" class="button">View Details</a></p>'
+            parts.append(
+                f'<p><a href="{escape(event.link)}" class="button">View Details</a></p>'
+            )
 
-        html += f"""
+        parts.append(f"""
                     <p style="color: #666; font-size: 12px; margin-top: 20px;">
-                        Severity: {event.severity.upper()} |
-                        Time: {event.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}
+                        Severity: {escape(event.severity.upper())} |
+                        Time: {event.formatted_timestamp}
                     </p>
                 </div>
                 <div class="footer">
@@ -492,9 +649,9 @@ class EmailNotifier:
             </div>
         </body>
         </html>
-        """
+        """)
 
-        return html
+        return "".join(parts)
 
 
 class GitHubCommentNotifier:
@@ -534,7 +691,7 @@ class GitHubCommentNotifier:
                 )
 
             # Build comment
-            comment = self._build_comment(event)
+            comment = event.render("github_comment", self._build_comment)
 
             # Post comment
             issue = self.github_client.repo.get_issue(int(issue_number))
@@ -576,13 +733,7 @@ class GitHubCommentNotifier:
         Returns:
             Markdown comment
         """
-        # Severity emoji
-        severity_emoji = {
-            "info": "ℹ️",
-            "warning": "⚠️",
-            "error": "❌",
-            "critical": "🚨",
-        }.get(event.severity, "ℹ️")
+        severity_emoji = SEVERITY_EMOJI.get(event.severity, SEVERITY_EMOJI["info"])
 
         lines = [
             f"## {severity_emoji} {event.title}",
@@ -605,7 +756,7 @@ class GitHubCommentNotifier:
 
         lines.append("---")
         lines.append(
-            f"*Event: `{event.event_type}` | Time: {event.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}*"
+            f"*Event: `{event.event_type}` | Time: {event.formatted_timestamp}*"
         )
         lines.append("")
         lines.append("🤖 Self-Reflexive Coding Orchestrator")
@@ -613,6 +764,40 @@ class GitHubCommentNotifier:
         return "\n".join(lines)
 
 
+def merge_events(events: List[NotificationEvent]) -> NotificationEvent:
+    """Combine a burst of similar events into a single notification.
+
+    Args:
+        events: Events of the same type, oldest first
+
+    Returns:
+        Event titled after the first one, listing up to
+        ``COALESCE_MAX_EVENTS`` of them, at the highest severity seen
+    """
+    first = events[0]
+    lines = [
+        f"• {event.title}: {event.message}" for event in events[:COALESCE_MAX_EVENTS]
+    ]
+    if len(events) > COALESCE_MAX_EVENTS:
+        lines.append(f"...and {len(events) - COALESCE_MAX_EVENTS} more")
+
+    severities = list(SEVERITY_COLORS)
+    severity = max(
+        (event.severity for event in events),
+        key=lambda s: severities.index(s) if s in severities else 0,
+    )
+
+    return NotificationEvent(
+        event_type=first.event_type,
+        title=f"{first.title} (+{len(events) - 1} similar)",
+        message="\n".join(lines),
+        metadata={**first.metadata, "similar_events": len(events)},
+        severity=severity,
+        timestamp=events[-1].timestamp,
+        link=first.link,
+    )
+
+
 class NotificationManager:
     """Manages multi-channel notifications with filtering and rate limiting."""
 
@@ -625,6 +810,10 @@ class NotificationManager:
         github_client: Optional[Any] = None,
         rate_limit_per_hour: int = 10,
         rate_limit_per_event_per_hour: int = 3,
+        background_workers: int = 0,
+        queue_size: int = 1000,
+        coalesce_window: float = 0.0,
+        dedupe_window: float = 0.0,
     ):
         """Initialize notification manager.
 
@@ -636,9 +825,22 @@ class NotificationManager:
             github_client: GitHub client
             rate_limit_per_hour: Max notifications per hour
             rate_limit_per_event_per_hour: Max per event type per hour
+            background_workers: Worker threads delivering queued notifications;
+                0 delivers inline and returns the channel results
+            queue_size: Max notifications waiting for a background worker
+            coalesce_window: Seconds a background worker keeps collecting
+                queued events so bursts of the same type go out as one
+                message; 0 disables coalescing
+            dedupe_window: Seconds during which an event identical in type,
+                title and message to one already sent is dropped; 0 disables
+                duplicate suppression
         """
         self.logger = logger
         self.enabled_events = enabled_events or set()
+        self.dedupe_window = dedupe_window
+        # (event_type, title, message) -> (monotonic time sent, duplicates
+        # dropped since), least recently seen first
+        self._recent_events: Dict[Tuple[str, str, str], Tuple[float, int]] = {}
         self.rate_limiter = RateLimiter(
             max_per_hour=rate_limit_per_hour,
             max_per_event_per_hour=rate_limit_per_event_per_hour,
@@ -665,6 +867,24 @@ class NotificationManager:
         if github_client:
             self.channels["github"] = GitHubCommentNotifier(github_client, logger)
 
+        # Created on first multi-channel notification
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # Optional background delivery so callers never block on webhooks/SMTP
+        self._queue: Optional[queue.Queue] = None
+        self._coalesce_window = coalesce_window
+        self._workers: List[threading.Thread] = []
+        if background_workers > 0:
+            self._queue = queue.Queue(maxsize=queue_size)
+            for i in range(background_workers):
+                worker = threading.Thread(
+                    target=self._deliver_queued,
+                    name=f"notification-worker-{i}",
+                    daemon=True,
+                )
+                worker.start()
+                self._workers.append(worker)
+
         self.logger.info(
             "notification_manager_initialized",
             channels=list(self.channels.keys()),
@@ -678,6 +898,10 @@ class NotificationManager:
     ) -> List[NotificationResult]:
         """Send notification to specified channels.
 
+        Channels are independent network calls, so when several are targeted
+        they are sent concurrently and the call takes as long as the slowest
+        channel rather than the sum of all of them.
+
         Args:
             event: Notification event
             channels: List of channels to send to (None = all)
@@ -685,15 +909,31 @@ class NotificationManager:
         Returns:
             List of NotificationResults
         """
-        results: List[NotificationResult] = []
-
-        # Check if event is enabled
+        # Check if event is enabled (the common case, so keep it cheap)
         if event.event_type not in self.enabled_events:
-            self.logger.debug(
-                "notification_skipped_disabled",
-                event_type=event.event_type,
-            )
-            return results
+            if self.logger.is_enabled_for("debug"):
+                self.logger.debug(
+                    "notification_skipped_disabled",
+                    event_type=event.event_type,
+                )
+            return []
+
+        # Drop repeats of a recently sent event before they use up rate limit
+        if self.dedupe_window > 0:
+            suppressed = self._check_duplicate(event)
+            if suppressed is None:
+                self.logger.debug(
+                    "notification_skipped_duplicate",
+                    event_type=event.event_type,
+                )
+                return []
+            if suppressed:
+                event = replace(
+                    event,
+                    metadata={**event.metadata, "suppressed_duplicates": suppressed},
+                )
+
+        results: List[NotificationResult] = []
 
         # Check rate limit
         if not self.rate_limiter.is_allowed(event.event_type):
@@ -715,23 +955,179 @@ class NotificationManager:
         # Record notification
         self.rate_limiter.record(event.event_type)
 
-        # Send to channels
-        target_channels = channels or list(self.channels.keys())
+        # Send to channels; every configured channel needs no membership check
+        if not channels:
+            senders = list(self.channels)
+        else:
+            senders = []
+            for channel_name in channels:
+                if channel_name not in self.channels:
+                    self.logger.warning(
+                        "notification_channel_not_configured",
+                        channel=channel_name,
+                    )
+                    continue
+
+                senders.append(channel_name)
+
+        if self._queue is None:
+            results.extend(self._send(event, senders))
+            return results
 
-        for channel_name in target_channels:
-            if channel_name not in self.channels:
-                self.logger.warning(
-                    "notification_channel_not_configured",
-                    channel=channel_name,
+        try:
+            self._queue.put_nowait((event, senders))
+        except queue.Full:
+            self.logger.warning(
+                "notification_queue_full",
+                event_type=event.event_type,
+                queue_size=self._queue.maxsize,
+            )
+            results.append(
+                NotificationResult(
+                    success=False,
+                    channel="all",
+                    event_type=event.event_type,
+                    error="Notification queue full",
                 )
-                continue
-
-            channel = self.channels[channel_name]
-            result = channel.send(event)
-            results.append(result)
+            )
+            return results
 
+        results.extend(
+            NotificationResult(
+                success=True,
+                channel=channel_name,
+                event_type=event.event_type,
+                queued=True,
+            )
+            for channel_name in senders
+        )
         return results
 
+    def _check_duplicate(self, event: NotificationEvent) -> Optional[int]:
+        """Record an event in the dedupe window.
+
+        Args:
+            event: Notification event
+
+        Returns:
+            None if an identical event was sent within the window, otherwise
+            how many duplicates of it were dropped since it was last sent
+        """
+        now = time.monotonic()
+        key = (event.event_type, event.title, event.message)
+
+        # Pop and re-insert so the dict stays ordered by last use
+        entry = self._recent_events.pop(key, None)
+        if entry is not None and now - entry[0] < self.dedupe_window:
+            self._recent_events[key] = (entry[0], entry[1] + 1)
+            return None
+
+        while len(self._recent_events) >= DEDUPE_MAX_EVENTS:
+            del self._recent_events[next(iter(self._recent_events))]
+        self._recent_events[key] = (now, 0)
+        return entry[1] if entry is not None else 0
+
+    def _send(
+        self, event: NotificationEvent, channel_names: List[str]
+    ) -> List[NotificationResult]:
+        """Deliver an event to the named channels, in parallel when several."""
+        senders = [self.channels[name] for name in channel_names]
+        if len(senders) > 1:
+            return list(
+                self._get_executor().map(lambda channel: channel.send(event), senders)
+            )
+        return [channel.send(event) for channel in senders]
+
+    def _deliver_queued(self) -> None:
+        """Worker loop draining the background queue until a None sentinel."""
+        work_queue = self._queue
+        assert work_queue is not None
+        stopping = False
+        while not stopping:
+            batch = [work_queue.get()]
+            if self._coalesce_window > 0:
+                deadline = time.monotonic() + self._coalesce_window
+                while batch[-1] is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(work_queue.get(timeout=remaining))
+                    except queue.Empty:
+                        break
+            stopping = batch[-1] is None
+
+            for event, channel_names in self._coalesce(
+                [item for item in batch if item is not None]
+            ):
+                try:
+                    self._send(event, channel_names)
+                except Exception as e:
+                    self.logger.error("notification_worker_failed", error=str(e))
+
+            for _ in batch:
+                work_queue.task_done()
+
+    @staticmethod
+    def _coalesce(
+        items: List[Tuple[NotificationEvent, List[str]]],
+    ) -> List[Tuple[NotificationEvent, List[str]]]:
+        """Merge queued events sharing a type, channels and issue/PR.
+
+        Args:
+            items: Queued (event, channel names) pairs, oldest first
+
+        Returns:
+            (event, channel names) pairs to deliver, one per group
+        """
+        groups: Dict[Tuple[Any, ...], List[NotificationEvent]] = {}
+        targets: Dict[Tuple[Any, ...], List[str]] = {}
+        for event, channel_names in items:
+            key = (
+                event.event_type,
+                tuple(channel_names),
+                event.metadata.get("issue_number") or event.metadata.get("pr_number"),
+            )
+            groups.setdefault(key, []).append(event)
+            targets.setdefault(key, channel_names)
+
+        return [
+            (events[0] if len(events) == 1 else merge_events(events), targets[key])
+            for key, events in groups.items()
+        ]
+
+    def flush(self) -> None:
+        """Block until every queued notification has been delivered."""
+        if self._queue is not None:
+            self._queue.join()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool used to send to several channels at once."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=len(self.channels),
+                thread_name_prefix="notification",
+            )
+        return self._executor
+
+    def close(self):
+        """Stop background workers, the channel thread pool and channel sessions."""
+        if self._queue is not None:
+            for _ in self._workers:
+                self._queue.put(None)
+            for worker in self._workers:
+                worker.join()
+            self._workers = []
+            self._queue = None
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        for channel in self.channels.values():
+            if hasattr(channel, "close"):
+                channel.close()
+
     def notify_error(
         self,
         title: str,
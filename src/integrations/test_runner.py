@@ -18,6 +18,52 @@ from typing import Any, Dict, List, Optional, Set
 
 from ..core.logger import AuditLogger
 
+# Output parsing patterns, compiled once at import
+# pytest, e.g. "====== 1 failed, 2 passed in 0.50s ======"
+_PYTEST_SUMMARY_RE = re.compile(r"(\d+)\s+failed.*?(\d+)\s+passed.*?in\s+([\d.]+)s")
+_PYTEST_FAILED_COUNT_RE = re.compile(r"(\d+)\s+failed")
+_PYTEST_PASSED_COUNT_RE = re.compile(r"(\d+)\s+passed")
+_PYTEST_TIME_RE = re.compile(r"in\s+([\d.]+)s")
+_PYTEST_FAILURE_RE = re.compile(r"(.*?)::(.*?)\s+FAILED")
+# Underlined test name heading a traceback in the FAILURES section, and the
+# start of whatever follows that traceback
+_PYTEST_SECTION_HEADER_RE = re.compile(
+    r"^_+[^\S\n]*(.+?)[^\S\n]*_+[^\S\n]*$", re.MULTILINE
+)
+_PYTEST_SECTION_END_RE = re.compile(r"\n_+\s*[a-zA-Z]|====")
+_PYTEST_ERROR_LINE_RE = re.compile(r"E\s+(.*?)(?=\n)")
+_PYTEST_LOCATION_ERROR_RE = re.compile(r":\d+:\s+(.+)$", re.MULTILINE)
+
+# unittest, e.g. "Ran 3 tests in 0.001s\nFAILED (failures=1)"
+_UNITTEST_RAN_RE = re.compile(r"Ran\s+(\d+)\s+tests?\s+in\s+([\d.]+)s")
+_UNITTEST_FAILED_RE = re.compile(r"FAILED\s+\(.*?failures?=(\d+)")
+_UNITTEST_FAILURE_RE = re.compile(
+    r"FAIL:\s+(.*?)\s+\((.*?)\)\n(.*?)(?=\n\n|$)", re.DOTALL
+)
+
+# Jest, e.g. "Tests: 1 failed, 2 passed, 3 total"
+_JEST_FAILED_RE = re.compile(r"Tests:.*?(\d+)\s+failed")
+_JEST_PASSED_RE = re.compile(r"(\d+)\s+passed")
+_JEST_TOTAL_RE = re.compile(r"(\d+)\s+total")
+_JEST_TIME_RE = re.compile(r"Time:\s+([\d.]+)\s*s")
+_JEST_FAILURE_RE = re.compile(r"●\s+(.*?)\s+›\s+(.*?)\n\s+(.*?)(?=\n\s+●|$)", re.DOTALL)
+
+# go test, e.g. "--- FAIL: TestName (0.00s)"
+_GOTEST_PASS_RE = re.compile(r"^---\s+PASS:", re.MULTILINE)
+_GOTEST_FAIL_RE = re.compile(r"^---\s+FAIL:", re.MULTILINE)
+_GOTEST_TIME_RE = re.compile(r"FAIL.*?(\d+\.\d+)s")
+_GOTEST_FAILURE_RE = re.compile(
+    r"---\s+FAIL:\s+(.*?)\s+\(([\d.]+)s\)\n\s+(.*?)(?=\n---|$)", re.DOTALL
+)
+
+# RSpec, e.g. "3 examples, 1 failure"
+_RSPEC_EXAMPLES_RE = re.compile(r"(\d+)\s+examples?")
+_RSPEC_FAILURES_RE = re.compile(r"(\d+)\s+failures?")
+_RSPEC_TIME_RE = re.compile(r"Finished in\s+([\d.]+)\s+seconds?")
+_RSPEC_FAILURE_RE = re.compile(
+    r"Failure/Error:\s+(.*?)\n\s+(.*?)(?=\n\s+#|$)", re.DOTALL
+)
+
 
 class TestFramework(Enum):
     """Supported test frameworks."""
@@ -386,9 +432,7 @@ class TestRunner:
 
         # Extract test counts from summary line
         # Example: "====== 1 failed, 2 passed in 0.50s ======"
-        summary_match = re.search(
-            r"(\d+)\s+failed.*?(\d+)\s+passed.*?in\s+([\d.]+)s", output
-        )
+        summary_match = _PYTEST_SUMMARY_RE.search(output)
 
         if summary_match:
             failed = int(summary_match.group(1))
@@ -396,9 +440,9 @@ class TestRunner:
             exec_time = float(summary_match.group(3))
         else:
             # Try alternative format
-            failed_match = re.search(r"(\d+)\s+failed", output)
-            passed_match = re.search(r"(\d+)\s+passed", output)
-            time_match = re.search(r"in\s+([\d.]+)s", output)
+            failed_match = _PYTEST_FAILED_COUNT_RE.search(output)
+            passed_match = _PYTEST_PASSED_COUNT_RE.search(output)
+            time_match = _PYTEST_TIME_RE.search(output)
 
             failed = int(failed_match.group(1)) if failed_match else 0
             passed = int(passed_match.group(1)) if passed_match else 0
@@ -409,8 +453,8 @@ class TestRunner:
         # Extract failures
         # Look for test_file.py::test_name FAILED
         # Format: "tests/test_foo.py::test_two FAILED                                       [ 66%]"
-        failure_pattern = r"(.*?)::(.*?)\s+FAILED"
-        for match in re.finditer(failure_pattern, output):
+        sections = None
+        for match in _PYTEST_FAILURE_RE.finditer(output):
             test_file = match.group(1).strip()
             test_name = match.group(2).strip()
             error_msg = None
@@ -418,23 +462,19 @@ class TestRunner:
             # Try to extract stack trace and error from FAILURES section
             stack_trace = None
             # Look for underlined test name section
-            trace_pattern = (
-                rf"_+\s*{re.escape(test_name)}\s*_+\s*\n(.*?)(?=\n_+\s*[a-zA-Z]|====|$)"
-            )
-            trace_match = re.search(trace_pattern, output, re.DOTALL)
-            if trace_match:
-                stack_trace = trace_match.group(1).strip()
+            if sections is None:
+                sections = self._pytest_failure_sections(output)
+            if test_name in sections:
+                stack_trace = sections[test_name].strip()
                 # Extract error message from stack trace if not in FAILED line
                 if not error_msg:
                     # Look for E       AssertionError or similar
-                    error_match = re.search(r"E\s+(.*?)(?=\n)", stack_trace)
+                    error_match = _PYTEST_ERROR_LINE_RE.search(stack_trace)
                     if error_match:
                         error_msg = error_match.group(1).strip()
                     else:
                         # Look for last line with file:line: error
-                        error_match = re.search(
-                            r":\d+:\s+(.+)$", stack_trace, re.MULTILINE
-                        )
+                        error_match = _PYTEST_LOCATION_ERROR_RE.search(stack_trace)
                         if error_match:
                             error_msg = error_match.group(1).strip()
 
@@ -462,14 +502,36 @@ class TestRunner:
             exit_code=exit_code,
         )
 
+    @staticmethod
+    def _pytest_failure_sections(output: str) -> Dict[str, str]:
+        """Map test names to their traceback in pytest's FAILURES section.
+
+        Scans the output once instead of searching it again for every
+        failed test.
+
+        Args:
+            output: pytest output
+
+        Returns:
+            Dict of test name to the (unstripped) text under its heading
+        """
+        sections: Dict[str, str] = {}
+        for header in _PYTEST_SECTION_HEADER_RE.finditer(output):
+            start = header.end() + 1
+            end = _PYTEST_SECTION_END_RE.search(output, start)
+            sections.setdefault(
+                header.group(1), output[start : end.start() if end else len(output)]
+            )
+        return sections
+
     def _parse_unittest_output(self, output: str, exit_code: int) -> TestResult:
         """Parse unittest output."""
         failures = []
 
         # Extract test counts
         # Example: "Ran 3 tests in 0.001s\nFAILED (failures=1)"
-        ran_match = re.search(r"Ran\s+(\d+)\s+tests?\s+in\s+([\d.]+)s", output)
-        failed_match = re.search(r"FAILED\s+\(.*?failures?=(\d+)", output)
+        ran_match = _UNITTEST_RAN_RE.search(output)
+        failed_match = _UNITTEST_FAILED_RE.search(output)
 
         total_tests = int(ran_match.group(1)) if ran_match else 0
         exec_time = float(ran_match.group(2)) if ran_match else 0.0
@@ -478,8 +540,7 @@ class TestRunner:
 
         # Extract failures
         # Look for FAIL: test_name (module.TestClass)
-        failure_pattern = r"FAIL:\s+(.*?)\s+\((.*?)\)\n(.*?)(?=\n\n|$)"
-        for match in re.finditer(failure_pattern, output, re.DOTALL):
+        for match in _UNITTEST_FAILURE_RE.finditer(output):
             test_name = match.group(1)
             test_class = match.group(2)
             error_msg = match.group(3).strip()
@@ -510,10 +571,10 @@ class TestRunner:
 
         # Extract test counts from Jest summary
         # Example: "Tests: 1 failed, 2 passed, 3 total"
-        failed_match = re.search(r"Tests:.*?(\d+)\s+failed", output)
-        passed_match = re.search(r"(\d+)\s+passed", output)
-        total_match = re.search(r"(\d+)\s+total", output)
-        time_match = re.search(r"Time:\s+([\d.]+)\s*s", output)
+        failed_match = _JEST_FAILED_RE.search(output)
+        passed_match = _JEST_PASSED_RE.search(output)
+        total_match = _JEST_TOTAL_RE.search(output)
+        time_match = _JEST_TIME_RE.search(output)
 
         failed = int(failed_match.group(1)) if failed_match else 0
         passed = int(passed_match.group(1)) if passed_match else 0
@@ -522,8 +583,7 @@ class TestRunner:
 
         # Extract failures
         # Jest format: ● test suite › test name
-        failure_pattern = r"●\s+(.*?)\s+›\s+(.*?)\n\s+(.*?)(?=\n\s+●|$)"
-        for match in re.finditer(failure_pattern, output, re.DOTALL):
+        for match in _JEST_FAILURE_RE.finditer(output):
             test_suite = match.group(1)
             test_name = match.group(2)
             error_msg = match.group(3).strip()
@@ -553,17 +613,16 @@ class TestRunner:
         failures = []
 
         # Count PASS and FAIL lines (but only test results, not final FAIL line)
-        pass_count = len(re.findall(r"^---\s+PASS:", output, re.MULTILINE))
-        fail_count = len(re.findall(r"^---\s+FAIL:", output, re.MULTILINE))
+        pass_count = len(_GOTEST_PASS_RE.findall(output))
+        fail_count = len(_GOTEST_FAIL_RE.findall(output))
 
         # Extract execution time
-        time_match = re.search(r"FAIL.*?(\d+\.\d+)s", output)
+        time_match = _GOTEST_TIME_RE.search(output)
         exec_time = float(time_match.group(1)) if time_match else 0.0
 
         # Extract failures
         # Go format: --- FAIL: TestName (0.00s)
-        failure_pattern = r"---\s+FAIL:\s+(.*?)\s+\(([\d.]+)s\)\n\s+(.*?)(?=\n---|$)"
-        for match in re.finditer(failure_pattern, output, re.DOTALL):
+        for match in _GOTEST_FAILURE_RE.finditer(output):
             test_name = match.group(1)
             error_msg = match.group(3).strip()
 
@@ -593,9 +652,9 @@ class TestRunner:
 
         # Extract test counts
         # Example: "3 examples, 1 failure"
-        examples_match = re.search(r"(\d+)\s+examples?", output)
-        failures_match = re.search(r"(\d+)\s+failures?", output)
-        time_match = re.search(r"Finished in\s+([\d.]+)\s+seconds?", output)
+        examples_match = _RSPEC_EXAMPLES_RE.search(output)
+        failures_match = _RSPEC_FAILURES_RE.search(output)
+        time_match = _RSPEC_TIME_RE.search(output)
 
         total_tests = int(examples_match.group(1)) if examples_match else 0
         failed = int(failures_match.group(1)) if failures_match else 0
@@ -604,8 +663,7 @@ class TestRunner:
 
         # Extract failures
         # RSpec format: Failure/Error: expect(...)
-        failure_pattern = r"Failure/Error:\s+(.*?)\n\s+(.*?)(?=\n\s+#|$)"
-        for match in re.finditer(failure_pattern, output, re.DOTALL):
+        for match in _RSPEC_FAILURE_RE.finditer(output):
             test_code = match.group(1).strip()
             error_msg = match.group(2).strip()
 
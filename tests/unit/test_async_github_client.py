@@ -0,0 +1,402 @@
+"""Unit tests for AsyncGitHubClient."""
+
+import json
+import time
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+
+from src.core.logger import AuditLogger
+from src.integrations.async_github_client import AsyncGitHubClient
+
+
+class TestAsyncGitHubClient(unittest.IsolatedAsyncioTestCase):
+    """Test cases for AsyncGitHubClient."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.logger = Mock(spec=AuditLogger)
+        self.requests = []
+        self.routes = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            key = (request.method, request.url.path)
+            if key not in self.routes:
+                return httpx.Response(404, json={"message": "Not Found"})
+            route = self.routes[key]
+            return route(request) if callable(route) else route
+
+        self.client = AsyncGitHubClient(
+            token="test-token",
+            repository="owner/repo",
+            logger=self.logger,
+            transport=httpx.MockTransport(handler),
+        )
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    async def test_sends_auth_headers(self):
+        """Test that requests carry the token and API media type."""
+        self.routes[("GET", "/repos/owner/repo/issues/1")] = httpx.Response(
+            200, json={"number": 1}
+        )
+
+        issue = await self.client.get_issue(1)
+
+        self.assertEqual(issue["number"], 1)
+        request = self.requests[0]
+        self.assertEqual(request.headers["Authorization"], "Bearer test-token")
+        self.assertEqual(request.headers["Accept"], "application/vnd.github+json")
+
+    async def test_get_issues_builds_search_query(self):
+        """Test issue listing filters PRs and labels server-side."""
+        self.routes[("GET", "/search/issues")] = httpx.Response(
+            200,
+            json={"total_count": 1, "items": [{"number": 1, "labels": []}]},
+        )
+
+        issues = await self.client.get_issues(
+            labels=["bot-approved"], exclude_labels=["wontfix"]
+        )
+
+        self.assertEqual([i["number"] for i in issues], [1])
+        self.assertEqual(
+            self.requests[0].url.params["q"],
+            'repo:owner/repo is:issue is:open label:"bot-approved" -label:"wontfix"',
+        )
+
+    async def test_get_issues_all_states(self):
+        """Test state=all omits the state qualifier."""
+        self.routes[("GET", "/search/issues")] = httpx.Response(
+            200, json={"total_count": 0, "items": []}
+        )
+
+        await self.client.get_issues(state="all")
+
+        self.assertEqual(self.requests[0].url.params["q"], "repo:owner/repo is:issue")
+
+    async def test_create_comment_posts_directly(self):
+        """Test commenting does not fetch the issue first."""
+        self.routes[("POST", "/repos/owner/repo/issues/5/comments")] = httpx.Response(
+            201, json={"id": 1}
+        )
+
+        await self.client.create_comment(5, "hello")
+
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(json.loads(self.requests[0].content), {"body": "hello"})
+
+    async def test_get_pull_requests_batch(self):
+        """Test several PRs are fetched in a single aliased GraphQL query."""
+
+        def graphql(request):
+            body = json.loads(request.content)
+            self.assertIn("pr1: pullRequest(number: 1)", body["query"])
+            self.assertIn("pr2: pullRequest(number: 2)", body["query"])
+            self.assertEqual(body["variables"], {"owner": "owner", "name": "repo"})
+            return httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "repository": {
+                            "pr1": {"number": 1, "title": "One"},
+                            "pr2": None,
+                        }
+                    },
+                    "errors": [{"message": "Could not resolve to a PullRequest"}],
+                },
+            )
+
+        self.routes[("POST", "/graphql")] = graphql
+
+        prs = await self.client.get_pull_requests_batch([1, 2])
+
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(prs[1]["title"], "One")
+        self.assertIsNone(prs[2])
+        self.logger.warning.assert_called_once()
+
+    async def test_get_pr_checks(self):
+        """Test check runs and statuses are combined."""
+        self.routes[("GET", "/repos/owner/repo/pulls/7")] = httpx.Response(
+            200, json={"number": 7, "head": {"sha": "abc123"}}
+        )
+        self.routes[("GET", "/repos/owner/repo/commits/abc123/check-runs")] = (
+            httpx.Response(
+                200,
+                json={
+                    "total_count": 1,
+                    "check_runs": [
+                        {
+                            "name": "tests",
+                            "status": "completed",
+                            "conclusion": "success",
+                            "started_at": "2024-01-01T00:00:00Z",
+                            "completed_at": "2024-01-01T00:05:00Z",
+                        }
+                    ],
+                },
+            )
+        )
+        self.routes[("GET", "/repos/owner/repo/commits/abc123/statuses")] = (
+            httpx.Response(
+                200,
+                json=[{"context": "ci/legacy", "state": "success", "description": ""}],
+            )
+        )
+
+        result = await self.client.get_pr_checks(7)
+
+        self.assertEqual(result["overall"], "passed")
+        self.assertEqual(len(result["checks"]), 2)
+        self.assertEqual(result["checks"][0]["started_at"], "2024-01-01T00:00:00Z")
+
+    async def test_get_pr_checks_failure(self):
+        """Test a failing check run marks the PR as failed."""
+        self.routes[("GET", "/repos/owner/repo/pulls/7")] = httpx.Response(
+            200, json={"number": 7, "head": {"sha": "abc123"}}
+        )
+        self.routes[("GET", "/repos/owner/repo/commits/abc123/check-runs")] = (
+            httpx.Response(
+                200,
+                json={
+                    "total_count": 1,
+                    "check_runs": [
+                        {
+                            "name": "tests",
+                            "status": "completed",
+                            "conclusion": "failure",
+                        }
+                    ],
+                },
+            )
+        )
+        self.routes[("GET", "/repos/owner/repo/commits/abc123/statuses")] = (
+            httpx.Response(200, json=[])
+        )
+
+        result = await self.client.get_pr_checks(7)
+
+        self.assertEqual(result["overall"], "failed")
+
+    async def test_paginated_pages_fetched_from_last_link(self):
+        """Test remaining pages are requested once the last page is known."""
+
+        def issues_page(request):
+            page = int(request.url.params.get("page", 1))
+            headers = {}
+            if page == 1:
+                headers["Link"] = (
+                    '<https://api.github.com/search/issues?page=2>; rel="next", '
+                    '<https://api.github.com/search/issues?page=3>; rel="last"'
+                )
+            return httpx.Response(
+                200, json={"items": [{"number": page}]}, headers=headers
+            )
+
+        self.routes[("GET", "/search/issues")] = issues_page
+
+        issues = await self.client.get_issues()
+
+        self.assertEqual([i["number"] for i in issues], [1, 2, 3])
+        self.assertEqual(len(self.requests), 3)
+        self.assertTrue(all(r.url.params["per_page"] == "100" for r in self.requests))
+
+    async def test_conditional_get_reuses_cached_body(self):
+        """Test a 304 reply returns the previously fetched payload."""
+
+        def pull(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"number": 9}, headers={"ETag": '"v1"'})
+
+        self.routes[("GET", "/repos/owner/repo/pulls/9")] = pull
+
+        first = await self.client.get_pull_request(9)
+        second = await self.client.get_pull_request(9)
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.client.etag_hits, 1)
+        self.assertNotIn("If-None-Match", self.requests[0].headers)
+        self.assertEqual(self.requests[1].headers["If-None-Match"], '"v1"')
+
+    async def test_retries_after_rate_limited_response(self):
+        """Test a 429 with Retry-After is retried after the advertised delay."""
+        replies = [
+            httpx.Response(429, headers={"Retry-After": "2"}),
+            httpx.Response(200, json={"number": 4}),
+        ]
+        self.routes[("GET", "/repos/owner/repo/issues/4")] = lambda r: replies.pop(0)
+
+        with patch(
+            "src.integrations.async_github_client.asyncio.sleep", new=AsyncMock()
+        ) as sleep:
+            issue = await self.client.get_issue(4)
+
+        self.assertEqual(issue["number"], 4)
+        sleep.assert_awaited_once_with(2.0)
+
+    async def test_retries_transient_errors_for_reads(self):
+        """Test GETs are retried after network errors and 503s."""
+        replies = [httpx.ConnectError("boom"), httpx.Response(503)]
+
+        def issue(request):
+            if replies:
+                reply = replies.pop(0)
+                if isinstance(reply, Exception):
+                    raise reply
+                return reply
+            return httpx.Response(200, json={"number": 4})
+
+        self.routes[("GET", "/repos/owner/repo/issues/4")] = issue
+
+        with patch(
+            "src.integrations.async_github_client.asyncio.sleep", new=AsyncMock()
+        ) as sleep:
+            result = await self.client.get_issue(4)
+
+        self.assertEqual(result["number"], 4)
+        self.assertEqual(sleep.await_count, 2)
+
+    async def test_does_not_retry_post_after_read_timeout(self):
+        """Test a POST that may have reached GitHub is not resent."""
+
+        def comment(request):
+            raise httpx.ReadTimeout("slow")
+
+        self.routes[("POST", "/repos/owner/repo/issues/5/comments")] = comment
+
+        with self.assertRaises(httpx.ReadTimeout):
+            await self.client.create_comment(5, "hello")
+
+        self.assertEqual(len(self.requests), 1)
+
+    async def test_waits_for_reset_when_budget_low(self):
+        """Test calls pause until reset once remaining drops below threshold."""
+        reset = time.time() + 30
+        self.routes[("GET", "/repos/owner/repo/issues/4")] = httpx.Response(
+            200,
+            json={"number": 4},
+            headers={
+                "X-RateLimit-Limit": "5000",
+                "X-RateLimit-Remaining": "3",
+                "X-RateLimit-Reset": str(reset),
+                "X-RateLimit-Resource": "core",
+            },
+        )
+
+        with patch(
+            "src.integrations.async_github_client.asyncio.sleep", new=AsyncMock()
+        ) as sleep:
+            await self.client.get_issue(4)
+            sleep.assert_not_awaited()
+            await self.client.get_issue(4)
+
+        sleep.assert_awaited_once()
+        self.assertAlmostEqual(sleep.await_args[0][0], 30, delta=1)
+
+    async def test_get_file_contents(self):
+        """Test file contents are fetched raw and decoded."""
+        self.routes[("GET", "/repos/owner/repo/contents/src/app.py")] = httpx.Response(
+            200,
+            content="print('hi')\n".encode(),
+            headers={"Content-Type": "application/vnd.github.raw; charset=utf-8"},
+        )
+
+        content = await self.client.get_file_contents("src/app.py", ref="main")
+
+        self.assertEqual(content, "print('hi')\n")
+        self.assertEqual(
+            self.requests[0].headers["Accept"], "application/vnd.github.raw"
+        )
+
+    async def test_get_file_contents_rejects_directory(self):
+        """Test a directory listing raises ValueError."""
+        self.routes[("GET", "/repos/owner/repo/contents/src")] = httpx.Response(
+            200, json=[{"type": "file", "name": "app.py"}]
+        )
+
+        with self.assertRaises(ValueError):
+            await self.client.get_file_contents("src")
+
+    async def test_http_error_is_logged_and_raised(self):
+        """Test API errors are logged and re-raised."""
+        with self.assertRaises(httpx.HTTPStatusError):
+            await self.client.get_pull_request(404)
+
+        self.logger.error.assert_called_once()
+
+    async def test_close_issue_with_comment(self):
+        """Test closing posts the comment and the state change."""
+        self.routes[("POST", "/repos/owner/repo/issues/6/comments")] = httpx.Response(
+            201, json={"id": 1}
+        )
+        self.routes[("PATCH", "/repos/owner/repo/issues/6")] = httpx.Response(
+            200, json={"number": 6, "state": "closed"}
+        )
+
+        await self.client.close_issue(6, comment="Done")
+
+        sent = {(r.method, r.url.path): json.loads(r.content) for r in self.requests}
+        self.assertEqual(
+            sent,
+            {
+                ("POST", "/repos/owner/repo/issues/6/comments"): {"body": "Done"},
+                ("PATCH", "/repos/owner/repo/issues/6"): {"state": "closed"},
+            },
+        )
+
+    async def test_close_issue_comment_failure_still_closes(self):
+        """Test a failed comment is logged without failing the close."""
+        self.routes[("POST", "/repos/owner/repo/issues/6/comments")] = httpx.Response(
+            500, json={"message": "Server Error"}
+        )
+        self.routes[("PATCH", "/repos/owner/repo/issues/6")] = httpx.Response(
+            200, json={"number": 6, "state": "closed"}
+        )
+
+        await self.client.close_issue(6, comment="Done")
+
+        self.logger.error.assert_called_once()
+        self.assertEqual(
+            self.logger.error.call_args[0][0], "Failed to comment on issue #6"
+        )
+        self.logger.info.assert_any_call("Closed issue #6", issue_number=6)
+
+    async def test_close_issue_failure_raises(self):
+        """Test a failed close is logged and raised after the comment is sent."""
+        self.routes[("POST", "/repos/owner/repo/issues/6/comments")] = httpx.Response(
+            201, json={"id": 1}
+        )
+        self.routes[("PATCH", "/repos/owner/repo/issues/6")] = httpx.Response(
+            422, json={"message": "Validation Failed"}
+        )
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await self.client.close_issue(6, comment="Done")
+
+        self.logger.error.assert_called_once()
+        self.assertEqual(self.logger.error.call_args[0][0], "Failed to close issue #6")
+
+    async def test_merge_pull_request(self):
+        """Test merging a PR."""
+        self.routes[("GET", "/repos/owner/repo/pulls/3")] = httpx.Response(
+            200, json={"number": 3, "title": "Fix bug"}
+        )
+        self.routes[("PUT", "/repos/owner/repo/pulls/3/merge")] = httpx.Response(
+            200, json={"merged": True, "sha": "def456", "message": "merged"}
+        )
+
+        merged = await self.client.merge_pull_request(3)
+
+        self.assertTrue(merged)
+        self.logger.pr_merged.assert_called_once_with(
+            pr_number=3, pr_title="Fix bug", merge_commit="def456"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,6 +11,7 @@ from src.core.cache import (
     CacheManager,
     GitHubAPICache,
     LLMCache,
+    SemanticCache,
 )
 from src.core.logger import setup_logging
 
@@ -398,5 +399,86 @@ class TestCacheIntegration:
         assert analysis_cache.get_complexity_score("file.py", "new_commit") == 6
 
 
+def _toy_embed(text):
+    """Bag-of-letters embedding for tests."""
+    vector = [0.0] * 26
+    for char in text.lower():
+        if "a" <= char <= "z":
+            vector[ord(char) - ord("a")] += 1.0
+    return vector
+
+
+class TestSemanticCache:
+    """Tests for SemanticCache."""
+
+    def test_similar_text_hits(self, logger):
+        """Test near-duplicate texts share an entry."""
+        cache = SemanticCache(_toy_embed, logger, threshold=0.9)
+        cache.set("Review this pull request", "review")
+
+        assert cache.get("Review this pull request!") == "review"
+        assert cache.get("xyz qqq zzz") is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_namespace_isolation(self, logger):
+        """Test entries only match within their namespace."""
+        cache = SemanticCache(_toy_embed, logger)
+        cache.set("analyze issue", "value", namespace="all|anthropic")
+
+        assert cache.get("analyze issue", namespace="all|anthropic") == "value"
+        assert cache.get("analyze issue", namespace="dialectical|anthropic") is None
+
+    def test_expiration_and_eviction(self, logger):
+        """Test expired entries miss and the oldest entries are evicted."""
+        cache = SemanticCache(_toy_embed, logger, max_entries=2)
+        cache.set("expired", "old", ttl_seconds=-1)
+        assert cache.get("expired") is None
+
+        cache.set("first", 1)
+        cache.set("second", 2)
+        cache.set("third", 3)
+        assert len(cache.entries) == 2
+        assert cache.get("first") is None
+        assert cache.get("third") == 3
+
+    def test_invalidate_by_tags(self, logger):
+        """Test tagged entries can be invalidated."""
+        cache = SemanticCache(_toy_embed, logger)
+        cache.set("review pr", "a", tags=["pr:1"])
+        cache.set("analyze issue", "b")
+
+        cache.invalidate_by_tags(["pr:1"])
+
+        assert cache.get("review pr") is None
+        assert cache.get("analyze issue") == "b"
+
+    def test_embedding_reused_for_same_text(self, logger):
+        """Test a miss followed by set() embeds the text once."""
+        calls = []
+
+        def embed(text):
+            calls.append(text)
+            return _toy_embed(text)
+
+        cache = SemanticCache(embed, logger)
+        assert cache.get("prompt") is None
+        cache.set("prompt", "value")
+
+        assert calls == ["prompt"]
+
+    def test_persistence(self, temp_cache_dir, logger):
+        """Test entries persisted to a cache file are reloaded."""
+        cache_file = temp_cache_dir / "semantic.cache"
+        cache = SemanticCache(_toy_embed, logger, cache_file=cache_file)
+        cache.set("update dependency requests", "bump", namespace="all")
+        cache.set("expired", "old", ttl_seconds=-1)
+
+        reloaded = SemanticCache(_toy_embed, logger, cache_file=cache_file)
+
+        assert len(reloaded.entries) == 1
+        assert reloaded.get("update dependency requests!", namespace="all") == "bump"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
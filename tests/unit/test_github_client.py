@@ -0,0 +1,47 @@
+"""Unit tests for GitHub client helpers."""
+
+import unittest
+
+from src.integrations.github_client import compute_overall_check_status
+
+
+class TestComputeOverallCheckStatus(unittest.TestCase):
+    """Test cases for compute_overall_check_status."""
+
+    def test_no_checks(self):
+        """Test an empty check list."""
+        self.assertEqual(compute_overall_check_status([]), "no_checks")
+
+    def test_failure_wins(self):
+        """Test any failure marks the whole run failed."""
+        checks = [
+            {"status": "in_progress", "conclusion": None},
+            {"status": "completed", "conclusion": "failure"},
+        ]
+        self.assertEqual(compute_overall_check_status(checks), "failed")
+
+    def test_passed(self):
+        """Test passing conclusions and successful statuses."""
+        checks = [
+            {"status": "completed", "conclusion": "success"},
+            {"status": "completed", "conclusion": "skipped"},
+            {"status": "success", "conclusion": None},
+        ]
+        self.assertEqual(compute_overall_check_status(checks), "passed")
+
+    def test_pending(self):
+        """Test running checks without failures are pending."""
+        checks = [
+            {"status": "completed", "conclusion": "success"},
+            {"status": "queued", "conclusion": None},
+        ]
+        self.assertEqual(compute_overall_check_status(checks), "pending")
+
+    def test_unknown(self):
+        """Test unrecognised conclusions fall through to unknown."""
+        checks = [{"status": "completed", "conclusion": "cancelled"}]
+        self.assertEqual(compute_overall_check_status(checks), "unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,14 @@
 """Unit tests for MultiAgentCoderClient."""
 
+import io
+import json
+import os
+import signal
 import subprocess
+import sys
+import tempfile
 import unittest
+from dataclasses import asdict
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
@@ -15,6 +22,15 @@ from src.integrations.multi_agent_coder_client import (
 )
 
 
+def _fake_process(stdout: str, stderr: str = "") -> MagicMock:
+    """Build a mock Popen process that produces the given output."""
+    process = MagicMock()
+    process.stdout = io.StringIO(stdout)
+    process.stderr = io.StringIO(stderr)
+    process.wait.return_value = 0
+    return process
+
+
 class TestMultiAgentCoderClient(unittest.TestCase):
     """Test cases for MultiAgentCoderClient."""
 
@@ -47,12 +63,12 @@ class TestMultiAgentCoderClient(unittest.TestCase):
                     logger=self.logger,
                 )
 
-    @patch("subprocess.run")
-    def test_query_success(self, mock_run):
+    @patch("subprocess.Popen")
+    def test_query_success(self, mock_popen):
         """Test successful query execution."""
         # Mock successful subprocess execution
-        mock_result = MagicMock()
-        mock_result.stdout = """
+        mock_popen.return_value = _fake_process(
+            """
 ╔═══ ANTHROPIC ═══╗
 This is a test response from Anthropic.
 Analysis indicates this is a bug with complexity 7.
@@ -60,18 +76,17 @@ Analysis indicates this is a bug with complexity 7.
 ╔═══ DEEPSEEK ═══╗
 DeepSeek response here.
 Complexity score: 6
-"""
-        mock_result.stderr = "7121 tokens, $0.0656"
-        mock_run.return_value = mock_result
+""",
+            "7121 tokens, $0.0656",
+        )
 
         response = self.client.query("Test prompt", timeout=60)
 
         # Verify subprocess call
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args
+        mock_popen.assert_called_once()
+        call_args = mock_popen.call_args
         self.assertIn("Test prompt", call_args[0][0])
-        self.assertEqual(call_args[1]["timeout"], 60)
-        self.assertTrue(call_args[1]["capture_output"])
+        self.assertEqual(call_args[1]["stdout"], subprocess.PIPE)
 
         # Verify response
         self.assertTrue(response.success)
@@ -83,10 +98,10 @@ Complexity score: 6
         # Verify statistics updated
         self.assertEqual(self.client.total_calls, 1)
 
-    @patch("subprocess.run")
-    def test_query_timeout(self, mock_run):
+    @patch("subprocess.Popen")
+    def test_query_timeout(self, mock_popen):
         """Test query timeout handling."""
-        mock_run.side_effect = subprocess.TimeoutExpired(cmd=["test"], timeout=60)
+        mock_popen.side_effect = subprocess.TimeoutExpired(cmd=["test"], timeout=60)
 
         response = self.client.query("Test prompt", timeout=60)
 
@@ -94,10 +109,10 @@ Complexity score: 6
         self.assertIsNotNone(response.error)
         self.assertIn("timed out", response.error.lower())
 
-    @patch("subprocess.run")
-    def test_query_process_error(self, mock_run):
+    @patch("subprocess.Popen")
+    def test_query_process_error(self, mock_popen):
         """Test query process error handling."""
-        mock_run.side_effect = subprocess.CalledProcessError(
+        mock_popen.side_effect = subprocess.CalledProcessError(
             returncode=1, cmd=["test"], stderr="Error executing multi_agent_coder"
         )
 
@@ -160,6 +175,42 @@ Error: Invalid API key or authentication failed
         self.assertGreater(response.total_tokens, 7000)
         self.assertAlmostEqual(response.total_cost, 0.0656, places=4)
 
+    def test_parse_output_json(self):
+        """Test parsing --format json output, with text fallback."""
+        self.client.json_output = True
+        stdout = json.dumps(
+            {
+                "providers": ["Anthropic", "OpenAI"],
+                "responses": {"Anthropic": "A", "OpenAI": "B"},
+                "tokens": 1200,
+                "cost": 0.02,
+                "cache_read_input_tokens": 900,
+            }
+        )
+
+        response = self.client._parse_output(stdout, "")
+
+        self.assertTrue(response.success)
+        self.assertEqual(response.providers, ["anthropic", "openai"])
+        self.assertEqual(response.responses, {"anthropic": "A", "openai": "B"})
+        self.assertEqual(response.total_tokens, 1200)
+        self.assertEqual(response.total_cost, 0.02)
+        self.assertEqual(response.cache_read_tokens, 900)
+        self.assertEqual(response.cache_creation_tokens, 0)
+
+        fallback = self.client._parse_output("╔═══ ANTHROPIC ═══╗\nText\n", "5 tokens")
+        self.assertEqual(fallback.responses, {"anthropic": "Text"})
+        self.assertEqual(fallback.total_tokens, 5)
+
+    def test_parse_output_bare_rule(self):
+        """Test a header-like rule without a provider name adds no provider."""
+        response = self.client._parse_output(
+            "╔═══ ANTHROPIC ═══╗\nAnswer\n══════════\nTrailer\n", ""
+        )
+
+        self.assertEqual(response.providers, ["anthropic"])
+        self.assertEqual(response.responses, {"anthropic": "Answer\n\nTrailer"})
+
     def test_parse_output_no_providers(self):
         """Test parsing output with no valid providers."""
         stdout = "No provider headers found"
@@ -171,18 +222,64 @@ Error: Invalid API key or authentication failed
         self.assertEqual(len(response.responses), 0)
         self.assertFalse(response.success)
 
-    @patch("subprocess.run")
-    def test_analyze_issue(self, mock_run):
+    @patch("subprocess.Popen")
+    def test_query_nonzero_exit_without_output(self, mock_popen):
+        """Test a CLI failing without output returns an error response."""
+        process = _fake_process("", "Error: unknown provider")
+        process.wait.return_value = 1
+        mock_popen.return_value = process
+
+        response = self.client.query("Test prompt", use_cache=False)
+
+        self.assertFalse(response.success)
+        self.assertIn("unknown provider", response.error)
+
+    @patch("subprocess.Popen")
+    def test_stream_query(self, mock_popen):
+        """Test provider responses are yielded as each section completes."""
+        stdout = "╔═══ ANTHROPIC ═══╗\nFirst\n╔═══ DEEPSEEK ═══╗\nSecond\n"
+        process = _fake_process(stdout, "30 tokens")
+        mock_popen.return_value = process
+
+        stream = self.client.stream_query("Test prompt")
+
+        self.assertEqual(next(stream), ("anthropic", "First"))
+        self.assertLess(process.stdout.tell(), len(stdout))
+        self.assertEqual(list(stream), [("deepseek", "Second")])
+        self.assertEqual(self.client.total_calls, 1)
+        self.assertEqual(self.client.total_tokens, 30)
+
+    @patch("subprocess.Popen")
+    def test_stream_query_stop_after(self, mock_popen):
+        """Test streaming stops and kills the CLI after enough responses."""
+        process = _fake_process(
+            "╔═══ ANTHROPIC ═══╗\nA\n╔═══ DEEPSEEK ═══╗\nB\n╔═══ OPENAI ═══╗\nC\n"
+        )
+        process.poll.return_value = None
+        mock_popen.return_value = process
+
+        sections = list(
+            self.client.stream_query(
+                "Test prompt", strategy=MultiAgentStrategy.DIALECTICAL, stop_after=2
+            )
+        )
+
+        self.assertEqual(sections, [("anthropic", "A"), ("deepseek", "B")])
+        process.kill.assert_called_once()
+        self.assertEqual(self.client.provider_usage["openai"], 0)
+
+    @patch("subprocess.Popen")
+    def test_analyze_issue(self, mock_popen):
         """Test issue analysis method."""
-        mock_result = MagicMock()
-        mock_result.stdout = """
+        mock_popen.return_value = _fake_process(
+            """
 ╔═══ ANTHROPIC ═══╗
 Issue Type: BUG
 Complexity Score: 7
 Actionability: yes
-"""
-        mock_result.stderr = "5000 tokens, $0.04"
-        mock_run.return_value = mock_result
+""",
+            "5000 tokens, $0.04",
+        )
 
         response = self.client.analyze_issue(
             issue_title="Test bug",
@@ -191,7 +288,7 @@ Actionability: yes
         )
 
         # Verify prompt construction
-        call_args = mock_run.call_args[0][0]
+        call_args = mock_popen.call_args[0][0]
         prompt = call_args[-1]
         self.assertIn("Test bug", prompt)
         self.assertIn("Bug description", prompt)
@@ -202,16 +299,16 @@ Actionability: yes
         # Verify response
         self.assertTrue(response.success)
 
-    @patch("subprocess.run")
-    def test_review_code(self, mock_run):
+    @patch("subprocess.Popen")
+    def test_review_code(self, mock_popen):
         """Test code review method."""
-        mock_result = MagicMock()
-        mock_result.stdout = """
+        mock_popen.return_value = _fake_process(
+            """
 ╔═══ ANTHROPIC ═══╗
 Code review feedback here.
-"""
-        mock_result.stderr = "3000 tokens, $0.03"
-        mock_run.return_value = mock_result
+""",
+            "3000 tokens, $0.03",
+        )
 
         code = "def hello():\n    print('world')"
         response = self.client.review_code(
@@ -220,7 +317,7 @@ Code review feedback here.
         )
 
         # Verify prompt construction
-        call_args = mock_run.call_args[0][0]
+        call_args = mock_popen.call_args[0][0]
         prompt = call_args[-1]
         self.assertIn(code, prompt)
         self.assertIn("security", prompt)
@@ -264,13 +361,13 @@ Code review feedback here.
         self.assertEqual(self.client.total_cost, 0.0)
         self.assertEqual(len(self.client.provider_usage), 0)
 
-    @patch("subprocess.run")
-    def test_query_with_custom_strategy(self, mock_run):
+    @patch("subprocess.Popen")
+    def test_query_with_custom_strategy(self, mock_popen):
         """Test query with custom strategy."""
-        mock_result = MagicMock()
-        mock_result.stdout = "╔═══ ANTHROPIC ═══╗\nResponse"
-        mock_result.stderr = "1000 tokens, $0.01"
-        mock_run.return_value = mock_result
+        mock_popen.return_value = _fake_process(
+            "╔═══ ANTHROPIC ═══╗\nResponse",
+            "1000 tokens, $0.01",
+        )
 
         self.client.query(
             "Test prompt",
@@ -278,18 +375,18 @@ Code review feedback here.
         )
 
         # Verify strategy in command
-        call_args = mock_run.call_args[0][0]
+        call_args = mock_popen.call_args[0][0]
         self.assertIn("-s", call_args)
         strategy_idx = call_args.index("-s") + 1
         self.assertEqual(call_args[strategy_idx], "sequential")
 
-    @patch("subprocess.run")
-    def test_query_with_provider_filter(self, mock_run):
+    @patch("subprocess.Popen")
+    def test_query_with_provider_filter(self, mock_popen):
         """Test query with provider filtering."""
-        mock_result = MagicMock()
-        mock_result.stdout = "╔═══ ANTHROPIC ═══╗\nResponse"
-        mock_result.stderr = "1000 tokens, $0.01"
-        mock_run.return_value = mock_result
+        mock_popen.return_value = _fake_process(
+            "╔═══ ANTHROPIC ═══╗\nResponse",
+            "1000 tokens, $0.01",
+        )
 
         self.client.query(
             "Test prompt",
@@ -297,11 +394,202 @@ Code review feedback here.
         )
 
         # Verify providers in command
-        call_args = mock_run.call_args[0][0]
+        call_args = mock_popen.call_args[0][0]
         self.assertIn("-p", call_args)
         providers_idx = call_args.index("-p") + 1
         self.assertEqual(call_args[providers_idx], "anthropic,deepseek")
 
+    @patch("subprocess.run")
+    def test_query_batch(self, mock_run):
+        """Test several prompts are sent in one batch invocation."""
+        mock_result = MagicMock()
+        mock_result.stdout = """===REC 0===
+╔═══ ANTHROPIC ═══╗
+First answer
+Tokens: 10 tokens
+===REC 1===
+╔═══ ANTHROPIC ═══╗
+Second answer
+Tokens: 20 tokens
+"""
+        mock_result.stderr = ""
+        mock_run.return_value = mock_result
+
+        responses = self.client.query_batch(["first", "second"])
+
+        mock_run.assert_called_once()
+        cmd = mock_run.call_args[0][0]
+        self.assertIn("--batch", cmd)
+        sent = mock_run.call_args[1]["input"].split("\n")
+        self.assertEqual(
+            [json.loads(line) for line in sent],
+            [{"id": 0, "prompt": "first"}, {"id": 1, "prompt": "second"}],
+        )
+        self.assertIn("First answer", responses[0].responses["anthropic"])
+        self.assertEqual(responses[1].total_tokens, 20)
+        self.assertEqual(self.client.total_calls, 2)
+
+    @patch("subprocess.Popen")
+    def test_query_semantic_cache(self, mock_popen):
+        """Test similar prompts are answered from the semantic cache."""
+        semantic_cache = Mock()
+        semantic_cache.get.side_effect = [None, "cached"]
+        self.client.semantic_cache = semantic_cache
+        mock_popen.return_value = _fake_process(
+            "╔═══ ANTHROPIC ═══╗\nAnswer\n",
+            "",
+        )
+
+        first = self.client.query("Test prompt", providers=["anthropic"])
+        second = self.client.query("Test prompt, please", providers=["anthropic"])
+
+        mock_popen.assert_called_once()
+        semantic_cache.set.assert_called_once_with(
+            "Test prompt",
+            first,
+            namespace="all|anthropic",
+            ttl_seconds=86400,
+            tags=["multi_agent"],
+        )
+        self.assertEqual(second, "cached")
+        self.assertEqual(self.client.cache_hits, 1)
+
+    def test_compute_ttl(self):
+        """Test cache lifetimes depend on strategy and prompt content."""
+        response = Mock()
+        compute_ttl = self.client._compute_ttl
+
+        self.assertEqual(
+            compute_ttl("Review this code", MultiAgentStrategy.DIALECTICAL, response),
+            7 * 86400,
+        )
+        self.assertEqual(
+            compute_ttl("Analyze this issue", MultiAgentStrategy.ALL, response), 86400
+        )
+        self.assertEqual(
+            compute_ttl("What changed today?", MultiAgentStrategy.ALL, response), 3600
+        )
+        self.assertEqual(
+            compute_ttl(
+                "Deadline 2024-01-31", MultiAgentStrategy.DIALECTICAL, response
+            ),
+            3600,
+        )
+
+    @patch("subprocess.Popen")
+    def test_review_pull_request_cache_invalidation(self, mock_popen):
+        """Test PR reviews are tagged with the PR number and can be invalidated."""
+        self.client.llm_cache = Mock()
+        self.client.llm_cache.cache.get.return_value = None
+        mock_popen.return_value = _fake_process(
+            "╔═══ ANTHROPIC ═══╗\nDecision: APPROVE\n",
+            "",
+        )
+
+        self.client.review_pull_request("diff", "desc", ["a.py"], pr_number=42)
+
+        set_kwargs = self.client.llm_cache.cache.set.call_args[1]
+        self.assertEqual(set_kwargs["tags"], ["multi_agent", "pr:42"])
+        self.assertEqual(set_kwargs["ttl_seconds"], 7 * 86400)
+
+        self.client.invalidate_pr(42)
+        self.client.llm_cache.cache.invalidate_by_tags.assert_called_once_with(
+            ["pr:42"]
+        )
+
+    @patch("subprocess.Popen")
+    def test_query_over_budget(self, mock_popen):
+        """Test queries whose prompt cost exceeds the budget are not dispatched."""
+        self.client.cost_tracker = Mock()
+        self.client.cost_tracker.estimate_multi_agent_cost.return_value = 1.0
+        self.client.cost_tracker.can_afford_operation.return_value = False
+
+        response = self.client.query("x" * 400, providers=["anthropic", "openai"])
+
+        mock_popen.assert_not_called()
+        self.assertFalse(response.success)
+        self.assertIn("budget", response.error)
+        self.client.cost_tracker.estimate_multi_agent_cost.assert_called_once_with(
+            100, 0, num_providers=2
+        )
+
+    def test_build_command(self):
+        """Test default and overridden strategy/providers produce the right argv."""
+        self.assertEqual(
+            self.client._build_command("p", MultiAgentStrategy.ALL, []),
+            [self.executable_path, "-s", "all", "p"],
+        )
+        self.assertEqual(
+            self.client._build_command(
+                "p", MultiAgentStrategy.DIALECTICAL, ["anthropic", "openai"]
+            ),
+            [self.executable_path, "-s", "dialectical", "-p", "anthropic,openai", "p"],
+        )
+
+    def test_build_command_prompt_caching(self):
+        """Test registered prompt prefixes are sent as a cacheable system prompt."""
+        with patch.object(Path, "exists", return_value=True):
+            client = MultiAgentCoderClient(
+                multi_agent_coder_path=self.executable_path,
+                logger=self.logger,
+                prompt_caching=True,
+            )
+        prompt = client._issue_analysis_prompt("Title", "Body", [])
+
+        cmd = client._build_command(prompt, MultiAgentStrategy.ALL, [])
+
+        self.assertEqual(cmd[-4], "--system-prompt")
+        self.assertEqual(cmd[-2], "--cache-system")
+        self.assertTrue(cmd[-1].startswith("**Issue Title:** Title"))
+        with open(cmd[-3], encoding="utf-8") as f:
+            self.assertEqual(f.read(), client.ISSUE_ANALYSIS_INSTRUCTIONS)
+
+        review_cmd = client._build_command(
+            client.PR_REVIEW_INSTRUCTIONS + "**PR Number:** #7\n",
+            MultiAgentStrategy.ALL,
+            [],
+        )
+        self.assertNotEqual(review_cmd[-3], cmd[-3])
+        self.assertEqual(review_cmd[-1], "**PR Number:** #7\n")
+
+        # Unrelated prompts and clients without caching pass the prompt as-is
+        self.assertEqual(
+            client._build_command("p", MultiAgentStrategy.ALL, [])[-1], "p"
+        )
+        self.assertEqual(
+            self.client._build_command(prompt, MultiAgentStrategy.ALL, [])[-1], prompt
+        )
+
+        prefix_file = cmd[-3]
+        client.close()
+        self.assertFalse(os.path.exists(prefix_file))
+
+    def test_cache_key(self):
+        """Test cache keys ignore provider order but not strategy or prompt."""
+        key = self.client._cache_key(
+            "prompt", MultiAgentStrategy.ALL, ["openai", "anthropic"]
+        )
+
+        self.assertTrue(key.startswith("multi_agent:"))
+        self.assertEqual(
+            key,
+            self.client._cache_key(
+                "prompt", MultiAgentStrategy.ALL, ["anthropic", "openai"]
+            ),
+        )
+        self.assertNotEqual(
+            key,
+            self.client._cache_key(
+                "prompt", MultiAgentStrategy.DIALECTICAL, ["anthropic", "openai"]
+            ),
+        )
+        self.assertNotEqual(
+            key,
+            self.client._cache_key(
+                "other", MultiAgentStrategy.ALL, ["anthropic", "openai"]
+            ),
+        )
+
     def test_response_dataclass(self):
         """Test MultiAgentResponse dataclass."""
         response = MultiAgentResponse(
@@ -319,6 +607,7 @@ Code review feedback here.
         self.assertEqual(response_dict["total_tokens"], 5000)
         self.assertEqual(response_dict["total_cost"], 0.05)
         self.assertTrue(response_dict["success"])
+        self.assertEqual(response_dict, asdict(response))
 
     def test_strategy_enum(self):
         """Test MultiAgentStrategy enum."""
@@ -326,11 +615,11 @@ Code review feedback here.
         self.assertEqual(MultiAgentStrategy.SEQUENTIAL.value, "sequential")
         self.assertEqual(MultiAgentStrategy.DIALECTICAL.value, "dialectical")
 
-    @patch("subprocess.run")
-    def test_review_pull_request_success(self, mock_run):
+    @patch("subprocess.Popen")
+    def test_review_pull_request_success(self, mock_popen):
         """Test successful PR review."""
-        mock_result = MagicMock()
-        mock_result.stdout = """
+        mock_popen.return_value = _fake_process(
+            """
 ╔═══ ANTHROPIC ═══╗
 **Decision**: APPROVE
 **Summary**: The code looks good overall with solid error handling.
@@ -343,9 +632,9 @@ Code review feedback here.
 **Summary**: Implementation follows best practices.
 **Comments**:
 - src/foo.py:50: Performance could be improved with caching
-"""
-        mock_result.stderr = "8000 tokens, $0.08"
-        mock_run.return_value = mock_result
+""",
+            "8000 tokens, $0.08",
+        )
 
         pr_diff = "diff --git a/src/foo.py b/src/foo.py\n+new code"
         files_changed = ["src/foo.py", "tests/test_foo.py"]
@@ -359,7 +648,7 @@ Code review feedback here.
         )
 
         # Verify prompt construction
-        call_args = mock_run.call_args[0][0]
+        call_args = mock_popen.call_args[0][0]
         prompt = call_args[-1]
         self.assertIn("#123", prompt)
         self.assertIn("Add new feature", prompt)
@@ -375,11 +664,11 @@ Code review feedback here.
         self.assertIn("deepseek", review_result.providers_reviewed)
         self.assertGreater(len(review_result.comments), 0)
 
-    @patch("subprocess.run")
-    def test_review_pull_request_changes_requested(self, mock_run):
+    @patch("subprocess.Popen")
+    def test_review_pull_request_changes_requested(self, mock_popen):
         """Test PR review with changes requested."""
-        mock_result = MagicMock()
-        mock_result.stdout = """
+        mock_popen.return_value = _fake_process(
+            """
 ╔═══ ANTHROPIC ═══╗
 **Decision**: CHANGES_REQUESTED
 **Summary**: Security vulnerability found in authentication code.
@@ -389,9 +678,9 @@ Code review feedback here.
 ╔═══ OPENAI ═══╗
 **Decision**: APPROVE
 **Summary**: Code structure is good.
-"""
-        mock_result.stderr = "6000 tokens, $0.06"
-        mock_run.return_value = mock_result
+""",
+            "6000 tokens, $0.06",
+        )
 
         review_result = self.client.review_pull_request(
             pr_diff="diff content",
@@ -425,6 +714,10 @@ Code review feedback here.
         self.assertEqual(result.approval_count, 2)
         self.assertEqual(result.total_reviewers, 2)
         self.assertEqual(result.pr_number, 123)
+        self.assertIn(
+            "**ANTHROPIC**: **Decision**: APPROVE\nLooks good!\n", result.summary
+        )
+        self.assertNotIn("...", result.summary)
 
     def test_parse_pr_review_rejection(self):
         """Test parsing PR review for rejection."""
@@ -489,6 +782,26 @@ The code could benefit from more comprehensive error handling.
         for comment in comments:
             self.assertEqual(comment.provider, "openai")
 
+    def test_extract_review_comments_file_line_and_severity(self):
+        """Test file references, line numbers and severity are captured."""
+        review_text = """
+In src/foo.py:42 the loop has a bug
+when the list is empty.
+You should guard against it.
+"""
+
+        comments = self.client._extract_review_comments(review_text, "anthropic")
+
+        self.assertEqual(len(comments), 1)
+        self.assertEqual(comments[0].file, "src/foo.py")
+        self.assertEqual(comments[0].line, 42)
+        self.assertEqual(comments[0].severity, "error")
+
+    def test_extract_review_comments_empty(self):
+        """Test empty review text yields no comments."""
+        self.assertEqual(self.client._extract_review_comments("", "openai"), [])
+        self.assertEqual(self.client._extract_review_comments("\n  \n", "openai"), [])
+
     def test_review_comment_dataclass(self):
         """Test ReviewComment dataclass."""
         comment = ReviewComment(
@@ -538,5 +851,210 @@ The code could benefit from more comprehensive error handling.
         self.assertIn("reviewed_at", result_dict)
 
 
+FAKE_WORKER = """#!{python}
+import json, os, struct, sys
+
+assert sys.argv[1:] == ["--server"]
+stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+while True:
+    header = stdin.read(4)
+    if not header:
+        break
+    request = json.loads(stdin.read(struct.unpack(">I", header)[0]))
+    reply = json.dumps({{
+        "id": request["id"],
+        "stdout": "╔═══ ANTHROPIC ═══╗\\npid %d: %s" % (os.getpid(), request["prompt"]),
+        "stderr": "Tokens: 100 tokens",
+    }}).encode()
+    stdout.write(struct.pack(">I", len(reply)) + reply)
+    stdout.flush()
+"""
+
+
+class TestMultiAgentCoderPersistentWorker(unittest.TestCase):
+    """Test cases for the persistent worker mode."""
+
+    def setUp(self):
+        """Set up a fake multi_agent_coder speaking the worker protocol."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.executable_path = os.path.join(self.tmpdir.name, "multi_agent_coder")
+        with open(self.executable_path, "w") as f:
+            f.write(FAKE_WORKER.format(python=sys.executable))
+        os.chmod(self.executable_path, 0o755)
+
+        self.client = MultiAgentCoderClient(
+            multi_agent_coder_path=self.executable_path,
+            logger=Mock(spec=AuditLogger),
+            persistent_worker=True,
+        )
+
+    def tearDown(self):
+        self.client.close()
+        self.tmpdir.cleanup()
+
+    def test_queries_reuse_one_worker(self):
+        """Test consecutive queries are answered by the same process."""
+        first = self.client.query("first prompt", use_cache=False)
+        second = self.client.query("second prompt", use_cache=False)
+
+        self.assertTrue(first.success)
+        self.assertIn("first prompt", first.responses["anthropic"])
+        self.assertIn("second prompt", second.responses["anthropic"])
+        self.assertEqual(first.total_tokens, 100)
+
+        pid = self.client._worker.pid
+        self.assertIn(f"pid {pid}:", first.responses["anthropic"])
+        self.assertIn(f"pid {pid}:", second.responses["anthropic"])
+
+    def test_close_stops_worker(self):
+        """Test closing the client terminates the worker."""
+        with self.client:
+            self.client.query("prompt", use_cache=False)
+            worker = self.client._worker
+
+        self.assertIsNotNone(worker.poll())
+        self.assertIsNone(self.client._worker)
+
+
+FAKE_CLI = """#!{python}
+import sys, time
+
+prompt = sys.argv[-1]
+if prompt == "--prompt-stdin":
+    prompt = sys.stdin.read()
+if prompt == "--server":
+    sys.exit(1)
+if prompt == "slow":
+    time.sleep(5)
+if prompt == "stream":
+    print("╔═══ ANTHROPIC ═══╗")
+    print("First")
+    print("╔═══ DEEPSEEK ═══╗", flush=True)
+    time.sleep(30)
+print("╔═══ ANTHROPIC ═══╗")
+print("Answer to " + prompt)
+print("Tokens: 50 tokens", file=sys.stderr)
+"""
+
+
+class TestMultiAgentCoderAsync(unittest.IsolatedAsyncioTestCase):
+    """Test cases for running queries against a real CLI process."""
+
+    def setUp(self):
+        """Set up a fake multi_agent_coder CLI."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.executable_path = os.path.join(self.tmpdir.name, "multi_agent_coder")
+        with open(self.executable_path, "w") as f:
+            f.write(FAKE_CLI.format(python=sys.executable))
+        os.chmod(self.executable_path, 0o755)
+
+        self.client = MultiAgentCoderClient(
+            multi_agent_coder_path=self.executable_path,
+            logger=Mock(spec=AuditLogger),
+            max_concurrency=2,
+        )
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_query_streams_output(self):
+        """Test a synchronous query parses the streamed output."""
+        response = self.client.query("one", use_cache=False)
+
+        self.assertTrue(response.success)
+        self.assertEqual(response.responses["anthropic"], "Answer to one")
+        self.assertEqual(response.total_tokens, 50)
+
+    def test_query_prompt_stdin(self):
+        """Test prompts are piped to stdin when prompt_stdin is set."""
+        self.client.prompt_stdin = True
+        prompt = "large " * 10000
+
+        response = self.client.query(prompt, use_cache=False)
+
+        self.assertEqual(response.responses["anthropic"], "Answer to " + prompt.strip())
+
+    def test_query_timeout(self):
+        """Test a synchronous query exceeding its timeout is killed."""
+        response = self.client.query("slow", timeout=1, use_cache=False)
+
+        self.assertFalse(response.success)
+        self.assertIn("timed out", response.error)
+
+    def test_stream_query_stop_after_kills_cli(self):
+        """Test stopping a stream early terminates the still-running CLI."""
+        processes = []
+        popen = subprocess.Popen
+
+        def spawn(*args, **kwargs):
+            processes.append(popen(*args, **kwargs))
+            return processes[-1]
+
+        with patch("subprocess.Popen", side_effect=spawn):
+            sections = list(
+                self.client.stream_query("stream", timeout=60, stop_after=1)
+            )
+
+        self.assertEqual(sections, [("anthropic", "First")])
+        # Killed rather than left to finish its 30 second sleep
+        self.assertEqual(processes[0].wait(timeout=5), -signal.SIGKILL)
+
+    def test_query_falls_back_without_worker_support(self):
+        """Test a CLI without --server falls back to one process per query."""
+        self.client.persistent_worker = True
+
+        response = self.client.query("one", use_cache=False)
+
+        self.assertTrue(response.success)
+        self.assertEqual(response.responses["anthropic"], "Answer to one")
+        self.assertFalse(self.client.persistent_worker)
+
+    async def test_aquery_prompt_stdin(self):
+        """Test async queries pipe prompts to stdin when prompt_stdin is set."""
+        self.client.prompt_stdin = True
+
+        response = await self.client.aquery("piped", use_cache=False)
+
+        self.assertEqual(response.responses["anthropic"], "Answer to piped")
+
+    async def test_aquery(self):
+        """Test a single async query is parsed and counted."""
+        response = await self.client.aquery("one", use_cache=False)
+
+        self.assertTrue(response.success)
+        self.assertEqual(response.responses["anthropic"], "Answer to one")
+        self.assertEqual(response.total_tokens, 50)
+        self.assertEqual(self.client.total_calls, 1)
+
+    async def test_aquery_many_preserves_order(self):
+        """Test concurrent queries return responses in prompt order."""
+        prompts = ["a", "b", "c", "d"]
+
+        responses = await self.client.aquery_many(prompts, use_cache=False)
+
+        self.assertEqual(
+            [r.responses["anthropic"] for r in responses],
+            [f"Answer to {p}" for p in prompts],
+        )
+        self.assertEqual(self.client.total_calls, 4)
+
+    async def test_aanalyze_issues(self):
+        """Test issues are analyzed concurrently and returned in order."""
+        responses = await self.client.aanalyze_issues(
+            [("First bug", "body", ["bug"]), ("Second bug", "body", [])]
+        )
+
+        self.assertEqual(len(responses), 2)
+        self.assertIn("First bug", responses[0].responses["anthropic"])
+        self.assertIn("Second bug", responses[1].responses["anthropic"])
+
+    async def test_aquery_timeout(self):
+        """Test a query exceeding its timeout returns an error response."""
+        response = await self.client.aquery("slow", timeout=1, use_cache=False)
+
+        self.assertFalse(response.success)
+        self.assertIn("timed out", response.error)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,7 @@
 """Unit tests for notification system."""
 
+import json
+import threading
 import unittest
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, Mock, call, patch
@@ -68,6 +70,47 @@ class TestRateLimiter(unittest.TestCase):
         # event_b should still be allowed
         self.assertTrue(limiter.is_allowed("event_b"))
 
+    @patch("src.integrations.notifications.time.monotonic")
+    def test_tokens_refill_over_time(self, mock_monotonic):
+        """Test an event type regains sends at its hourly rate."""
+        mock_monotonic.return_value = 1000.0
+        limiter = RateLimiter(max_per_hour=10, max_per_event_per_hour=2)
+        limiter.record("event_a")
+        limiter.record("event_a")
+        self.assertFalse(limiter.is_allowed("event_a"))
+
+        # Half an hour refills half of the 2-per-hour bucket
+        mock_monotonic.return_value = 1000.0 + 1800
+        self.assertTrue(limiter.is_allowed("event_a"))
+        limiter.record("event_a")
+        self.assertFalse(limiter.is_allowed("event_a"))
+
+    @patch("src.integrations.notifications.time.monotonic")
+    def test_full_buckets_are_swept(self, mock_monotonic):
+        """Test event types idle long enough to refill are forgotten."""
+        mock_monotonic.return_value = 1000.0
+        limiter = RateLimiter(max_per_hour=10, max_per_event_per_hour=2)
+        limiter.record("event_a")
+        mock_monotonic.return_value = 1000.0 + 3000
+        limiter.record("event_b")
+
+        mock_monotonic.return_value = 1000.0 + 3600
+        self.assertTrue(limiter.is_allowed("event_c"))
+
+        self.assertEqual(list(limiter.event_buckets), ["event_b"])
+
+    def test_event_buckets_are_capped(self):
+        """Test the least recently recorded event type is evicted at the cap."""
+        limiter = RateLimiter(max_per_hour=100, max_per_event_per_hour=3)
+        limiter.MAX_EVENT_BUCKETS = 2
+
+        limiter.record("event_a")
+        limiter.record("event_b")
+        limiter.record("event_a")
+        limiter.record("event_c")
+
+        self.assertEqual(list(limiter.event_buckets), ["event_a", "event_c"])
+
 
 class TestSlackNotifier(unittest.TestCase):
     """Test cases for SlackNotifier."""
@@ -80,7 +123,7 @@ class TestSlackNotifier(unittest.TestCase):
             logger=self.logger,
         )
 
-    @patch("src.integrations.notifications.requests.post")
+    @patch("requests.Session.post")
     def test_send_success(self, mock_post):
         """Test successful Slack notification."""
         mock_response = Mock()
@@ -100,7 +143,7 @@ class TestSlackNotifier(unittest.TestCase):
         self.assertEqual(result.channel, "slack")
         mock_post.assert_called_once()
 
-    @patch("src.integrations.notifications.requests.post")
+    @patch("requests.Session.post")
     def test_send_with_metadata_and_link(self, mock_post):
         """Test Slack notification with metadata and link."""
         mock_response = Mock()
@@ -122,14 +165,14 @@ class TestSlackNotifier(unittest.TestCase):
 
         # Verify blocks were built
         call_args = mock_post.call_args
-        payload = call_args[1]["json"]
+        payload = json.loads(call_args[1]["data"])
         self.assertIn("blocks", payload)
         blocks = payload["blocks"]
 
         # Should have header, content, metadata, button, footer
         self.assertGreater(len(blocks), 3)
 
-    @patch("src.integrations.notifications.requests.post")
+    @patch("requests.Session.post")
     def test_send_failure(self, mock_post):
         """Test Slack notification failure."""
         mock_response = Mock()
@@ -148,7 +191,7 @@ class TestSlackNotifier(unittest.TestCase):
         self.assertFalse(result.success)
         self.assertIn("400", result.error)
 
-    @patch("src.integrations.notifications.requests.post")
+    @patch("requests.Session.post")
     def test_send_exception(self, mock_post):
         """Test Slack notification exception handling."""
         mock_post.side_effect = Exception("Network error")
@@ -164,6 +207,31 @@ class TestSlackNotifier(unittest.TestCase):
         self.assertFalse(result.success)
         self.assertIn("Network error", result.error)
 
+    def test_session_retries_rate_limited_posts(self):
+        """Test the Slack session retries 429/5xx responses to POSTs."""
+        adapter = self.notifier.session.get_adapter("https://hooks.slack.com/test")
+        retries = adapter.max_retries
+
+        self.assertEqual(retries.total, 2)
+        self.assertIn(429, retries.status_forcelist)
+        self.assertIn("POST", retries.allowed_methods)
+
+    def test_build_blocks_caps_metadata_fields(self):
+        """Test only the first 10 metadata entries become Slack fields."""
+        event = NotificationEvent(
+            event_type="test",
+            title="Test Event",
+            message="This is a test",
+            metadata={f"key_{i}": i for i in range(12)},
+            severity="critical",
+        )
+
+        blocks = self.notifier._build_blocks(event)
+
+        self.assertEqual(blocks[0]["text"]["text"], "🚨 Test Event")
+        self.assertEqual(len(blocks[2]["fields"]), 10)
+        self.assertEqual(blocks[2]["fields"][0]["text"], "*Key 0:*\n0")
+
 
 class TestEmailNotifier(unittest.TestCase):
     """Test cases for EmailNotifier."""
@@ -181,7 +249,7 @@ class TestEmailNotifier(unittest.TestCase):
             logger=self.logger,
         )
 
-    @patch("src.integrations.notifications.smtplib.SMTP")
+    @patch("smtplib.SMTP")
     def test_send_success(self, mock_smtp_class):
         """Test successful email notification."""
         mock_server = MagicMock()
@@ -202,7 +270,23 @@ class TestEmailNotifier(unittest.TestCase):
         mock_server.login.assert_called_once_with("bot", "secret")
         mock_server.send_message.assert_called_once()
 
-    @patch("src.integrations.notifications.smtplib.SMTP")
+    def test_html_content_is_escaped(self):
+        """Test event text is HTML-escaped in the email body."""
+        event = NotificationEvent(
+            event_type="error",
+            title="<script>alert(1)</script>",
+            message="a < b & c",
+            metadata={"branch": "<main>"},
+        )
+
+        html = self.notifier._build_html_content(event)
+
+        self.assertNotIn("<script>", html)
+        self.assertIn("&lt;script&gt;alert(1)&lt;/script&gt;", html)
+        self.assertIn("<p>a &lt; b &amp; c</p>", html)
+        self.assertIn("<td>&lt;main&gt;</td>", html)
+
+    @patch("smtplib.SMTP")
     def test_send_with_metadata(self, mock_smtp_class):
         """Test email with metadata."""
         mock_server = MagicMock()
@@ -221,7 +305,7 @@ class TestEmailNotifier(unittest.TestCase):
 
         self.assertTrue(result.success)
 
-    @patch("src.integrations.notifications.smtplib.SMTP")
+    @patch("smtplib.SMTP")
     def test_send_exception(self, mock_smtp_class):
         """Test email notification exception handling."""
         mock_smtp_class.side_effect = Exception("SMTP connection failed")
@@ -385,6 +469,133 @@ class TestNotificationManager(unittest.TestCase):
         self.assertTrue(results[0].success)
         mock_send.assert_called_once()
 
+    def test_notify_sends_channels_concurrently(self):
+        """Test several channels are sent to at the same time, in order."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def send(channel_name):
+            def _send(event):
+                barrier.wait()  # Only passes if both sends run at once
+                return NotificationResult(
+                    success=True, channel=channel_name, event_type=event.event_type
+                )
+
+            return _send
+
+        self.manager.channels = {
+            "slack": Mock(send=send("slack")),
+            "email": Mock(send=send("email")),
+        }
+        event = NotificationEvent(event_type="test", title="Test", message="Test")
+
+        results = self.manager.notify(event)
+        self.manager.close()
+
+        self.assertEqual([r.channel for r in results], ["slack", "email"])
+
+    def test_notify_background_delivery(self):
+        """Test queued notifications are accepted and delivered by a worker."""
+        manager = NotificationManager(
+            logger=self.logger,
+            enabled_events={"test"},
+            background_workers=1,
+        )
+        channel = Mock()
+        manager.channels = {"slack": channel}
+        event = NotificationEvent(event_type="test", title="Test", message="Test")
+
+        results = manager.notify(event)
+        manager.flush()
+        manager.close()
+
+        self.assertEqual(len(results), 1)
+        self.assertTrue(results[0].success)
+        self.assertTrue(results[0].queued)
+        channel.send.assert_called_once_with(event)
+
+    def test_notify_background_queue_full(self):
+        """Test a full delivery queue reports a failure instead of blocking."""
+        manager = NotificationManager(
+            logger=self.logger,
+            enabled_events={"test"},
+            rate_limit_per_event_per_hour=10,
+            background_workers=1,
+            queue_size=1,
+        )
+        started = threading.Event()
+        release = threading.Event()
+
+        def send(event):
+            started.set()
+            release.wait(5)
+
+        manager.channels = {"slack": Mock(send=send)}
+        event = NotificationEvent(event_type="test", title="Test", message="Test")
+
+        manager.notify(event)  # Picked up by the worker, which then blocks
+        self.assertTrue(started.wait(5))
+        manager.notify(event)  # Fills the queue
+        results = manager.notify(event)
+        release.set()
+        manager.close()
+
+        self.assertFalse(results[0].success)
+        self.assertEqual(results[0].error, "Notification queue full")
+
+    def test_notify_coalesces_bursts(self):
+        """Test a burst of queued events of one type is sent as one message."""
+        manager = NotificationManager(
+            logger=self.logger,
+            enabled_events={"test"},
+            rate_limit_per_event_per_hour=10,
+            background_workers=1,
+            coalesce_window=0.5,
+        )
+        channel = Mock()
+        manager.channels = {"slack": channel}
+
+        for i in range(3):
+            manager.notify(
+                NotificationEvent(
+                    event_type="test",
+                    title=f"Failure {i}",
+                    message="Boom",
+                    severity="error" if i == 1 else "warning",
+                )
+            )
+        manager.flush()
+        manager.close()
+
+        channel.send.assert_called_once()
+        sent = channel.send.call_args[0][0]
+        self.assertEqual(sent.title, "Failure 0 (+2 similar)")
+        self.assertEqual(sent.severity, "error")
+        self.assertEqual(sent.metadata["similar_events"], 3)
+        self.assertIn("• Failure 2: Boom", sent.message)
+
+    @patch("src.integrations.notifications.time.monotonic")
+    def test_notify_suppresses_duplicates(self, mock_monotonic):
+        """Test identical events within the dedupe window are dropped."""
+        mock_monotonic.return_value = 1000.0
+        manager = NotificationManager(
+            logger=self.logger,
+            enabled_events={"test"},
+            dedupe_window=60,
+        )
+        channel = Mock()
+        manager.channels = {"slack": channel}
+        event = NotificationEvent(event_type="test", title="Test", message="Test")
+
+        manager.notify(event)
+        self.assertEqual(manager.notify(event), [])
+        self.assertEqual(manager.notify(event), [])
+        mock_monotonic.return_value = 1000.0 + 61
+        manager.notify(event)
+
+        self.assertEqual(channel.send.call_count, 2)
+        resent = channel.send.call_args[0][0]
+        self.assertEqual(resent.metadata["suppressed_duplicates"], 2)
+
     def test_notify_rate_limited(self):
         """Test notification rate limiting."""
         manager = NotificationManager(
@@ -483,6 +694,20 @@ class TestNotificationEvent(unittest.TestCase):
         self.assertEqual(event_dict["metadata"], {"key": "value"})
         self.assertEqual(event_dict["severity"], "info")
 
+    def test_render_is_memoized(self):
+        """Test rendered payloads are built once per event."""
+        event = NotificationEvent(event_type="test", title="Test", message="Test")
+        builder = Mock(return_value="payload")
+
+        self.assertEqual(event.render("key", builder), "payload")
+        self.assertEqual(event.render("key", builder), "payload")
+
+        builder.assert_called_once_with(event)
+        self.assertEqual(
+            event.formatted_timestamp,
+            event.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC"),
+        )
+
 
 class TestNotificationResult(unittest.TestCase):
     """Test cases for NotificationResult."""
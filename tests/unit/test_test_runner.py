@@ -193,6 +193,35 @@ tests/test_foo.py:10: AssertionError
         self.assertIn("test_two", failure.test_name)
         self.assertIn("AssertionError", failure.error_message)
 
+    def test_parse_pytest_output_matches_each_trace(self):
+        """Test each failed test gets the traceback under its own heading."""
+        output = """
+tests/test_foo.py::test_one FAILED                                       [ 50%]
+tests/test_foo.py::test_two FAILED                                       [100%]
+
+=================================== FAILURES ===================================
+_________________________________ test_one _____________________________________
+
+>       assert 1 == 2
+E       AssertionError: one
+
+tests/test_foo.py:5: AssertionError
+_________________________________ test_two _____________________________________
+
+>       raise ValueError("two")
+E       ValueError: two
+
+tests/test_foo.py:9: ValueError
+============================== 2 failed in 0.10s ===============================
+"""
+        result = self.runner._parse_pytest_output(output, 1)
+
+        messages = {f.test_name: f.error_message for f in result.failures}
+        self.assertEqual(
+            messages, {"test_one": "AssertionError: one", "test_two": "ValueError: two"}
+        )
+        self.assertNotIn("ValueError", result.failures[0].stack_trace)
+
     def test_parse_unittest_output(self):
         """Test parsing unittest output."""
         output = """